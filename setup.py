@@ -45,7 +45,7 @@ setup(
         "panel>=0.13.0", # this includes param and bokeh
         "ipywidgets_bokeh", # starting from panel v0.13.0, it is not part of panel anymore
         "k3d>=2.9.7",
-        "vtk",  # needed for streamlines in k3d
+        "vtk",  # needed for random seeds of 3D streamlines
         "adaptive>=0.13.1",
         # mayavi-related
         "mayavi>=4.8.0",
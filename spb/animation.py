@@ -0,0 +1,250 @@
+"""Parameter sweeps of interactive data series.
+
+A sweep evaluates the interactive series of a plot over a sequence of values
+of one parameter. The frames can be evaluated concurrently: each worker
+receives a copy of a data series and a contiguous chunk of frames, so that
+the sub-expressions not depending on the swept parameter are evaluated only
+once per chunk. The results are stored into arrays with a leading frame
+dimension, which can then be streamed to the animation facilities of the
+backends (look at ``Sweep.animate``).
+
+Examples
+========
+
+>>> from sympy import symbols, cos
+>>> from spb.interactive import create_series
+>>> from spb import MB
+>>> u, x = symbols("u, x")
+>>> s = create_series((cos(u * x), (x, -5, 5)), params={u: 1}, n1=10)
+>>> p = MB(*s, show=False)
+>>> sweep = p.sweep(u, [1, 2, 3], executor="serial")
+>>> len(sweep), sweep.data[0][1].shape
+(3, (3, 10))
+"""
+
+from concurrent.futures import (
+    Executor, ThreadPoolExecutor, ProcessPoolExecutor
+)
+import copy
+import os
+import pickle
+from spb.defaults import cfg
+from sympy.external import import_module
+
+
+def _evaluate_frames(s, params):
+    """Evaluate a copy of a data series for each dictionary of parameters.
+    Used by the serial and thread executors.
+    """
+    data = []
+    for p in params:
+        s.params = p
+        data.append(s.get_data())
+    return data
+
+
+def _evaluate_frames_from_pickle(payload, params):
+    """Unpickle a data series and evaluate it for each dictionary of
+    parameters. Used by the process executor.
+    """
+    return _evaluate_frames(pickle.loads(payload), params)
+
+
+def _compact(frames):
+    """Stack the data of the frames into arrays whose first dimension is
+    the frame index. Arrays that are the same over all frames (for example,
+    the discretized ranges) are stored only once, and broadcast to the
+    stacked shape.
+
+    Return a tuple of arrays. If the frames don't share the same structure
+    (for example, the number of points of adaptive algorithms might change),
+    the list of frames is returned unmodified.
+    """
+    np = import_module('numpy')
+
+    frames = list(frames)
+    first = frames[0]
+    if not isinstance(first, (list, tuple)):
+        return frames
+    n = len(frames)
+    store = []
+    for i, a in enumerate(first):
+        arrays = [f[i] for f in frames]
+        if not all(isinstance(t, np.ndarray) and (t.shape == a.shape)
+            for t in arrays):
+            return frames
+        try:
+            constant = all(np.array_equal(a, t, equal_nan=True)
+                for t in arrays[1:])
+        except TypeError:
+            constant = False
+        store.append(np.broadcast_to(a, (n, *a.shape)) if constant
+            else np.stack(arrays))
+    return tuple(store)
+
+
+class Sweep:
+    """Numerical data of the interactive series of a plot, evaluated over a
+    sequence of values of a parameter. Instances of this class are created
+    by ``Plot.sweep`` or ``InteractivePlot.sweep``.
+
+    Attributes
+    ==========
+
+    plot : Plot
+        The plot containing the data series.
+
+    param : Symbol
+        The swept parameter.
+
+    values : np.ndarray
+        The values of the swept parameter.
+
+    params : list
+        The dictionaries of parameters associated to each frame.
+
+    data : dict
+        Maps the index of an interactive series (in ``plot.series``) to its
+        numerical data. If all frames share the same structure, the data is
+        a tuple of arrays whose first dimension is the frame index, otherwise
+        it is a list containing the data of each frame.
+    """
+
+    def __init__(self, plot, param, values, params, data):
+        self.plot = plot
+        self.param = param
+        self.values = values
+        self.params = params
+        self.data = data
+
+    def __len__(self):
+        return len(self.params)
+
+    def frame(self, k):
+        """Return a dictionary mapping the index of each interactive series
+        to its numerical data at the k-th frame.
+        """
+        return {i: tuple(t[k] for t in d) if isinstance(d, tuple) else d[k]
+            for i, d in self.data.items()}
+
+    def _apply(self, k):
+        """Set the numerical data of the k-th frame to the interactive
+        series, so that the backend doesn't need to evaluate them. Return
+        the parameters associated to the frame.
+        """
+        params = self.params[k]
+        for i, data in self.frame(k).items():
+            s = self.plot.series[i]
+            s._set_preview(1)
+            s.params = params
+            s._set_cached_data(data)
+        return params
+
+    def animate(self, **kwargs):
+        """Create an animation with the backend of the plot:
+
+        * ``MatplotlibBackend``: return a
+          ``matplotlib.animation.FuncAnimation``, which can be saved to a
+          video file with ``anim.save("file.mp4", writer="ffmpeg")``.
+        * ``PlotlyBackend``: return the figure, containing one frame for
+          each parameter value, a play button and a slider.
+        * ``K3DBackend``: return the figure, whose objects use time series
+          attributes.
+
+        The keyword arguments are passed to the backend: look at the
+        ``_animate`` method of each backend for the available options.
+        """
+        return self.plot._animate(self, **kwargs)
+
+
+def sweep(plot, param, values, params=None, executor=None, max_workers=None):
+    """Evaluate the interactive series of ``plot`` over a sequence of values
+    of a parameter. Look at ``Plot.sweep`` for the meaning of the arguments.
+    """
+    np = import_module('numpy')
+
+    indices = [i for i, s in enumerate(plot.series) if s.is_interactive]
+    if len(indices) == 0:
+        raise ValueError("The plot doesn't contain interactive series.")
+    series = [plot.series[i] for i in indices]
+    if params is None:
+        params = series[0].params
+    if param not in params.keys():
+        raise ValueError(
+            "`%s` is not a parameter of the interactive series. " % param +
+            "Available parameters: %s" % list(params.keys()))
+    values = np.asarray(values)
+    frames = []
+    for v in values:
+        p = dict(params)
+        p[param] = v.item() if hasattr(v, "item") else v
+        frames.append(p)
+    if len(frames) == 0:
+        raise ValueError("At least one value of the parameter is required.")
+
+    if executor is None:
+        executor = cfg["evaluation"]["executor"]
+    if max_workers is None:
+        max_workers = cfg["evaluation"]["max_workers"]
+    if not (isinstance(executor, Executor) or
+        (executor in ["serial", "thread", "process"])):
+        raise ValueError(
+            "`executor` must be an instance of concurrent.futures.Executor, "
+            "or one of the following values: 'serial', 'thread', "
+            "'process'.\nReceived: '%s'" % executor)
+
+    for s in series:
+        s._set_preview(1)
+
+    if executor == "serial":
+        results = [_evaluate_frames(copy.deepcopy(s), frames) for s in series]
+        return Sweep(plot, param, values, frames,
+            {i: _compact(r) for i, r in zip(indices, results)})
+
+    # NOTE: each job evaluates a contiguous chunk of frames with its own
+    # copy of a data series.
+    nchunks = max_workers or getattr(executor, "_max_workers", None) or (
+        os.cpu_count() or 1)
+    nchunks = max(1, min(int(nchunks), len(frames)))
+    bounds = np.linspace(0, len(frames), nchunks + 1).astype(int)
+    chunks = [frames[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    own_pool = not isinstance(executor, Executor)
+    pool = executor
+    if own_pool:
+        pool = (ThreadPoolExecutor(max_workers) if executor == "thread"
+            else ProcessPoolExecutor(max_workers))
+    use_processes = isinstance(pool, ProcessPoolExecutor)
+    threads = None
+
+    try:
+        jobs = []
+        for s in series:
+            payload = None
+            if use_processes:
+                try:
+                    payload = pickle.dumps(s)
+                except Exception:
+                    # for example, user-provided lambda functions: these
+                    # series are evaluated by threads of the current process
+                    pass
+            if payload is not None:
+                jobs.append([pool.submit(_evaluate_frames_from_pickle,
+                    payload, c) for c in chunks])
+                continue
+            target = pool
+            if use_processes:
+                if threads is None:
+                    threads = ThreadPoolExecutor(max_workers)
+                target = threads
+            jobs.append([target.submit(_evaluate_frames, copy.deepcopy(s), c)
+                for c in chunks])
+        results = [[d for f in job for d in f.result()] for job in jobs]
+    finally:
+        if own_pool:
+            pool.shutdown()
+        if threads is not None:
+            threads.shutdown()
+
+    return Sweep(plot, param, values, frames,
+        {i: _compact(r) for i, r in zip(indices, results)})
@@ -1,10 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from itertools import cycle
+import pickle
+from spb.defaults import cfg
 from spb.series import BaseSeries
+from spb.animation import sweep as _sweep
 from spb.backends.utils import convert_colormap
 from sympy.utilities.iterables import is_sequence
 from sympy.external import import_module
 
 
+def _get_data(s):
+    """Evaluate a data series. Used by the thread executor."""
+    return s.get_data()
+
+
+def _get_data_from_pickle(payload):
+    """Unpickle a data series and evaluate it. Used by the process executor:
+    the lambdified functions are recreated on the worker side.
+    """
+    return pickle.loads(payload).get_data()
+
+
 class Plot:
     """Base class for all backends. A backend represents the plotting library,
     which implements the necessary functionalities in order to use SymPy
@@ -49,7 +65,9 @@ class Plot:
       backend-specific commands.
     * ``_update_interactive(self, params)``: this method receives a dictionary
       mapping parameters to their values from the ``iplot`` function, which
-      are going to be used to update the objects of the figure.
+      are going to be used to update the objects of the figure. Note that
+      the number of points of the interactive series might change between
+      two updates (look at ``_update_interactive_preview``).
 
     Parameters
     ==========
@@ -237,6 +255,9 @@ class Plot:
         # For regular plots, plt.figure can be used. For interactive-parametric
         # plots matplotlib.figure.Figure must be used.
         self.is_iplot = kwargs.get("is_iplot", False)
+        # Decimation applied to the interactive series while rendering a
+        # preview (look at _update_interactive_preview).
+        self._preview_step = 1
 
         # Contains the data objects to be plotted. The backend should be smart
         # enough to iterate over this list.
@@ -339,6 +360,70 @@ class Plot:
         ]
         self._cyccm = cycle(cyclic_colormaps)
 
+    def _evaluate_series(self, series):
+        """Generate the numerical data of the given data series before the
+        backend-specific rendering loop, so that each ``get_data()`` call
+        inside the loop retrieves the stored data.
+
+        The evaluation strategy is set by ``cfg["evaluation"]["executor"]``:
+
+        * ``"serial"``: do nothing, the series are going to be evaluated
+          one after the other by the rendering loop.
+        * ``"thread"``: evaluate the series concurrently with a thread pool.
+          This is effective when most of the time is spent inside Numpy.
+        * ``"process"``: evaluate the series with a process pool. Series
+          that can't be pickled (for example, the ones using user-provided
+          lambda functions) are evaluated by the current process.
+
+        The number of workers is set by ``cfg["evaluation"]["max_workers"]``.
+        """
+        executor = cfg["evaluation"]["executor"]
+        max_workers = cfg["evaluation"]["max_workers"]
+        if executor not in ["serial", "thread", "process"]:
+            raise ValueError(
+                "`cfg['evaluation']['executor']` must be one of the "
+                "following values: 'serial', 'thread', 'process'.\n"
+                "Received: '%s'" % executor)
+
+        series = [s for s in series if s._get_cached_data() is None]
+        if (executor == "serial") or (len(series) < 2):
+            return
+
+        if executor == "thread":
+            with ThreadPoolExecutor(max_workers) as pool:
+                # NOTE: each series stores its own data
+                list(pool.map(_get_data, series))
+            return
+
+        payloads, local = [], []
+        for s in series:
+            try:
+                payloads.append((s, pickle.dumps(s)))
+            except Exception:
+                local.append(s)
+        if len(payloads) == 0:
+            return
+        with ProcessPoolExecutor(max_workers) as pool:
+            results = pool.map(_get_data_from_pickle, [p for _, p in payloads])
+            for s in local:
+                s.get_data()
+            for (s, _), data in zip(payloads, results):
+                s._set_cached_data(data)
+
+    def _update_series_params(self, params):
+        """Set the new parameters to the interactive data series and
+        generate their numerical data.
+        """
+        interactive_series = [s for s in self.series if s.is_interactive]
+        for s in interactive_series:
+            s._set_preview(self._preview_step)
+            # NOTE: the numerical data might have already been generated with
+            # these parameters, for example by the background thread of an
+            # asynchronous interactive plot.
+            if (s._get_cached_data() is None) or (s.params != params):
+                s.params = params
+        self._evaluate_series(interactive_series)
+
     def _get_mode(self):
         """Verify which environment is used to run the code.
 
@@ -399,6 +484,81 @@ class Plot:
         """
         raise NotImplementedError
 
+    def _update_interactive_preview(self, params, step=4):
+        """Update the figure with the interactive series evaluated over
+        decimated domains, keeping one point every ``step`` along each
+        direction. This is a low-cost alternative to ``_update_interactive``,
+        used by ``iplot`` to show a preview while the parameters are
+        changing. The next call to ``_update_interactive`` restores the full
+        resolution.
+        """
+        self._preview_step = step
+        try:
+            self._update_interactive(params)
+        finally:
+            self._preview_step = 1
+
+    def sweep(self, param, values, params=None, executor=None,
+        max_workers=None):
+        """Evaluate the interactive series of the plot over a sequence of
+        values of a parameter, for example to create an animation.
+
+        Parameters
+        ==========
+
+        param : Symbol
+            The parameter to be swept.
+
+        values : iterable
+            The values of the parameter, one for each frame.
+
+        params : dict, optional
+            The values of all the parameters. The value of ``param`` is
+            replaced by the items of ``values``. Default to the current
+            parameters of the interactive series.
+
+        executor : str or concurrent.futures.Executor, optional
+            How to evaluate the frames: ``"serial"``, ``"thread"``,
+            ``"process"`` or an instance of an executor. Each worker
+            evaluates a contiguous chunk of frames. Default to
+            ``cfg["evaluation"]["executor"]``.
+
+        max_workers : int, optional
+            Number of workers of the thread and process executors. Default
+            to ``cfg["evaluation"]["max_workers"]``.
+
+        Returns
+        =======
+
+        sweep : spb.animation.Sweep
+            Stores the numerical data of each frame. Use its ``animate``
+            method to create an animation.
+
+        Examples
+        ========
+
+        .. code-block:: python
+
+            import numpy as np
+            from sympy import symbols, cos
+            from spb import MB
+            from spb.interactive import iplot
+            u, x = symbols("u, x")
+            p = iplot((cos(u * x), (x, -5, 5)), params={u: (1, 0, 5)},
+                backend=MB, show=False)
+            anim = p.sweep(u, np.linspace(0, 5, 300), executor="process").animate()
+            anim.save("animation.mp4", writer="ffmpeg")
+
+        """
+        return _sweep(self, param, values, params=params, executor=executor,
+            max_workers=max_workers)
+
+    def _animate(self, sweep, **kwargs):
+        """Implement the logic to create an animation from the frames of
+        a ``Sweep``.
+        """
+        raise NotImplementedError
+
     def show(self):
         """Implement the functionalities to display the plot."""
         raise NotImplementedError
@@ -1,180 +1,10 @@
 import os
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
+from spb.backends.utils import pack_rgba, compute_streamlines
 from sympy.external import import_module
 
 
-def compute_streamlines(x, y, u, v, density=1.0):
-    """Return streamlines of a vector flow.
-
-    * x and y are 1d arrays defining an *evenly spaced* grid.
-    * u and v are 2d arrays (shape [y,x]) giving velocities.
-    * density controls the closeness of the streamlines.
-
-    Credit: https://docs.bokeh.org/en/latest/docs/gallery/quiver.html
-    """
-    np = import_module('numpy')
-
-    ## Set up some constants - size of the grid used.
-    NGX = len(x)
-    NGY = len(y)
-
-    ## Constants used to convert between grid index coords and user coords.
-    DX = x[1] - x[0]
-    DY = y[1] - y[0]
-    XOFF = x[0]
-    YOFF = y[0]
-
-    ## Now rescale velocity onto axes-coordinates
-    u = u / (x[-1] - x[0])
-    v = v / (y[-1] - y[0])
-    speed = np.sqrt(u * u + v * v)
-    ## s (path length) will now be in axes-coordinates, but we must
-    ## rescale u for integrations.
-    u *= NGX
-    v *= NGY
-    ## Now u and v in grid-coordinates.
-
-    NBX = int(30 * density)
-    NBY = int(30 * density)
-
-    blank = np.zeros((NBY, NBX))
-
-    bx_spacing = NGX / float(NBX - 1)
-    by_spacing = NGY / float(NBY - 1)
-
-    def blank_pos(xi, yi):
-        return int((xi / bx_spacing) + 0.5), int((yi / by_spacing) + 0.5)
-
-    def value_at(a, xi, yi):
-        if type(xi) == np.ndarray:
-            x = xi.astype(int)
-            y = yi.astype(int)
-        else:
-            x = int(xi)
-            y = int(yi)
-        a00 = a[y, x]
-        a01 = a[y, x + 1]
-        a10 = a[y + 1, x]
-        a11 = a[y + 1, x + 1]
-        xt = xi - x
-        yt = yi - y
-        a0 = a00 * (1 - xt) + a01 * xt
-        a1 = a10 * (1 - xt) + a11 * xt
-        return a0 * (1 - yt) + a1 * yt
-
-    def rk4_integrate(x0, y0):
-        ## This function does RK4 forward and back trajectories from
-        ## the initial conditions, with the odd 'blank array'
-        ## termination conditions. TODO tidy the integration loops.
-
-        def f(xi, yi):
-            dt_ds = 1.0 / value_at(speed, xi, yi)
-            ui = value_at(u, xi, yi)
-            vi = value_at(v, xi, yi)
-            return ui * dt_ds, vi * dt_ds
-
-        def g(xi, yi):
-            dt_ds = 1.0 / value_at(speed, xi, yi)
-            ui = value_at(u, xi, yi)
-            vi = value_at(v, xi, yi)
-            return -ui * dt_ds, -vi * dt_ds
-
-        check = lambda xi, yi: xi >= 0 and xi < NGX - 1 and yi >= 0 and yi < NGY - 1
-
-        bx_changes = []
-        by_changes = []
-
-        ## Integrator function
-        def rk4(x0, y0, f):
-            ds = 0.01  # min(1./NGX, 1./NGY, 0.01)
-            stotal = 0
-            xi = x0
-            yi = y0
-            xb, yb = blank_pos(xi, yi)
-            xf_traj = []
-            yf_traj = []
-            while check(xi, yi):
-                # Time step. First save the point.
-                xf_traj.append(xi)
-                yf_traj.append(yi)
-                # Next, advance one using RK4
-                try:
-                    k1x, k1y = f(xi, yi)
-                    k2x, k2y = f(xi + 0.5 * ds * k1x, yi + 0.5 * ds * k1y)
-                    k3x, k3y = f(xi + 0.5 * ds * k2x, yi + 0.5 * ds * k2y)
-                    k4x, k4y = f(xi + ds * k3x, yi + ds * k3y)
-                except IndexError:
-                    # Out of the domain on one of the intermediate steps
-                    break
-                xi += ds * (k1x + 2 * k2x + 2 * k3x + k4x) / 6.0
-                yi += ds * (k1y + 2 * k2y + 2 * k3y + k4y) / 6.0
-                # Final position might be out of the domain
-                if not check(xi, yi):
-                    break
-                stotal += ds
-                # Next, if s gets to thres, check blank.
-                new_xb, new_yb = blank_pos(xi, yi)
-                if new_xb != xb or new_yb != yb:
-                    # New square, so check and colour. Quit if required.
-                    if blank[new_yb, new_xb] == 0:
-                        blank[new_yb, new_xb] = 1
-                        bx_changes.append(new_xb)
-                        by_changes.append(new_yb)
-                        xb = new_xb
-                        yb = new_yb
-                    else:
-                        break
-                if stotal > 2:
-                    break
-            return stotal, xf_traj, yf_traj
-
-        integrator = rk4
-
-        sf, xf_traj, yf_traj = integrator(x0, y0, f)
-        sb, xb_traj, yb_traj = integrator(x0, y0, g)
-        stotal = sf + sb
-        x_traj = xb_traj[::-1] + xf_traj[1:]
-        y_traj = yb_traj[::-1] + yf_traj[1:]
-
-        ## Tests to check length of traj. Remember, s in units of axes.
-        if len(x_traj) < 1:
-            return None
-        if stotal > 0.2:
-            initxb, inityb = blank_pos(x0, y0)
-            blank[inityb, initxb] = 1
-            return x_traj, y_traj
-        else:
-            for xb, yb in zip(bx_changes, by_changes):
-                blank[yb, xb] = 0
-            return None
-
-    ## A quick function for integrating trajectories if blank==0.
-    trajectories = []
-
-    def traj(xb, yb):
-        if xb < 0 or xb >= NBX or yb < 0 or yb >= NBY:
-            return
-        if blank[yb, xb] == 0:
-            t = rk4_integrate(xb * bx_spacing, yb * by_spacing)
-            if t is not None:
-                trajectories.append(t)
-
-    ## Now we build up the trajectory set. I've found it best to look
-    ## for blank==0 along the edges first, and work inwards.
-    for indent in range((max(NBX, NBY)) // 2):
-        for xi in range(max(NBX, NBY) - 2 * indent):
-            traj(xi + indent, indent)
-            traj(xi + indent, NBY - 1 - indent)
-            traj(indent, xi + indent)
-            traj(NBX - 1 - indent, xi + indent)
-
-    xs = [np.array(t[0]) * DX + XOFF for t in trajectories]
-    ys = [np.array(t[1]) * DY + YOFF for t in trajectories]
-
-    return xs, ys
-
-
 class BokehBackend(Plot):
     """
     A backend for plotting SymPy's symbolic expressions using Bokeh.
@@ -360,6 +190,7 @@ class BokehBackend(Plot):
         # colorbars which are added to the right side.
         self._fig.renderers = []
         self._fig.right = []
+        self._evaluate_series(series)
 
         for i, s in enumerate(series):
             kw = None
@@ -441,7 +272,7 @@ class BokehBackend(Plot):
                     kw = merge({}, sqk, stream_kw)
                     xs, ys = compute_streamlines(
                         x[0, :], y[:, 0], u, v, density=density)
-                    self._fig.multi_line(xs, ys, **kw)
+                    self._fig.multi_line([xs], [ys], **kw)
                 else:
                     x, y, u, v = s.get_data()
                     data, quiver_kw = self._get_quivers_data(x, y, u, v,
@@ -536,39 +367,43 @@ class BokehBackend(Plot):
                 s.start = complex(self._fig.x_range.start)
                 s.end = complex(self._fig.x_range.end)
                 x, y, param = s.get_data()
-                xs, ys, us = self._get_segments(x, y, param)
-                rend[i].data_source.data.update({"xs": xs, "ys": ys, "us": us})
-                if i in self._handles.keys():
-                    cb = self._handles[i]
-                    cb.color_mapper.update(low=min(us), high=max(us))
+                self._update_gradient_line(i, x, y, param)
 
     def _get_img(self, img):
-        np = import_module('numpy')
-        new_img = np.zeros(img.shape[:2], dtype=np.uint32)
-        pixel = new_img.view(dtype=np.uint8).reshape((*img.shape[:2], 4))
-        for i in range(img.shape[1]):
-            for j in range(img.shape[0]):
-                pixel[j, i] = [*img[j, i], 255]
-        return new_img
+        return pack_rgba(img)
 
     def _get_segments(self, x, y, u):
-        # MultiLine works with line segments, not with line points! :|
-        xs = [x[i - 1 : i + 1] for i in range(1, len(x))]
-        ys = [y[i - 1 : i + 1] for i in range(1, len(y))]
+        """Compute the columns of a ``Segment`` glyph, whose segments
+        connect consecutive points of a line. The columns are strided views
+        of the provided arrays, hence each column is serialized as a single
+        binary buffer.
+        """
+        np = import_module('numpy')
+        x, y, u = [np.asarray(t, dtype=float) for t in [x, y, u]]
         # let n be the number of points. Then, the number of segments
         # will be (n - 1). Therefore, we remove one parameter. If n is
         # sufficiently high, there shouldn't be any noticeable problem in
         # the visualization.
-        us = u[:-1]
-        return xs, ys, us
+        return dict(x0=x[:-1], y0=y[:-1], x1=x[1:], y1=y[1:], us=u[:-1])
+
+    def _update_gradient_line(self, i, x, y, u):
+        """Update the data source (and the colorbar) of a gradient line."""
+        np = import_module('numpy')
+        data = self._get_segments(x, y, u)
+        self.fig.renderers[i].data_source.data.update(data)
+        if i in self._handles.keys():
+            cb = self._handles[i]
+            cb.color_mapper.update(
+                low=np.nanmin(data["us"]), high=np.nanmax(data["us"]))
 
     def _create_gradient_line(self, x, y, u, colormap, name, line_kw):
+        np = import_module('numpy')
         merge = self.merge
-        xs, ys, us = self._get_segments(x, y, u)
+        data = self._get_segments(x, y, u)
         color_mapper = self.bokeh.models.LinearColorMapper(
-            palette=colormap, low=min(us), high=max(us))
-        data_source = self.bokeh.models.ColumnDataSource(
-            dict(xs=xs, ys=ys, us=us))
+            palette=colormap, low=np.nanmin(data["us"]),
+            high=np.nanmax(data["us"]))
+        data_source = self.bokeh.models.ColumnDataSource(data)
 
         lkw = dict(
             line_width=2,
@@ -576,7 +411,8 @@ class BokehBackend(Plot):
             line_color={"field": "us", "transform": color_mapper},
         )
         kw = merge({}, lkw, line_kw)
-        glyph = self.bokeh.models.MultiLine(xs="xs", ys="ys", **kw)
+        glyph = self.bokeh.models.Segment(
+            x0="x0", y0="y0", x1="x1", y1="y1", **kw)
         colorbar = self.bokeh.models.ColorBar(
             color_mapper=color_mapper, title=name, width=8)
         return data_source, glyph, colorbar, kw
@@ -588,17 +424,12 @@ class BokehBackend(Plot):
         if len(rend) != len(self.series):
             self._process_series(self.series)
 
+        self._update_series_params(params)
         for i, s in enumerate(self.series):
             if s.is_interactive:
-                self.series[i].params = params
-
                 if s.is_2Dline and s.is_parametric and s.use_cm:
                     x, y, param = self.series[i].get_data()
-                    xs, ys, us = self._get_segments(x, y, param)
-                    rend[i].data_source.data.update({"xs": xs, "ys": ys, "us": us})
-                    if i in self._handles.keys():
-                        cb = self._handles[i]
-                        cb.color_mapper.update(low=min(us), high=max(us))
+                    self._update_gradient_line(i, x, y, param)
 
                 elif s.is_2Dline:
                     if s.is_parametric:
@@ -631,7 +462,8 @@ class BokehBackend(Plot):
                         xs, ys = compute_streamlines(
                             x[0, :], y[:, 0], u, v, density=density
                         )
-                        rend[i].data_source.data.update({"xs": xs, "ys": ys})
+                        rend[i].data_source.data.update(
+                            {"xs": [xs], "ys": [ys]})
                     else:
                         quiver_kw = s.rendering_kw.copy()
                         data, quiver_kw = self._get_quivers_data(
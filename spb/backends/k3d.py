@@ -1,8 +1,7 @@
 import os
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
-from spb.backends.utils import compute_streamtubes
-from spb.series import PlaneSeries
+from spb.backends.utils import compute_streamtubes, pack_rgb
 from spb.utils import get_vertices_indices
 from sympy.external import import_module
 import warnings
@@ -206,12 +205,12 @@ class K3DBackend(Plot):
     def _process_series(self, series):
         np = import_module('numpy')
         merge = self.merge
-        Triangulation = self.matplotlib.tri.Triangulation
         self._init_cyclers()
         self._fig.auto_rendering = False
         # clear data
         for o in self._fig.objects:
             self._fig.remove_class(o)
+        self._evaluate_series(series)
 
         for ii, s in enumerate(series):
             if s.is_3Dline and s.is_point:
@@ -247,18 +246,18 @@ class K3DBackend(Plot):
                     vertices, indices = get_vertices_indices(x, y, z)
                     vertices = vertices.astype(np.float32)
                     attribute = s.eval_color_func(vertices[:, 0], vertices[:, 1], vertices[:, 2], u.flatten().astype(np.float32), v.flatten().astype(np.float32))
+                elif s.is_mesh:
+                    x, y, z, indices = s.get_data()
+                    vertices = np.vstack([x, y, z]).T.astype(np.float32)
+                    indices = indices.astype(np.uint32)
+                    attribute = s.eval_color_func(vertices[:, 0], vertices[:, 1], vertices[:, 2])
                 else:
+                    # NOTE: the data comes from a structured grid, hence its
+                    # connectivity is known (and cached): no need to
+                    # triangulate it.
                     x, y, z = s.get_data()
-                    if isinstance(s, PlaneSeries):
-                        # avoid triangulation errors when plotting vertical
-                        # planes
-                        vertices, indices = get_vertices_indices(x, y, z)
-                    else:
-                        x = x.flatten()
-                        y = y.flatten()
-                        z = z.flatten()
-                        vertices = np.vstack([x, y, z]).T.astype(np.float32)
-                        indices = Triangulation(x, y).triangles.astype(np.uint32)
+                    vertices, indices = get_vertices_indices(x, y, z)
+                    vertices = vertices.astype(np.float32)
                     attribute = s.eval_color_func(vertices[:, 0], vertices[:, 1], vertices[:, 2])
 
                 self._high_aspect_ratio(x, y, z)
@@ -361,10 +360,9 @@ class K3DBackend(Plot):
             elif s.is_complex and s.is_3Dsurface:
                 x, y, mag, arg, colors, colorscale = s.get_data()
 
-                x, y, z = [t.flatten() for t in [x, y, mag]]
-                vertices = np.vstack([x, y, z]).T.astype(np.float32)
-                indices = Triangulation(x, y).triangles.astype(np.uint32)
-                self._high_aspect_ratio(x, y, z)
+                vertices, indices = get_vertices_indices(x, y, mag)
+                vertices = vertices.astype(np.float32)
+                self._high_aspect_ratio(x, y, mag)
 
                 a = dict(
                     name=s.get_label(self._use_latex, "%s") if self._show_label else None,
@@ -375,17 +373,11 @@ class K3DBackend(Plot):
                     color_range=[-np.pi, np.pi],
                 )
                 if s.use_cm:
-                    colors = colors.reshape((-1, 3))
-                    a["colors"] = [self._rgb_to_int(c) for c in colors]
-
-                    r = []
+                    a["colors"] = pack_rgb(colors.reshape((-1, 3)))
+                    # interleave locations and colors: [l1, r1, g1, b1, ...]
                     loc = np.linspace(0, 1, colorscale.shape[0])
-                    colorscale = colorscale / 255
-                    for l, c in zip(loc, colorscale):
-                        r.append(l)
-                        r += list(c)
-
-                    a["color_map"] = r
+                    a["color_map"] = np.column_stack(
+                        [loc, colorscale / 255]).astype(np.float32).ravel()
                     a["color_range"] = [-np.pi, np.pi]
                 kw = merge({}, a, s.rendering_kw)
                 surf = self.k3d.mesh(vertices, indices, **kw)
@@ -435,12 +427,7 @@ class K3DBackend(Plot):
         """
         np = import_module('numpy')
 
-        vec_colors = np.zeros(2 * len(colors))
-        for i, c in enumerate(colors):
-            vec_colors[2 * i] = c
-            vec_colors[2 * i + 1] = c
-        vec_colors = vec_colors.astype(np.uint32)
-        return vec_colors
+        return np.repeat(np.asarray(colors, dtype=np.uint32), 2)
 
     def _high_aspect_ratio(self, x, y, z):
         """Look for high aspect ratio meshes, where (dz >> dx, dy) and
@@ -463,6 +450,30 @@ class K3DBackend(Plot):
         elif self.zlim:
             self._bounds.append([mx, Mx, my, My, self.zlim[0], self.zlim[1]])
 
+    def _update_vertices(self, obj, x, y, z, fixed_grid=False):
+        """Update the vertices of a surface. The vertices are written into
+        the float32 buffer already used by the mesh: if ``fixed_grid=True``,
+        only the z-coordinates are written.
+
+        The number of vertices of an interactive surface changes between
+        previews and full resolution updates: in this case, a new buffer
+        is created and the connectivity of the mesh is updated.
+        """
+        np = import_module('numpy')
+
+        vertices = obj.vertices
+        if len(vertices) != x.size:
+            vertices, obj.indices = get_vertices_indices(x, y, z)
+            vertices = vertices.astype(np.float32)
+        elif fixed_grid:
+            vertices[:, 2] = z.ravel()
+        else:
+            for k, t in enumerate([x, y, z]):
+                vertices[:, k] = t.ravel()
+        # NOTE: the buffer is assigned again in order to notify K3D.
+        obj.vertices = vertices
+        return vertices
+
     def _update_interactive(self, params):
         np = import_module('numpy')
 
@@ -473,11 +484,10 @@ class K3DBackend(Plot):
         if len(self.series) != n:
             self._process_series(self.series)
 
+        self._update_series_params(params)
         # self._fig.auto_rendering = False
         for i, s in enumerate(self.series):
             if s.is_interactive:
-                self.series[i].params = params
-
                 if s.is_3Dline and s.is_point:
                     x, y, z, _ = self.series[i].get_data()
                     positions = np.vstack([x, y, z]).T.astype(np.float32)
@@ -491,15 +501,16 @@ class K3DBackend(Plot):
                 elif s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit):
                     if s.is_parametric:
                         x, y, z, u, v = s.get_data()
-                        x, y, z, u, v = [t.flatten().astype(np.float32) for t in [x, y, z, u, v]]
-                        attribute = s.eval_color_func(x, y, z, u, v)
+                        vertices = self._update_vertices(
+                            self._fig.objects[i], x, y, z)
+                        u, v = [t.flatten().astype(np.float32) for t in [u, v]]
+                        attribute = s.eval_color_func(*vertices.T, u, v)
                     else:
                         x, y, z = s.get_data()
-                        x, y, z = [t.flatten().astype(np.float32) for t in [x, y, z]]
-                        attribute = s.eval_color_func(x, y, z)
+                        vertices = self._update_vertices(
+                            self._fig.objects[i], x, y, z, fixed_grid=True)
+                        attribute = s.eval_color_func(*vertices.T)
 
-                    vertices = np.vstack([x, y, z]).astype(np.float32)
-                    self._fig.objects[i].vertices = vertices.T
                     if s.use_cm:
                         self._fig.objects[i].attribute = attribute
                         self._fig.objects[i].color_range = [attribute.min(), attribute.max()]
@@ -521,16 +532,61 @@ class K3DBackend(Plot):
 
                 elif s.is_complex and s.is_3Dsurface:
                     x, y, mag, _, colors, _ = s.get_data()
-                    x, y, z = [t.flatten().astype(np.float32) for t in [x, y, mag]]
-                    vertices = np.vstack([x, y, z]).astype(np.float32)
-                    self._fig.objects[i].vertices = vertices.T
+                    self._update_vertices(self._fig.objects[i], x, y, mag,
+                        fixed_grid=True)
                     if s.use_cm:
-                        colors = colors.reshape((-1, 3))
-                        colors = [self._rgb_to_int(c) for c in colors]
-                        self._fig.objects[i].colors = colors
+                        self._fig.objects[i].colors = pack_rgb(
+                            colors.reshape((-1, 3)))
 
         # self._fig.auto_rendering = True
 
+    def _animate(self, sweep, dt=0.1):
+        """Create an animation from the frames of a ``Sweep``.
+
+        Parameters
+        ==========
+
+        sweep : spb.animation.Sweep
+
+        dt : float, optional
+            Time between frames in seconds. Default to 0.1.
+
+        Returns
+        =======
+
+        fig : k3d.plot.Plot
+            The figure, whose objects use time series attributes: use the
+            K3D-Jupyter's controls to play the animation. Attributes not
+            supporting time series (for example, the ones of vectors) are
+            set to the values of the first frame.
+        """
+        np = import_module('numpy')
+        TimeSeries = self.k3d.objects.TimeSeries
+
+        fig = self.fig
+        timeseries = {}
+        for k in range(len(sweep)):
+            self._update_interactive(sweep._apply(k))
+            for i, s in enumerate(self.series):
+                if not s.is_interactive:
+                    continue
+                obj = fig.objects[i]
+                for name, trait in obj.traits().items():
+                    if isinstance(trait, TimeSeries) and (name in [
+                        "vertices", "indices", "attribute", "color_range",
+                        "colors", "positions"]):
+                        timeseries.setdefault((i, name), {})[
+                            str(k * dt)] = np.array(getattr(obj, name))
+
+        self._update_interactive(sweep._apply(0))
+        for (i, name), values in timeseries.items():
+            v0 = values[str(0.0)]
+            if all((v.shape == v0.shape) and np.array_equal(v, v0)
+                for v in values.values()):
+                continue
+            setattr(fig.objects[i], name, values)
+        return fig
+
     def show(self):
         """Visualize the plot on the screen."""
         np = import_module('numpy')
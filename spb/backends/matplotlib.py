@@ -20,28 +20,90 @@ def unset_show():
 
 def _matplotlib_list(interval_list):
     """
-    Returns lists for matplotlib `fill` command from a list of bounding
-    rectangular intervals
+    Returns arrays for matplotlib `fill` command from an array of bounding
+    rectangles, where each row contains ``x_start, x_end, y_start, y_end``.
+    A list of pairs of intervals is also accepted. The rectangles are
+    separated by NaN.
     """
-    xlist = []
-    ylist = []
-    if len(interval_list):
-        for intervals in interval_list:
-            intervalx = intervals[0]
-            intervaly = intervals[1]
-            xlist.extend(
-                [intervalx.start, intervalx.start, intervalx.end, intervalx.end, None]
-            )
-            ylist.extend(
-                [intervaly.start, intervaly.end, intervaly.end, intervaly.start, None]
-            )
-    else:
+    np = import_module('numpy')
+
+    if not isinstance(interval_list, np.ndarray):
+        interval_list = np.array([[x.start, x.end, y.start, y.end]
+            for x, y in interval_list], dtype=float).reshape(-1, 4)
+    if len(interval_list) == 0:
         # XXX Ugly hack. Matplotlib does not accept empty lists for `fill`
-        xlist.extend([None, None, None, None])
-        ylist.extend([None, None, None, None])
+        return np.full(4, np.nan), np.full(4, np.nan)
+    x0, x1, y0, y1 = interval_list.T
+    nan = np.full_like(x0, np.nan)
+    xlist = np.stack([x0, x0, x1, x1, nan], axis=1).flatten()
+    ylist = np.stack([y0, y1, y1, y0, nan], axis=1).flatten()
     return xlist, ylist
 
 
+def _surface_polygons(x, y, z):
+    """
+    Returns the quadrilaterals of a structured surface, with the same vertex
+    ordering used by ``plot_surface`` when ``rstride=cstride=1``. The output
+    is an array with shape ``(n, 4, 3)``.
+    """
+    np = import_module('numpy')
+
+    p = np.stack([x, y, z], axis=-1)
+    polys = np.stack([p[:-1, :-1], p[:-1, 1:], p[1:, 1:], p[1:, :-1]],
+        axis=2)
+    return polys.reshape(-1, 4, 3)
+
+
+def _quiver3d_segments(x, y, z, u, v, w, length=1, arrow_length_ratio=0.3,
+    pivot="tail", normalize=False, **kwargs):
+    """
+    Returns the segments of the shafts and of the heads of 3D quivers,
+    computed with the same algorithm used by ``Axes3D.quiver``, so that the
+    segments of an existing ``Line3DCollection`` can be updated. Keyword
+    arguments not related to the geometry of the arrows are ignored.
+    """
+    np = import_module('numpy')
+
+    XYZ = np.column_stack([np.ravel(t) for t in [x, y, z]])
+    UVW = np.column_stack([np.ravel(t) for t in [u, v, w]]).astype(float)
+    norm = np.linalg.norm(UVW, axis=1)
+    # NOTE: as in Matplotlib, quivers with zero length are not shown
+    mask = norm > 0
+    XYZ = XYZ[mask]
+    UVW = UVW[mask]
+    if normalize:
+        UVW = UVW / norm[mask].reshape((-1, 1))
+    if len(XYZ) == 0:
+        return np.zeros((0, 2, 3))
+
+    shaft_dt = np.array([0., length], dtype=float)
+    arrow_dt = shaft_dt * arrow_length_ratio
+    if pivot == "tail":
+        shaft_dt -= length
+    elif pivot == "middle":
+        shaft_dt -= length / 2
+    shafts = (XYZ - np.multiply.outer(shaft_dt, UVW)).swapaxes(0, 1)
+
+    # rotate the direction vectors by +/- 15 degrees around the unit vector
+    # perpendicular to (u, v, 0) in order to get the heads
+    n = np.linalg.norm(UVW[:, :2], axis=1)
+    xp = np.divide(UVW[:, 1], n, where=n != 0, out=np.zeros_like(n))
+    yp = np.divide(-UVW[:, 0], n, where=n != 0, out=np.ones_like(n))
+    c, s = np.cos(np.radians(15)), np.sin(np.radians(15))
+    Rpos = np.array([
+        [c + xp**2 * (1 - c), xp * yp * (1 - c), yp * s],
+        [yp * xp * (1 - c), c + yp**2 * (1 - c), -xp * s],
+        [-yp * s, xp * s, np.full_like(xp, c)]])
+    Rneg = Rpos.copy()
+    Rneg[[0, 1, 2, 2], [2, 2, 0, 1]] *= -1
+    head_dirs = np.stack([
+        np.einsum("ij...,...j->...i", Rpos, UVW),
+        np.einsum("ij...,...j->...i", Rneg, UVW)], axis=1)
+    heads = shafts[:, :1] - np.multiply.outer(arrow_dt, head_dirs)
+    heads = heads.reshape((len(arrow_dt), -1, 3)).swapaxes(0, 1)
+    return np.concatenate([shafts, heads])
+
+
 class MatplotlibBackend(Plot):
     """
     A backend for plotting SymPy's symbolic expressions using Matplotlib.
@@ -321,6 +383,7 @@ class MatplotlibBackend(Plot):
 
         self.ax.cla()
         self._init_cyclers()
+        self._evaluate_series(series)
 
         for i, s in enumerate(series):
             kw = None
@@ -404,6 +467,31 @@ class MatplotlibBackend(Plot):
                 ylims.append((np.amin(y), np.amax(y)))
                 zlims.append((np.amin(z), np.amax(z)))
 
+            elif s.is_3Dsurface and s.is_mesh:
+                x, y, z, triangles = s.get_data()
+                skw = dict(linewidth=0.1)
+                norm, cmap = None, None
+                if s.use_cm:
+                    # one color for each triangle
+                    facecolors = s.eval_color_func(x, y, z)[triangles].mean(axis=1)
+                    norm = self.Normalize(vmin=np.amin(facecolors), vmax=np.amax(facecolors))
+                    cmap = next(self._cm)
+                    skw["cmap"] = cmap
+                    skw["norm"] = norm
+                else:
+                    skw["color"] = next(self._cl) if s.surface_color is None else s.surface_color
+
+                kw = merge({}, skw, s.rendering_kw)
+                c = self.ax.plot_trisurf(x, y, z, triangles=triangles, **kw)
+                if s.use_cm:
+                    cmap = kw["cmap"]
+                    c.set_array(facecolors)
+                is_cb_added = self._add_colorbar(c, s.get_label(self._use_latex), s.use_cm, norm=norm, cmap=cmap)
+                self._add_handle(i, c, kw, is_cb_added, self._fig.axes[-1])
+                xlims.append((np.amin(x), np.amax(x)))
+                ylims.append((np.amin(y), np.amax(y)))
+                zlims.append((np.amin(z), np.amax(z)))
+
             elif (s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit)):
                 if not s.is_parametric:
                     x, y, z = self.series[i].get_data()
@@ -521,7 +609,8 @@ class MatplotlibBackend(Plot):
                         lkw = dict()
                         stream_kw = s.rendering_kw.copy()
                         # remove rendering-unrelated keywords
-                        for k in ["starts", "max_prop", "npoints", "radius"]:
+                        for k in ["starts", "max_prop", "npoints", "radius",
+                            "seed"]:
                             if k in stream_kw.keys():
                                 stream_kw.pop(k)
 
@@ -796,6 +885,59 @@ class MatplotlibBackend(Plot):
         mappable = self.cm.ScalarMappable(cmap=cmap, norm=norm)
         self._fig.colorbar(mappable, orientation="vertical", label=label, cax=cax)
 
+    def _update_surface(self, c, kw, x, y, z):
+        """
+        Update in-place the vertices and the face colors of a surface created
+        with ``plot_surface(x, y, z, rstride=1, cstride=1)``, either with
+        ``facecolors=...`` or with a solid ``color=...``.
+        Returns False if the surface must be created again: for example,
+        when the data contains NaN values (``plot_surface`` removes the
+        associated polygons), or when the face colors are not available.
+        """
+        np = import_module('numpy')
+        mpl_toolkits = import_module(
+            'mpl_toolkits', # noqa
+            import_kwargs={'fromlist': ['mplot3d']},
+            catch=(RuntimeError,))
+        art3d = mpl_toolkits.mplot3d.art3d
+
+        use_facecolors = "facecolors" in kw
+        if ((not use_facecolors) and (("color" not in kw) or
+            (kw.get("cmap", None) is not None))):
+            return False
+        if ((kw.get("rstride", None) != 1) or (kw.get("cstride", None) != 1)
+            or ("rcount" in kw) or ("ccount" in kw)):
+            return False
+        # NOTE: plot_surface shades the face colors when no colormap is
+        # provided. Shading relies on private Matplotlib functions: if they
+        # are not available, the surface is created again.
+        shade = kw.get("shade", kw.get("cmap", None) is None)
+        if shade and not (hasattr(art3d, "_shade_colors") and
+            hasattr(art3d, "_generate_normals")):
+            return False
+        x, y, z = [np.asarray(t, dtype=float) for t in [x, y, z]]
+        if not np.all(np.isfinite(z)):
+            return False
+        polys = _surface_polygons(x, y, z)
+        if not np.all(np.isfinite(polys)):
+            return False
+        if use_facecolors:
+            colors = np.asarray(kw["facecolors"])[:-1, :-1]
+            colors = colors.reshape(-1, colors.shape[-1])
+        else:
+            colors = np.tile(self.matplotlib.colors.to_rgba(kw["color"]),
+                (len(polys), 1))
+        if shade:
+            colors = art3d._shade_colors(colors, art3d._generate_normals(polys),
+                kw.get("lightsource", None))
+        c.set_verts(polys)
+        c.set_facecolor(colors)
+        if use_facecolors:
+            # NOTE: with a solid color, plot_surface doesn't set the edge
+            # colors of the polygons
+            c.set_edgecolor(colors)
+        return True
+
     def _update_interactive(self, params):
         np = import_module('numpy')
         mpl_toolkits = import_module(
@@ -811,9 +953,9 @@ class MatplotlibBackend(Plot):
             self.process_series()
 
         xlims, ylims, zlims = [], [], []
+        self._update_series_params(params)
         for i, s in enumerate(self.series):
             if s.is_interactive:
-                self.series[i].params = params
                 if s.is_2Dline:
                     if s.is_parametric and s.use_cm:
                         x, y, param = self.series[i].get_data()
@@ -853,10 +995,24 @@ class MatplotlibBackend(Plot):
                 elif s.is_contour and (not s.is_complex):
                     x, y, z = self.series[i].get_data()
                     kw, cax = self._handles[i][1:]
+                    # NOTE: contours can't be updated in place. At least,
+                    # reuse the levels of the previous contour if they still
+                    # fit the data as the automatic ones would (same first
+                    # and last intervals): the levels are not computed
+                    # again and the colors don't change between updates.
+                    ckw = kw
+                    levels = self._handles[i][0].levels
+                    zmin, zmax = np.nanmin(z), np.nanmax(z)
+                    if (("levels" not in kw) and (len(levels) > 2) and
+                        (levels[0] <= zmin <= levels[1]) and
+                        (levels[-2] <= zmax <= levels[-1])):
+                        ckw = dict(kw, levels=levels)
                     for c in self._handles[i][0].collections:
                         c.remove()
-                    self._handles[i][0] = self.ax.contourf(x, y, z, **kw)
-                    self._update_colorbar(cax, kw["cmap"], s.get_label(self._use_latex), param=z)
+                    self._handles[i][0] = self.ax.contourf(x, y, z, **ckw)
+                    levels = self._handles[i][0].levels
+                    norm = self.Normalize(vmin=levels[0], vmax=levels[-1])
+                    self._update_colorbar(cax, kw["cmap"], s.get_label(self._use_latex), norm=norm)
                     xlims.append((np.amin(x), np.amax(x)))
                     ylims.append((np.amin(y), np.amax(y)))
 
@@ -871,15 +1027,16 @@ class MatplotlibBackend(Plot):
                     # update becomes really really slow.
                     kw, is_cb_added, cax = self._handles[i][1:]
 
-                    if is_cb_added:
+                    if s.use_cm:
                         norm = self.Normalize(vmin=np.amin(facecolors), vmax=np.amax(facecolors))
                         cmap = kw["cmap"]
                         if isinstance(cmap, str):
                             cmap = self.cm.get_cmap(cmap)
                         kw["facecolors"] = cmap(norm(facecolors))
-                    self._handles[i][0].remove()
-                    self._handles[i][0] = self.ax.plot_surface(
-                        x, y, z, **kw)
+                    if not self._update_surface(self._handles[i][0], kw, x, y, z):
+                        self._handles[i][0].remove()
+                        self._handles[i][0] = self.ax.plot_surface(
+                            x, y, z, **kw)
 
                     if is_cb_added:
                         self._update_colorbar(cax, kw["cmap"], s.get_label(self._use_latex), norm=norm)
@@ -911,11 +1068,14 @@ class MatplotlibBackend(Plot):
 
                     xx, yy, zz, uu, vv, ww = self.series[i].get_data()
                     kw, is_cb_added, cax = self._handles[i][1:]
-                    self._handles[i][0].remove()
-                    self._handles[i][0] = self.ax.quiver(xx, yy, zz, uu, vv, ww, **kw)
+                    magn = np.sqrt(uu ** 2 + vv ** 2 + ww ** 2)
+                    self._handles[i][0].set_segments(
+                        _quiver3d_segments(xx, yy, zz, uu, vv, ww, **kw))
+                    if "array" in kw:
+                        kw["array"] = magn.flatten()
+                        self._handles[i][0].set_array(kw["array"])
 
                     if is_cb_added:
-                        magn = np.sqrt(uu ** 2 + vv ** 2 + ww ** 2)
                         self._update_colorbar(cax, kw["cmap"], s.get_label(self._use_latex), param=magn)
                     xlims.append((np.amin(xx), np.amax(xx)))
                     ylims.append((np.amin(yy), np.amax(yy)))
@@ -937,7 +1097,18 @@ class MatplotlibBackend(Plot):
                     else:
                         kw, is_cb_added, cax = self._handles[i][1:]
 
-                        if is_cb_added:
+                        if self._handles[i][0].N != uu.size:
+                            # the number of arrows changed, for example
+                            # after a preview: the quivers must be created
+                            # again.
+                            self._handles[i][0].remove()
+                            args = [xx, yy, uu, vv]
+                            if is_cb_added:
+                                args.append(magn)
+                            self._handles[i][0] = self.ax.quiver(*args, **kw)
+                            if is_cb_added:
+                                self._update_colorbar(cax, kw["cmap"], s.get_label(self._use_latex), magn)
+                        elif is_cb_added:
                             self._handles[i][0].set_UVC(uu, vv, magn)
                             self._update_colorbar(cax, kw["cmap"], s.get_label(self._use_latex), magn)
                         else:
@@ -948,24 +1119,25 @@ class MatplotlibBackend(Plot):
                 elif s.is_complex:
                     if not s.is_3Dsurface:
                         x, y, _, _, img, colors = s.get_data()
-                        self._handles[i][0].remove()
-                        self._handles[i][0] = self.ax.imshow(img, **self._handles[i][1])
+                        kw = self._handles[i][1]
+                        kw["extent"] = [np.amin(x), np.amax(x), np.amin(y), np.amax(y)]
+                        self._handles[i][0].set_data(img)
+                        self._handles[i][0].set_extent(kw["extent"])
                     else:
                         x, y, mag, arg, facecolors, colorscale = s.get_data()
-                        self._handles[i][0].remove()
                         kw = self._handles[i][1]
                         if s.use_cm:
                             kw["facecolors"] = facecolors / 255
-                        self._handles[i][0] = self.ax.plot_surface(x, y, mag, **kw)
+                        if not self._update_surface(self._handles[i][0], kw, x, y, mag):
+                            self._handles[i][0].remove()
+                            self._handles[i][0] = self.ax.plot_surface(x, y, mag, **kw)
                         xlims.append((np.amin(x), np.amax(x)))
                         ylims.append((np.amin(y), np.amax(y)))
                         zlims.append((np.amin(mag), np.amax(mag)))
 
                 elif s.is_geometry and not (s.is_2Dline):
-                    # TODO: fill doesn't update
                     x, y = self.series[i].get_data()
-                    self._handles[i][0].remove()
-                    self._handles[i][0] = self.ax.fill(x, y, **self._handles[i][1])
+                    self._handles[i][0].set_xy(np.column_stack([x, y]))
 
         # Update the plot limits according to the new data
         Axes3D = mpl_toolkits.mplot3d.Axes3D
@@ -980,6 +1152,43 @@ class MatplotlibBackend(Plot):
 
         self._set_lims(xlims, ylims, zlims)
 
+    def _animate(self, sweep, interval=50, **kwargs):
+        """Create an animation from the frames of a ``Sweep``.
+
+        Parameters
+        ==========
+
+        sweep : spb.animation.Sweep
+
+        interval : int, optional
+            Delay between frames in milliseconds. Default to 50.
+
+        kwargs :
+            Keyword arguments passed to ``FuncAnimation``.
+
+        Returns
+        =======
+
+        anim : matplotlib.animation.FuncAnimation
+            Use ``anim.save("file.mp4", writer="ffmpeg")`` to export the
+            animation to a video file. The figure is updated with the
+            numerical data stored in ``sweep``: the series are not evaluated
+            again.
+        """
+        animation = import_module(
+            'matplotlib',
+            import_kwargs={'fromlist': ['animation']},
+            min_module_version='1.1.0',
+            catch=(RuntimeError,)).animation
+
+        fig = self.fig
+
+        def update(k):
+            self._update_interactive(sweep._apply(k))
+
+        return animation.FuncAnimation(fig, update, frames=len(sweep),
+            interval=interval, **kwargs)
+
     def process_series(self):
         """ Loop over data series, generates numerical data and add it to the
         figure.
@@ -141,6 +141,7 @@ class MayaviBackend(Plot):
         mlab = self.mlab
         mlab.clf(self._fig)
         self._init_cyclers()
+        self._evaluate_series(series)
 
         for i, s in enumerate(series):
             if s.is_3Dline:
@@ -168,9 +169,13 @@ class MayaviBackend(Plot):
 
                 self._add_colorbar(s, obj, colorbar_kw, kw.get("color", None))
             elif (s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit)):
+                triangles = None
                 if s.is_parametric:
                     x, y, z, u, v = s.get_data()
                     attribute = s.eval_color_func(x, y, z, u, v)
+                elif s.is_mesh:
+                    x, y, z, triangles = s.get_data()
+                    attribute = s.eval_color_func(x, y, z)
                 else:
                     x, y, z = s.get_data()
                     attribute = s.eval_color_func(x, y, z)
@@ -186,7 +191,10 @@ class MayaviBackend(Plot):
                 colorbar_kw = kw.pop("colorbar_kw", dict())
                 if not "scalars" in kw.keys():
                     kw["scalars"] = attribute
-                obj = mlab.mesh(x, y, z, **kw)
+                if triangles is None:
+                    obj = mlab.mesh(x, y, z, **kw)
+                else:
+                    obj = mlab.triangular_mesh(x, y, z, triangles, **kw)
                 self._add_colorbar(s, obj, colorbar_kw, kw.get("color", None))
             # elif s.is_complex and s.is_3Dsurface:
             #     pass
@@ -215,7 +223,8 @@ class MayaviBackend(Plot):
                     extent=self._get_extent(x, y, z)
                 )
                 # remove unused keys
-                unused_keys = ["starts", "npoints", "max_prop", "radius"]
+                unused_keys = ["starts", "npoints", "max_prop", "radius",
+                    "seed"]
                 provided_keys = []
                 for k in unused_keys:
                     if k in s.rendering_kw.keys():
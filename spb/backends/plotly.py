@@ -2,7 +2,9 @@ import itertools
 import os
 from spb.defaults import cfg
 from spb.backends.base_backend import Plot
-from spb.backends.utils import get_seeds_points
+from spb.backends.utils import (
+    get_seeds_points, compute_streamlines, compute_streamlines_arrows
+)
 from sympy.external import import_module
 import warnings
 
@@ -207,6 +209,21 @@ class PlotlyBackend(Plot):
             y=0,
         )
 
+    def _get_streamlines_data(self, x, y, u, v, **kw):
+        """Compute the streamlines and their arrow heads as a single
+        NaN-separated trace. Return the coordinates and the keyword
+        arguments to be passed to ``go.Scatter``.
+        """
+        np = import_module('numpy')
+        density = kw.pop("density", 1)
+        angle = kw.pop("angle", None)
+        arrow_scale = kw.pop("arrow_scale", 0.15)
+        xs, ys = compute_streamlines(x[0, :], y[:, 0], u, v, density=density)
+        ax, ay = compute_streamlines_arrows(xs, ys, angle, arrow_scale)
+        nan = [np.nan]
+        xs, ys = np.concatenate([xs, nan, ax]), np.concatenate([ys, nan, ay])
+        return xs, ys, kw
+
     def _solid_colorscale(self, s):
         # create a solid color to be used when s.use_cm=False
         col = s.line_color
@@ -222,9 +239,9 @@ class PlotlyBackend(Plot):
             min_module_version='5.0.0')
         go = plotly.graph_objects
         create_quiver = plotly.figure_factory.create_quiver
-        create_streamline = plotly.figure_factory.create_streamline
         merge = self.merge
         self._init_cyclers()
+        self._evaluate_series(series)
 
         # if legend=True and both 3d lines and surfaces are shown, then hide the
         # surfaces color bars and only shows line labels in the legend.
@@ -332,6 +349,30 @@ class PlotlyBackend(Plot):
                 kw = merge({}, lkw, s.rendering_kw)
                 self._fig.add_trace(go.Scatter3d(x=x, y=y, z=z, **kw))
 
+            elif s.is_3Dsurface and s.is_mesh:
+                x, y, z, triangles = s.get_data()
+                intensity = s.eval_color_func(x, y, z)
+                # create a solid color to be used when s.use_cm=False
+                col = next(self._cl) if s.surface_color is None else s.surface_color
+                colorscale = [[0, col], [1, col]]
+                colormap = next(self._cm)
+                skw = dict(
+                    name=s.get_label(self._use_latex),
+                    showscale=self.legend and show_3D_colorscales,
+                    colorbar=self._create_colorbar(ii, s.get_label(self._use_latex)),
+                    colorscale=colormap if s.use_cm else colorscale,
+                    intensity=intensity,
+                    cmin=np.nanmin(intensity),
+                    cmax=np.nanmax(intensity)
+                )
+
+                kw = merge({}, skw, s.rendering_kw)
+                self._fig.add_trace(go.Mesh3d(x=x, y=y, z=z,
+                    i=triangles[:, 0], j=triangles[:, 1], k=triangles[:, 2],
+                    **kw))
+
+                count += 1
+
             elif s.is_3Dsurface and (not s.is_domain_coloring) and (not s.is_implicit):
                 if not s.is_parametric:
                     xx, yy, zz = s.get_data()
@@ -406,12 +447,13 @@ class PlotlyBackend(Plot):
                     # https://community.plotly.com/t/how-to-make-python-quiver-with-colorscale/41028
                     if s.is_streamlines:
                         skw = dict(
-                            line_color=next(self._qc), arrow_scale=0.15, name=s.get_label(self._use_latex)
+                            line_color=next(self._qc), name=s.get_label(self._use_latex)
                         )
                         kw = merge({}, skw, s.rendering_kw)
-                        stream = create_streamline(
-                            xx[0, :], yy[:, 0], uu, vv, **kw)
-                        self._fig.add_trace(stream.data[0])
+                        x, y, kw = self._get_streamlines_data(
+                            xx, yy, uu, vv, **kw)
+                        self._fig.add_trace(
+                            go.Scatter(x=x, y=y, mode="lines", **kw))
                     else:
                         qkw = dict(line_color=next(self._qc), scale=0.075, name=s.get_label(self._use_latex))
                         kw = merge({}, qkw, s.rendering_kw)
@@ -441,7 +483,8 @@ class PlotlyBackend(Plot):
                         )
 
                         # remove rendering-unrelated keywords
-                        for _k in ["starts", "max_prop", "npoints", "radius"]:
+                        for _k in ["starts", "max_prop", "npoints", "radius",
+                            "seed"]:
                             if _k in stream_kw.keys():
                                 stream_kw.pop(_k)
 
@@ -614,9 +657,9 @@ class PlotlyBackend(Plot):
         create_quiver = plotly.figure_factory.create_quiver
         merge = self.merge
 
+        self._update_series_params(params)
         for i, s in enumerate(self.series):
             if s.is_interactive:
-                self.series[i].params = params
                 if s.is_2Dline and s.is_parametric:
                     x, y, param = self.series[i].get_data()
                     self.fig.data[i]["x"] = x
@@ -648,8 +691,10 @@ class PlotlyBackend(Plot):
                     else:
                         x, y, z, u, v = s.get_data()
                         surfacecolor = s.eval_color_func(x, y, z, u, v)
-                        self.fig.data[i]["x"] = x
-                        self.fig.data[i]["y"] = y
+                    # NOTE: the shape of the data changes between previews
+                    # and full resolution updates.
+                    self.fig.data[i]["x"] = x
+                    self.fig.data[i]["y"] = y
 
                     _min, _max = surfacecolor.min(), surfacecolor.max()
                     self.fig.data[i]["z"] = z
@@ -658,7 +703,9 @@ class PlotlyBackend(Plot):
                     self.fig.data[i]["cmax"] = _max
 
                 elif s.is_contour and (not s.is_complex):
-                    _, _, zz = s.get_data()
+                    xx, yy, zz = s.get_data()
+                    self.fig.data[i]["x"] = xx[0, :]
+                    self.fig.data[i]["y"] = yy[:, 0]
                     self.fig.data[i]["z"] = zz
 
                 elif s.is_vector and s.is_3D:
@@ -675,8 +722,9 @@ class PlotlyBackend(Plot):
                 elif s.is_vector:
                     x, y, u, v = self.series[i].get_data()
                     if s.is_streamlines:
-                        # TODO: iplot doesn't work with 2D streamlines.
-                        raise NotImplementedError
+                        xs, ys, _ = self._get_streamlines_data(
+                            x, y, u, v, **s.rendering_kw.copy())
+                        data = {"x": xs, "y": ys}
                     else:
                         qkw = dict(
                             line_color=self.quivers_colors[i], scale=0.075, name=s.get_label(self._use_latex)
@@ -694,6 +742,8 @@ class PlotlyBackend(Plot):
                         raise NotImplementedError
                     else:
                         xx, yy, mag, angle, colors, colorscale = s.get_data()
+                        self.fig.data[i]["x"] = xx
+                        self.fig.data[i]["y"] = yy
                         self.fig.data[i]["z"] = mag
                         self.fig.data[i]["surfacecolor"] = angle
                         self.fig.data[i]["customdata"] = angle
@@ -784,6 +834,57 @@ class PlotlyBackend(Plot):
             ),
         )
 
+    def _animate(self, sweep, duration=50):
+        """Create an animation from the frames of a ``Sweep``.
+
+        Parameters
+        ==========
+
+        sweep : spb.animation.Sweep
+
+        duration : int, optional
+            Duration of each frame in milliseconds. Default to 50.
+
+        Returns
+        =======
+
+        fig : plotly.graph_objects.Figure
+            The figure, containing one frame for each value of the swept
+            parameter, a play button and a slider.
+        """
+        plotly = import_module(
+            'plotly',
+            import_kwargs={'fromlist': ['graph_objects']},
+            min_module_version='5.0.0')
+        go = plotly.graph_objects
+
+        fig = self.fig
+        frames = []
+        for k in range(len(sweep)):
+            self._update_interactive(sweep._apply(k))
+            frames.append(go.Frame(
+                data=fig.to_dict()["data"], name=str(k)))
+        self._update_interactive(sweep._apply(0))
+        fig.frames = frames
+
+        animation_kw = dict(mode="immediate",
+            frame=dict(duration=duration, redraw=True),
+            transition=dict(duration=0))
+        fig.update_layout(
+            updatemenus=[dict(type="buttons", showactive=False, buttons=[
+                dict(label="Play", method="animate",
+                    args=[None, dict(fromcurrent=True, **animation_kw)]),
+                dict(label="Pause", method="animate",
+                    args=[[None], animation_kw])
+            ])],
+            sliders=[dict(
+                currentvalue=dict(prefix="%s = " % sweep.param),
+                steps=[dict(label="%.4g" % v, method="animate",
+                    args=[[str(k)], animation_kw])
+                    for k, v in enumerate(sweep.values)])]
+        )
+        return fig
+
     def show(self):
         """Visualize the plot on the screen."""
         if len(self._fig.data) != len(self.series):
@@ -1,7 +1,18 @@
+from collections import OrderedDict
+from functools import lru_cache
+from threading import RLock
 from PIL import ImageColor
 from sympy.external import import_module
 
 
+# NOTE: converted colormaps are cached by (colormap identity, library, n).
+# A reference to the original colormap is stored next to the result, so that
+# its id can't be reused by another object while the entry is alive.
+_colormaps_cache = OrderedDict()
+_colormaps_cache_lock = RLock()
+_colormaps_cache_size = 128
+
+
 def convert_colormap(cm, to, n=256):
     """Convert the provided colormap to a format usable by the specified
     plotting library. The following plotting libraries are supported:
@@ -26,7 +37,63 @@ def convert_colormap(cm, to, n=256):
     =======
         A new colormap. Note that the conversion is not guardanteed.
         The function returns the provided colormap if it cannot be converted.
+
+    Notes
+    =====
+
+    Conversions are cached by the identity of the provided colormap (or by
+    its name), the plotting library and ``n``: the returned colormap is
+    shared between calls and it must not be modified. Likewise, a list
+    colormap must not be modified after being converted.
+    """
+    assert isinstance(to, str)
+    to = to.lower()
+    key = (cm if isinstance(cm, str) else id(cm), to, n)
+    with _colormaps_cache_lock:
+        if key in _colormaps_cache:
+            source, r = _colormaps_cache[key]
+            if source is cm:
+                _colormaps_cache.move_to_end(key)
+                return r
+    r = _convert_colormap(cm, to, n)
+    with _colormaps_cache_lock:
+        _colormaps_cache[key] = (cm, r)
+        while len(_colormaps_cache) > _colormaps_cache_size:
+            _colormaps_cache.popitem(last=False)
+    return r
+
+
+def _hex_to_rgb(colors):
+    """Convert a list of color strings to an array of RGB colors with
+    components in the range [0, 1].
+    """
+    np = import_module('numpy')
+    return np.array([ImageColor.getcolor(c, "RGB") for c in colors],
+        dtype=float).reshape(-1, 3) / 255
+
+
+def _to_k3d(locs, colors):
+    """Interleave locations and RGB colors: [loc1, r1, g1, b1, ...]"""
+    np = import_module('numpy')
+    return np.column_stack([locs, colors]).flatten().tolist()
+
+
+def _to_plotly(locs, colors):
+    """Create a Plotly color scale from locations and RGB colors with
+    integer components in the range [0, 255].
+    """
+    return [[loc, "rgb(%d, %d, %d)" % tuple(c)] for loc, c in
+        zip(locs.tolist(), colors.tolist())]
+
+
+def _to_bokeh(colors):
+    """Create a Bokeh palette from RGB colors with integer components in the
+    range [0, 255].
     """
+    return ["#%02x%02x%02x" % tuple(c) for c in colors.tolist()]
+
+
+def _convert_colormap(cm, to, n):
     np = import_module('numpy')
     matplotlib = import_module(
         'matplotlib',
@@ -35,8 +102,6 @@ def convert_colormap(cm, to, n=256):
         catch=(RuntimeError,))
     Colormap = matplotlib.colors.Colormap
 
-    assert isinstance(to, str)
-    to = to.lower()
     assert to in ["matplotlib", "plotly", "k3d", "bokeh", "mayavi"]
     if not isinstance(cm, (str, list, tuple, np.ndarray, Colormap)):
         raise ValueError(
@@ -58,210 +123,205 @@ def convert_colormap(cm, to, n=256):
         # intercompatibility with other plotting libraries.
         return cm
 
-    r = []
+    is_array = lambda: isinstance(cm, np.ndarray) or all(
+        [isinstance(c, (list, tuple)) for c in cm])
+    is_str_list = lambda: all([isinstance(c, str) for c in cm])
+    is_k3d = lambda: all([isinstance(t, (float, int)) for t in cm])
+    discr = np.linspace(0, 1, n)
+
     if to == "k3d":
         # K3D color maps are lists of the form:
         # [loc1, r1, g1, b1, loc2, r2, b2, g2, ...]
         if isinstance(cm, Colormap):
             # matplotlib color map
-            discr = np.linspace(0, 1, n)
-            for loc, color in zip(discr, cm(discr)):
-                r.append(loc)
-                r += list(color[:-1])
-        elif isinstance(cm, str):
+            return _to_k3d(discr, cm(discr)[:, :3])
+        if isinstance(cm, str):
             # Plotly color scale
-            discr = np.linspace(0, 1, n)
-            colors = get_plotly_colors(cm, discr)
-            for loc, color in zip(discr, colors):
-                r.append(loc)
-                r += color
-        elif isinstance(cm, np.ndarray) or all(
-            [isinstance(c, (list, tuple)) for c in cm]
-        ):
-            if isinstance(cm, (list, tuple)):
-                cm = np.array(cm)
-
-            if cm.shape[1] == 4:
-                # matplotlib color map already extracted
-                for loc, color in zip(np.linspace(0, 1, len(cm)), cm):
-                    r.append(loc)
-                    r += list(color[:-1])
-            else:
-                # colorcet color map
-                for loc, color in zip(np.linspace(0, 1, len(cm)), cm):
-                    r.append(loc)
-                    r += list(color)
-        elif all([isinstance(c, str) for c in cm]):
+            return _to_k3d(discr, _plotly_colors(cm, discr))
+        if is_array():
+            # matplotlib color map already extracted, or colorcet color map
+            cm = np.asarray(cm)
+            return _to_k3d(np.linspace(0, 1, len(cm)), cm[:, :3])
+        if is_str_list():
             # colorcet colormap
-            for loc, color in zip(np.linspace(0, 1, len(cm)), cm):
-                r.append(loc)
-                c = ImageColor.getcolor(color, "RGB")
-                r += [float(e) / 255 for e in c]
-        else:
-            r = cm
-    elif to == "plotly":
+            return _to_k3d(np.linspace(0, 1, len(cm)), _hex_to_rgb(cm))
+        return cm
+
+    if to == "plotly":
         if isinstance(cm, str):
             # plotly color scale name
-            r = cm
-        elif isinstance(cm, Colormap):
+            return cm
+        if isinstance(cm, Colormap):
             # matplotlib color map
-            discr = np.linspace(0, 1, n)
-            colors = (cm(discr) * 255).astype(int)
-            r = [[loc, "rgb" + str(tuple(c[:-1]))] for loc, c in zip(discr, colors)]
-        elif isinstance(cm, np.ndarray) or all(
-            [isinstance(c, (list, tuple)) for c in cm]
-        ):
-            if isinstance(cm, (list, tuple)):
-                cm = np.array(cm)
-
-            cm = (cm * 255).astype(int)
-            if cm.shape[1] == 4:
-                # matplotlib color map already extracted
-                for loc, color in zip(np.linspace(0, 1, len(cm)), cm):
-                    r.append([loc, "rgb" + str(tuple(color[:-1]))])
-            else:
-                # colorcet colormap
-                for loc, color in zip(np.linspace(0, 1, len(cm)), cm):
-                    r.append([loc, "rgb" + str(tuple(color))])
-        elif all([isinstance(c, str) for c in cm]):
+            return _to_plotly(discr, (cm(discr)[:, :3] * 255).astype(int))
+        if is_array():
+            # matplotlib color map already extracted, or colorcet color map
+            cm = (np.asarray(cm) * 255).astype(int)
+            return _to_plotly(np.linspace(0, 1, len(cm)), cm[:, :3])
+        if is_str_list():
             # colorcet colormap
-            for loc, color in zip(np.linspace(0, 1, len(cm)), cm):
-                c = ImageColor.getcolor(color, "RGB")
-                r.append([loc, "rgb" + str(tuple(c))])
-        elif all([isinstance(t, (float, int)) for t in cm]):
+            colors = np.rint(_hex_to_rgb(cm) * 255).astype(int)
+            return _to_plotly(np.linspace(0, 1, len(cm)), colors)
+        if is_k3d():
             # k3d color map
             cm = np.array(cm).reshape(-1, 4)
-            colors = (cm[:, 1:] * 255).astype(int)
-            for loc, color in zip(cm[:, 0], colors):
-                r.append([loc, "rgb" + str(tuple(color))])
-        else:
-            r = cm
-    elif to == "matplotlib":  # to matplotlib
+            return _to_plotly(cm[:, 0], (cm[:, 1:] * 255).astype(int))
+        return cm
+
+    if to == "matplotlib":
         if isinstance(cm, Colormap):
-            r = cm
-        elif isinstance(cm, str):
+            return cm
+        if isinstance(cm, str):
             # Plotly color scale
-            discr = np.linspace(0, 1, n)
-            colors = np.array(get_plotly_colors(cm, discr))
-            r = np.c_[colors, np.ones(len(colors))]
-        elif all([isinstance(t, (float, int, np.float64)) for t in cm]):
+            colors = _plotly_colors(cm, discr)
+            return np.c_[colors, np.ones(len(colors))]
+        if all([isinstance(t, (float, int, np.float64)) for t in cm]):
             # k3d color map
             cm = np.array(cm).reshape(-1, 4)
-            r = np.c_[cm[:, 1:], np.ones(len(cm))]
-        elif isinstance(cm, np.ndarray) or all(
-            [isinstance(c, (list, tuple)) for c in cm]
-        ):
-            if isinstance(cm, (list, tuple)):
-                cm = np.array(cm)
-
+            return np.c_[cm[:, 1:], np.ones(len(cm))]
+        if is_array():
+            cm = np.asarray(cm)
             if cm.shape[1] == 4:
                 # matplotlib color map already extracted
-                r = cm
-            else:
-                # colorcet color map
-                r = np.c_[cm, np.ones(len(cm))]
-        elif all([isinstance(c, str) for c in cm]):
+                return cm
+            # colorcet color map
+            return np.c_[cm, np.ones(len(cm))]
+        if is_str_list():
             # colorcet colormap
-            colors = [ImageColor.getcolor(color, "RGB") for color in cm]
-            colors = np.array(colors) / 255
-            r = np.c_[colors, np.ones(len(colors))]
-        else:
-            r = cm
-    else:  # to bokeh
-        if isinstance(cm, Colormap):
-            # matplotlib color map
-            discr = np.linspace(0, 1, n)
-            colors = (cm(discr) * 255).astype(int)
-            r = ["#%02x%02x%02x" % tuple(c[:-1]) for c in colors]
-        elif isinstance(cm, str):
-            # Plotly color scale
-            discr = np.linspace(0, 1, n)
-            colors = np.array(get_plotly_colors(cm, discr))
-            colors = (colors * 255).astype(np.uint8)
-            r = ["#%02x%02x%02x" % tuple(c) for c in colors]
-        elif isinstance(cm, np.ndarray) or all(
-            [isinstance(c, (list, tuple)) for c in cm]
-        ):
-            if isinstance(cm, (list, tuple)):
-                cm = np.array(cm)
-            colors = (cm * 255).astype(int)
+            colors = _hex_to_rgb(cm)
+            return np.c_[colors, np.ones(len(colors))]
+        return cm
 
-            if cm.shape[1] == 4:
-                # matplotlib color map already extracted
-                r = ["#%02x%02x%02x" % tuple(c[:-1]) for c in colors]
-            else:
-                # colorcet color map
-                r = ["#%02x%02x%02x" % tuple(c) for c in colors]
-        elif all([isinstance(t, (float, int)) for t in cm]):
-            # k3d color map
-            cm = np.array(cm).reshape(-1, 4)
-            colors = (cm[:, 1:] * 255).astype(int)
-            r = ["#%02x%02x%02x" % tuple(c) for c in colors]
-        else:
-            r = cm
-    return r
+    # to bokeh
+    if isinstance(cm, Colormap):
+        # matplotlib color map
+        return _to_bokeh((cm(discr)[:, :3] * 255).astype(int))
+    if isinstance(cm, str):
+        # Plotly color scale
+        return _to_bokeh((_plotly_colors(cm, discr) * 255).astype(np.uint8))
+    if is_array():
+        # matplotlib color map already extracted, or colorcet color map
+        return _to_bokeh((np.asarray(cm)[:, :3] * 255).astype(int))
+    if is_k3d():
+        # k3d color map
+        cm = np.array(cm).reshape(-1, 4)
+        return _to_bokeh((cm[:, 1:] * 255).astype(int))
+    return cm
+
+
+def pack_rgba(img, out=None):
+    """Pack an image of RGB or RGBA colors (``uint8``) with shape
+    ``(n, m, 3)`` or ``(n, m, 4)`` into an array of ``uint32`` with shape
+    ``(n, m)``, where each element contains the four bytes of a color. This
+    is the format required by Bokeh's ``image_rgba``. RGB colors are
+    considered fully opaque.
 
+    Parameters
+    ==========
+        img : np.ndarray [n x m x 3] or [n x m x 4]
+            The image to be packed.
+        out : np.ndarray [n x m], optional
+            A preallocated ``uint32`` array where the colors are written.
+            If not provided, a new array is created.
 
-def _get_continuous_color(colorscale, intermed):
-    """Computes the intermediate color for any value in the [0, 1] range of a
-    Plotly color scale.
+    Returns
+    =======
+        packed : np.ndarray [n x m]
+            If ``img`` is a C-contiguous RGBA image and ``out`` is not
+            provided, a view of ``img`` is returned: no copy is made.
+    """
+    np = import_module('numpy')
 
-    From: https://stackoverflow.com/a/64655638/2329968
+    img = np.asarray(img)
+    n, m, c = img.shape
+    if ((out is None) and (c == 4) and (img.dtype == np.uint8) and
+        img.flags["C_CONTIGUOUS"]):
+        return img.view(np.uint32).reshape(n, m)
+    if out is None:
+        out = np.empty((n, m), dtype=np.uint32)
+    pixels = out.view(np.uint8).reshape(n, m, 4)
+    pixels[..., :c] = img
+    if c == 3:
+        pixels[..., 3] = 255
+    return out
+
+
+def pack_rgb(colors, out=None):
+    """Pack RGB colors with integer components from 0 to 255 (shape
+    ``(..., 3)``) into ``uint32`` integers ``R * 256**2 + G * 256 + B``
+    (shape ``(...)``). This is the format required by K3D's ``colors``.
 
     Parameters
     ==========
-
-        colorscale : list
-            A plotly colorscale in the form:
-            [[loc1, "rgb1"], [loc2, "rgb2"], ...] where loc is the location
-            in the range [0, 1] and "rgb1" is a string representing and RGB
-            color.
-
-        intermed : float
-            Value in the range [0, 1]
+        colors : np.ndarray [... x 3]
+            The colors to be packed, usually of type ``uint8``.
+        out : np.ndarray, optional
+            A preallocated ``uint32`` array where the colors are written.
+            If not provided, a new array is created.
 
     Returns
     =======
-        color : str
-            An RGB color string in which the components are float numbers in the
-            range [0, 255].
+        packed : np.ndarray
     """
-    plotly = import_module(
-        'plotly',
-        import_kwargs={'fromlist': ['colors']},
-        min_module_version='5.0.0')
+    np = import_module('numpy')
 
-    if len(colorscale) < 1:
-        raise ValueError("colorscale must have at least one color")
+    colors = np.asarray(colors).astype(np.uint32, copy=False)
+    if out is None:
+        out = np.empty(colors.shape[:-1], dtype=np.uint32)
+    np.left_shift(colors[..., 0], np.uint32(16), out=out)
+    out |= colors[..., 1] << np.uint32(8)
+    out |= colors[..., 2]
+    return out
 
-    hex_to_rgb = lambda c: "rgb" + str(ImageColor.getcolor(c, "RGB"))
 
-    if intermed <= 0 or len(colorscale) == 1:
-        c = colorscale[0][1]
-        return c if c[0] != "#" else hex_to_rgb(c)
-    if intermed >= 1:
-        c = colorscale[-1][1]
-        return c if c[0] != "#" else hex_to_rgb(c)
+@lru_cache(maxsize=128)
+def _plotly_colorscale(colorscale_name):
+    """Parse a Plotly color scale into an array of locations and an array
+    of RGB colors with components in the range [0, 255]. The results are
+    cached: the returned arrays are read-only.
+    """
+    np = import_module('numpy')
+    _plotly_utils = import_module(
+        '_plotly_utils',
+        import_kwargs={'fromlist': ['basevalidators']})
 
-    for cutoff, color in colorscale:
-        if intermed > cutoff:
-            low_cutoff, low_color = cutoff, color
-        else:
-            high_cutoff, high_color = cutoff, color
-            break
+    # first parameter: Name of the property being validated
+    # second parameter: a string, doesn't really matter for our use cae
+    cv = _plotly_utils.basevalidators.ColorscaleValidator("colorscale", "")
+    # colorscale will be a list of lists: [[loc1, "rgb1"], [loc2, "rgb2"], ...]
+    # NOTE: some color scale names (such as cividis) returns:
+    # [[loc1, "hex1"], [loc2, "hex2"], ...]
+    colorscale = cv.validate_coerce(colorscale_name)
+    if len(colorscale) < 1:
+        raise ValueError("colorscale must have at least one color")
 
-    if (low_color[0] == "#") or (high_color[0] == "#"):
-        # some color scale names (such as cividis) returns:
-        # [[loc1, "hex1"], [loc2, "hex2"], ...]
-        low_color = hex_to_rgb(low_color)
-        high_color = hex_to_rgb(high_color)
+    locs = np.array([float(loc) for loc, _ in colorscale])
+    colors = np.array([
+        ImageColor.getcolor(c, "RGB") if c[0] == "#" else
+        [float(t) for t in c[c.index("(") + 1:-1].split(",")[:3]]
+        for _, c in colorscale], dtype=float)
+    locs.flags.writeable = False
+    colors.flags.writeable = False
+    return locs, colors
 
-    return plotly.colors.find_intermediate_color(
-        lowcolor=low_color,
-        highcolor=high_color,
-        intermed=((intermed - low_cutoff) / (high_cutoff - low_cutoff)),
-        colortype="rgb",
-    )
+
+def _plotly_colors(colorscale_name, loc):
+    """Vectorized interpolation of a Plotly color scale. Return an array of
+    RGB colors with components in the range [0, 1].
+    """
+    np = import_module('numpy')
+    locs, colors = _plotly_colorscale(colorscale_name)
+    loc = np.asarray(loc, dtype=float)
+    if len(locs) == 1:
+        return np.broadcast_to(colors[0], (*loc.shape, 3)) / 255
+    # NOTE: same formula used by plotly.colors.find_intermediate_color.
+    # Locations outside [0, 1] get the colors at the end points.
+    j = np.clip(np.searchsorted(locs, loc, side="left"), 1, len(locs) - 1)
+    t = ((loc - locs[j - 1]) / (locs[j] - locs[j - 1]))[..., None]
+    c = colors[j - 1] + t * (colors[j] - colors[j - 1])
+    c = np.where((loc <= 0)[..., None], colors[0], c)
+    c = np.where((loc >= 1)[..., None], colors[-1], c)
+    return c / 255
 
 
 def get_plotly_colors(colorscale_name, loc):
@@ -281,22 +341,273 @@ def get_plotly_colors(colorscale_name, loc):
     =======
         An RGB list with components in the range [0, 1] or a list of RGB lists.
     """
-    _plotly_utils = import_module(
-        '_plotly_utils',
-        import_kwargs={'fromlist': ['basevalidators']})
+    np = import_module('numpy')
+    if hasattr(loc, "__iter__"):
+        loc = np.array(list(loc), dtype=float)
+    return _plotly_colors(colorscale_name, loc).tolist()
 
-    # first parameter: Name of the property being validated
-    # second parameter: a string, doesn't really matter for our use cae
-    cv = _plotly_utils.basevalidators.ColorscaleValidator("colorscale", "")
-    # colorscale will be a list of lists: [[loc1, "rgb1"], [loc2, "rgb2"], ...]
-    colorscale = cv.validate_coerce(colorscale_name)
 
-    if hasattr(loc, "__iter__"):
-        str_colors = [_get_continuous_color(colorscale, x) for x in loc]
-        return [[float(t) / 255 for t in s[4:-1].split(",")] for s in str_colors]
+def _streamlines_seeds(NBX, NBY):
+    """Indices of the cells of the occupancy grid used as seeds, ordered
+    from the edges inwards. Each cell appears once.
+    """
+    np = import_module('numpy')
+
+    N = max(NBX, NBY)
+    seeds = []
+    for indent in range(N // 2):
+        t = np.arange(N - 2 * indent) + indent
+        c = np.full_like(t, indent)
+        bx = np.stack([t, t, c, np.full_like(t, NBX - 1 - indent)], axis=1)
+        by = np.stack([c, np.full_like(t, NBY - 1 - indent), t, t], axis=1)
+        bx, by = bx.flatten(), by.flatten()
+        inside = (bx >= 0) & (bx < NBX) & (by >= 0) & (by < NBY)
+        seeds.append(by[inside] * NBX + bx[inside])
+    seeds = np.concatenate(seeds)
+    _, idx = np.unique(seeds, return_index=True)
+    return seeds[np.sort(idx)]
+
+
+def compute_streamlines(x, y, u, v, density=1.0, batch_size=32):
+    """Return the streamlines of a 2D vector field.
+
+    The domain is covered by an occupancy grid, whose size depends on
+    ``density``: a streamline stops when it enters a cell already visited by
+    another streamline. Streamlines are started from the free cells of the
+    occupancy grid, from the edges inwards, and they are integrated forward
+    and backward with a fixed step RK4 method. Up to ``batch_size``
+    streamlines are advanced together with NumPy operations: as soon as a
+    streamline terminates, a new one is started in its place.
 
-    str_color = _get_continuous_color(colorscale, loc)
-    return [float(t) / 255 for t in str_color[4:-1].split(",")]
+    Parameters
+    ==========
+        x, y : np.ndarray
+            1D arrays defining an *evenly spaced* grid.
+        u, v : np.ndarray
+            2D arrays (shape [len(y), len(x)]) with the components of the
+            vector field.
+        density : float
+            Controls the closeness of the streamlines. Default to 1.
+        batch_size : int
+            Maximum number of streamlines integrated together. Default to
+            32.
+
+    Returns
+    =======
+        x, y : np.ndarray
+            1D arrays with the coordinates of the streamlines, separated by
+            NaN values.
+
+    Credit: https://docs.bokeh.org/en/latest/docs/gallery/quiver.html
+    """
+    np = import_module('numpy')
+
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    NGX, NGY = len(x), len(y)
+    DX, DY = x[1] - x[0], y[1] - y[0]
+    XOFF, YOFF = x[0], y[0]
+
+    # rescale velocity onto axes-coordinates: s (path length) will be in
+    # axes-coordinates, while u and v are rescaled to grid-coordinates.
+    u = np.asarray(u, dtype=float) / (x[-1] - x[0])
+    v = np.asarray(v, dtype=float) / (y[-1] - y[0])
+    field = np.stack([u * NGX, v * NGY, np.sqrt(u * u + v * v)], axis=-1)
+    # values of the field at the corners of each cell of the grid, so that
+    # the interpolation requires a single gather
+    corners = np.stack([field[:-1, :-1], field[:-1, 1:],
+        field[1:, :-1], field[1:, 1:]], axis=2).reshape(-1, 4, 3)
+
+    NBX = int(30 * density)
+    NBY = int(30 * density)
+    blank = np.zeros(NBY * NBX, dtype=bool)
+    owner = np.full(NBY * NBX, -1)
+    bx_spacing = NGX / float(NBX - 1)
+    by_spacing = NGY / float(NBY - 1)
+
+    def blank_cell(xi, yi):
+        bx = (xi / bx_spacing + 0.5).astype(int)
+        by = (yi / by_spacing + 0.5).astype(int)
+        return by * NBX + bx
+
+    def inside(xi, yi):
+        return (xi >= 0) & (xi < NGX - 1) & (yi >= 0) & (yi < NGY - 1)
+
+    def f(xi, yi, sign):
+        # batched bilinear interpolation of the field. Return also a mask
+        # of the points inside the domain.
+        ok = inside(xi, yi)
+        xi, yi = np.where(ok, xi, 0), np.where(ok, yi, 0)
+        i, j = xi.astype(int), yi.astype(int)
+        xt, yt = xi - i, yi - j
+        w = np.empty((len(xi), 4))
+        w[:, 1], w[:, 3] = xt * (1 - yt), xt * yt
+        w[:, 0], w[:, 2] = (1 - yt) - w[:, 1], yt - w[:, 3]
+        a = np.einsum("ni,nij->nj", w, corners[j * (NGX - 1) + i])
+        dt_ds = sign / a[:, 2]
+        return a[:, 0] * dt_ds, a[:, 1] * dt_ds, ok
+
+    ds = 0.01
+    max_steps = int(2 / ds) + 3
+    W = int(batch_size)
+    # state of the slots: sign is +1 (forward), -1 (backward) or 0 (free)
+    sign = np.zeros(W)
+    seed = np.zeros(W, dtype=int)
+    sid = np.full(W, -1)
+    xi, yi = np.zeros(W), np.zeros(W)
+    cells = np.zeros(W, dtype=int)
+    stotal, sforward = np.zeros(W), np.zeros(W)
+    traj = {d: (np.zeros((max_steps, W)), np.zeros((max_steps, W)))
+        for d in (1, -1)}
+    npoints = {1: np.zeros(W, dtype=int), -1: np.zeros(W, dtype=int)}
+
+    def start(slots, d):
+        # (re)start the integration of the seeds of some slots
+        by, bx = np.divmod(seed[slots], NBX)
+        xi[slots], yi[slots] = bx * bx_spacing, by * by_spacing
+        cells[slots] = seed[slots]
+        sign[slots] = d
+        stotal[slots] = 0
+        npoints[d][slots] = 0
+
+    streamlines = []
+    pending = _streamlines_seeds(NBX, NBY)
+    counter = 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while True:
+            # fill the free slots with the next seeds whose cells are free
+            free_slots = np.flatnonzero(sign == 0)
+            if (len(free_slots) > 0) and (len(pending) > 0):
+                pending = pending[~blank[pending]]
+                n = min(len(free_slots), len(pending))
+                slots = free_slots[:n]
+                seed[slots] = pending[:n]
+                sid[slots] = np.arange(counter, counter + n)
+                counter += n
+                pending = pending[n:]
+                start(slots, 1)
+
+            idx = np.flatnonzero(sign != 0)
+            if len(idx) == 0:
+                break
+            px, py, sg = xi[idx], yi[idx], sign[idx]
+            ok0 = inside(px, py)
+            for d in (1, -1):
+                m = sg == d
+                tx, ty = traj[d]
+                tx[npoints[d][idx[m]], idx[m]] = px[m]
+                ty[npoints[d][idx[m]], idx[m]] = py[m]
+                npoints[d][idx[m]] += ok0[m]
+            k1x, k1y, ok1 = f(px, py, sg)
+            k2x, k2y, ok2 = f(px + 0.5 * ds * k1x, py + 0.5 * ds * k1y, sg)
+            k3x, k3y, ok3 = f(px + 0.5 * ds * k2x, py + 0.5 * ds * k2y, sg)
+            k4x, k4y, ok4 = f(px + ds * k3x, py + ds * k3y, sg)
+            px = px + ds * (k1x + 2 * k2x + 2 * k3x + k4x) / 6.0
+            py = py + ds * (k1y + 2 * k2y + 2 * k3y + k4y) / 6.0
+            # initial, intermediate or final positions might be out of the
+            # domain
+            ok = ok0 & ok1 & ok2 & ok3 & ok4 & inside(px, py)
+            done = idx[~ok]
+            idx, px, py = idx[ok], px[ok], py[ok]
+            xi[idx], yi[idx] = px, py
+            stotal[idx] += ds
+            # new cells must be free: when many streamlines enter the same
+            # free cell, the one started first claims it.
+            new_cells = blank_cell(px, py)
+            changed = new_cells != cells[idx]
+            candidates = np.flatnonzero(changed & ~blank[new_cells])
+            _, first = np.unique(new_cells[candidates], return_index=True)
+            winners = np.zeros(len(idx), dtype=bool)
+            winners[candidates[first]] = True
+            blank[new_cells[winners]] = True
+            owner[new_cells[winners]] = sid[idx[winners]]
+            cells[idx[winners]] = new_cells[winners]
+            stop = (changed & ~winners) | (stotal[idx] > 2)
+            done = np.concatenate([done, idx[stop]])
+            if len(done) == 0:
+                continue
+
+            # forward integrations are followed by backward integrations
+            fwd = done[sign[done] == 1]
+            sforward[fwd] = stotal[fwd]
+            start(fwd, -1)
+            bwd = done[sign[done] == -1]
+            if len(bwd) == 0:
+                continue
+            sign[bwd] = 0
+            accepted = (sforward[bwd] + stotal[bwd]) > 0.2
+            rejected = sid[bwd[~accepted]]
+            if len(rejected) > 0:
+                # release the cells claimed by rejected streamlines
+                released = np.isin(owner, rejected)
+                blank[released] = False
+                owner[released] = -1
+            blank[seed[bwd[accepted]]] = True
+            for k in bwd[accepted]:
+                nf, nb = npoints[1][k], npoints[-1][k]
+                sx = np.concatenate([traj[-1][0][nb - 1::-1, k] if nb else [],
+                    traj[1][0][1:nf, k]])
+                sy = np.concatenate([traj[-1][1][nb - 1::-1, k] if nb else [],
+                    traj[1][1][1:nf, k]])
+                if len(sx) > 0:
+                    streamlines.append((sid[k], sx, sy))
+
+    if len(streamlines) == 0:
+        return np.array([]), np.array([])
+    streamlines.sort(key=lambda t: t[0])
+    nan = np.array([np.nan])
+    xs = np.concatenate([t for _, sx, _ in streamlines for t in (sx, nan)])
+    ys = np.concatenate([t for _, _, sy in streamlines for t in (sy, nan)])
+    return xs[:-1] * DX + XOFF, ys[:-1] * DY + YOFF
+
+
+def compute_streamlines_arrows(xs, ys, angle=None, arrow_scale=0.09):
+    """Return the arrow heads of the streamlines computed by
+    ``compute_streamlines``, one for each streamline, located at 1/3 of
+    its length. This follows the approach of Plotly's
+    ``create_streamline``.
+
+    Parameters
+    ==========
+        xs, ys : np.ndarray
+            1D arrays with the coordinates of the streamlines, separated by
+            NaN values.
+        angle : float
+            Angle of the arrow heads. Default to pi/9.
+        arrow_scale : float
+            Length of the arrow heads. Default to 0.09.
+
+    Returns
+    =======
+        x, y : np.ndarray
+            1D arrays with the coordinates of the arrow heads, separated by
+            NaN values.
+    """
+    np = import_module('numpy')
+
+    if angle is None:
+        angle = np.pi / 9
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    if len(xs) == 0:
+        return np.array([]), np.array([])
+    # start and length of each streamline
+    breaks = np.flatnonzero(np.isnan(xs))
+    starts = np.concatenate([[0], breaks + 1])
+    lengths = np.concatenate([breaks, [len(xs)]]) - starts
+    end = starts + lengths // 3
+    start = starts + (lengths // 3 - 1) % lengths
+    ex, ey = xs[end], ys[end]
+    dx, dy = ex - xs[start], ey - ys[start]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ang = np.arctan(dy / dx)
+    direction = np.where(dx >= 0, -1, 1)
+    nan = np.full(len(ex), np.nan)
+    ax = np.stack([
+        ex + direction * np.cos(ang + angle) * arrow_scale, ex,
+        ex + direction * np.cos(ang - angle) * arrow_scale, nan], axis=1)
+    ay = np.stack([
+        ey + direction * np.sin(ang + angle) * arrow_scale, ey,
+        ey + direction * np.sin(ang - angle) * arrow_scale, nan], axis=1)
+    return ax.flatten()[:-1], ay.flatten()[:-1]
 
 
 def get_seeds_points_entry_vector(xx, yy, zz, uu, vv, ww):
@@ -306,7 +617,8 @@ def get_seeds_points_entry_vector(xx, yy, zz, uu, vv, ww):
     Parameters
     ==========
         xx, yy, zz: np.ndarray
-            3D discretization of the space from meshgrid.
+            3D discretization of the space from
+            ``meshgrid(..., indexing="ij")``.
 
         uu, vv, ww: np.ndarray
             Vector components calculated at the discretized points in space.
@@ -314,59 +626,76 @@ def get_seeds_points_entry_vector(xx, yy, zz, uu, vv, ww):
     Returns
     =======
         points : np.ndarray
-            [n x 3] matrix of seed-points coordinates.
+            [n x 3] matrix of seed-points coordinates: the points of the
+            boundary of the domain where the vectors are entering the
+            domain. Points shared by multiple faces appear once.
     """
     np = import_module('numpy')
 
-    coords = np.stack([xx, yy, zz])
-    # vector field
-    vf = np.stack([uu, vv, ww])
-
-    # extract the coordinate of the points at planes:
-    # x_min, x_max, y_min, y_max, z_min, z_max
-    c_xmin = coords[:, :, 0, :]
-    c_xmax = coords[:, :, -1, :]
-    c_ymin = coords[:, 0, :, :]
-    c_ymax = coords[:, -1, :, :]
-    c_zmin = coords[:, :, :, 0]
-    c_zmax = coords[:, :, :, -1]
-
-    # extract the vector field points at planes:
-    # x_min, x_max, y_min, y_max, z_min, z_max
-    vf_xmin = vf[:, :, 0, :]
-    vf_xmax = vf[:, :, -1, :]
-    vf_ymin = vf[:, 0, :, :]
-    vf_ymax = vf[:, -1, :, :]
-    vf_zmin = vf[:, :, :, 0]
-    vf_zmax = vf[:, :, :, -1]
-
-    def find_points_at_input_vectors(vf_plane, coords, i, sign="g"):
-        check = {
-            "g": lambda x: x > 0,
-            "l": lambda x: x < 0,
-        }
-        # extract coordinates where the vectors are entering the plane
-        tmp = np.where(
-            check[sign](vf_plane[i, :, :]), coords, np.nan * np.zeros_like(coords)
-        )
-        # reshape the matrix to obtain an [n x 3] array of coordinates
-        tmp = np.array(
-            [tmp[0, :, :].flatten(), tmp[1, :, :].flatten(), tmp[2, :, :].flatten()]
-        ).T
-        # remove NaN entries
-        tmp = [a for a in tmp if not np.all([np.isnan(t) for t in a])]
-        return tmp
-
-    p_xmin = find_points_at_input_vectors(vf_xmin, c_xmin, 0, "g")
-    p_xmax = find_points_at_input_vectors(vf_xmax, c_xmax, 0, "l")
-    p_ymin = find_points_at_input_vectors(vf_ymin, c_ymin, 1, "g")
-    p_ymax = find_points_at_input_vectors(vf_ymax, c_ymax, 1, "l")
-    p_zmin = find_points_at_input_vectors(vf_zmin, c_zmin, 2, "g")
-    p_zmax = find_points_at_input_vectors(vf_zmax, c_zmax, 2, "l")
-    # TODO: there could be duplicates
-    points = np.array(p_xmin + p_xmax + p_ymin + p_ymax + p_zmin + p_zmax)
-
-    return points
+    coords = np.stack([xx, yy, zz], axis=-1)
+    vf = np.stack([uu, vv, ww], axis=-1)
+
+    # faces x_min, x_max, y_min, y_max, z_min, z_max: the vector enters the
+    # domain if its normal component is positive on the min-face and
+    # negative on the max-face
+    points = []
+    for d in range(3):
+        for side, sign in [(0, 1), (-1, -1)]:
+            c = np.take(coords, side, axis=d)
+            entering = sign * np.take(vf[..., d], side, axis=d) > 0
+            points.append(c[entering])
+    points = np.concatenate(points).reshape(-1, 3)
+
+    # remove duplicates along the edges, preserving the order
+    _, idx = np.unique(points, axis=0, return_index=True)
+    return points[np.sort(idx)]
+
+
+def _get_seeds_points_random(bounds, npoints, radius, rng):
+    """Uniformly distributed random points inside the domain or, if
+    ``radius`` is given, inside a sphere centered in the domain.
+    """
+    np = import_module('numpy')
+
+    lo, hi = bounds
+    if not radius:
+        return lo + (hi - lo) * rng.random((npoints, 3))
+    direction = rng.standard_normal((npoints, 3))
+    direction /= np.linalg.norm(direction, axis=1)[:, None]
+    r = radius * np.cbrt(rng.random(npoints))
+    return (lo + hi) / 2 + direction * r[:, None]
+
+
+def _get_seeds_points_poisson(bounds, npoints, rng, batch_size=None,
+    max_iterations=30):
+    """Random points inside the domain whose mutual distance is greater
+    than a threshold computed from the volume of the domain and the
+    requested number of points (Poisson-disk sampling). Candidates are
+    drawn and checked in batches.
+    """
+    np = import_module('numpy')
+    scipy = import_module('scipy', import_kwargs={'fromlist': ['spatial']})
+    cKDTree = scipy.spatial.cKDTree
+
+    lo, hi = bounds
+    volume = np.prod(np.where(hi > lo, hi - lo, 1))
+    distance = 0.6 * np.cbrt(volume / npoints)
+    batch_size = batch_size if batch_size else 2 * npoints
+    points = np.zeros((0, 3))
+    for _ in range(max_iterations):
+        candidates = lo + (hi - lo) * rng.random((batch_size, 3))
+        if len(points) > 0:
+            d, _ = cKDTree(points).query(candidates)
+            candidates = candidates[d >= distance]
+        # candidates too close to each other: keep the first one
+        pairs = cKDTree(candidates).query_pairs(distance,
+            output_type="ndarray")
+        keep = np.ones(len(candidates), dtype=bool)
+        keep[pairs.max(axis=1)] = False
+        points = np.concatenate([points, candidates[keep]])
+        if len(points) >= npoints:
+            break
+    return points[:npoints]
 
 
 def get_seeds_points(xx, yy, zz, uu, vv, ww, to_numpy=True, **kw):
@@ -382,7 +711,19 @@ def get_seeds_points(xx, yy, zz, uu, vv, ww, to_numpy=True, **kw):
         a vtk object representing seeds points.
 
     kw : dict
-        Keyword arguments controlling the generation of streamlines.
+        Keyword arguments controlling the generation of streamlines:
+
+        - ``starts``: the seeding strategy. ``None`` (default) uses the
+          points of the boundary where the vectors are entering the domain.
+          A dictionary with keys ``"x", "y", "z"`` contains the coordinates
+          of the seeds. ``True`` or ``"random"`` generates uniformly
+          distributed random seeds, ``"poisson"`` generates random seeds
+          with a minimum mutual distance (Poisson-disk sampling).
+        - ``npoints``: number of random seeds. Default to 200.
+        - ``radius``: if given, uniformly distributed random seeds are
+          generated inside a sphere of this radius centered in the domain.
+        - ``seed``: seed of the random number generator, to get
+          reproducible random seeds. Default to None.
 
 
     Returns
@@ -392,29 +733,27 @@ def get_seeds_points(xx, yy, zz, uu, vv, ww, to_numpy=True, **kw):
         Depending on the value of ``to_numpy``:
 
         - ``True``: numpy matrix [N x 3] of x-y-z coordinates of the
-          streamtubes, which also contains NaN values. Think of the streamtubes
-          as a single long tube: NaN values separate the different sections.
+          seeds points.
         - ``False``: a vtk object representing the seeds points.
 
     """
     np = import_module('numpy')
-    import vtk
-    from vtk.util import numpy_support
     starts = kw.get("starts", None)
 
-    if starts is None:
-        points = get_seeds_points_entry_vector(xx, yy, zz, uu, vv, ww)
-
-        if to_numpy:
-            return points
-
-        seeds = vtk.vtkPolyData()
+    def to_vtk(points):
+        import vtk
+        from vtk.util import numpy_support
         vtk_points = vtk.vtkPoints()
-        for p in points:
-            vtk_points.InsertNextPoint(p)
+        vtk_points.SetData(numpy_support.numpy_to_vtk(
+            np.ascontiguousarray(points, dtype=float).reshape(-1, 3),
+            deep=True))
+        seeds = vtk.vtkPolyData()
         seeds.SetPoints(vtk_points)
         return seeds
 
+    if starts is None:
+        points = get_seeds_points_entry_vector(xx, yy, zz, uu, vv, ww)
+
     elif isinstance(starts, dict):
         if not all([t in starts.keys() for t in ["x", "y", "z"]]):
             raise KeyError(
@@ -427,54 +766,140 @@ def get_seeds_points(xx, yy, zz, uu, vv, ww, to_numpy=True, **kw):
             for t in [x, y, z]]
         points = np.array([x, y, z]).T
 
-        if to_numpy:
-            return points
-
-        seeds = vtk.vtkPolyData()
-        seeds_points = vtk.vtkPoints()
-        for p in points:
-            seeds_points.InsertNextPoint(p)
-        seeds.SetPoints(seeds_points)
-        return seeds
+    elif isinstance(starts, str) and (starts not in ["random", "poisson"]):
+        raise ValueError(
+            "``starts`` must be None, a dictionary, True, 'random' or "
+            + "'poisson'. Received: {}".format(starts))
 
     else:
-        # generate a random cloud of points
         npoints = kw.get("npoints", 200)
         radius = kw.get("radius", None)
-        center = 0, 0, 0
-
-        if not radius:
-            xmin, xmax = min(xx[0, :, 0]), max(xx[0, :, 0])
-            ymin, ymax = min(yy[:, 0, 0]), max(yy[:, 0, 0])
-            zmin, zmax = min(zz[0, 0, :]), max(zz[0, 0, :])
-            radius = max(
-                [abs(xmax - xmin), abs(ymax - ymin), abs(zmax - zmin)]
-            )
-            center = (xmax - xmin) / 2, (ymax - ymin) / 2, (zmax - zmin) / 2
+        bounds = (np.array([np.amin(t) for t in [xx, yy, zz]]),
+            np.array([np.amax(t) for t in [xx, yy, zz]]))
+
+        if (not isinstance(starts, str)) and (not to_numpy):
+            import vtk
+            seeds = vtk.vtkPointSource()
+            if radius:
+                seeds.SetRadius(radius)
+            else:
+                seeds.SetRadius(np.amax(bounds[1] - bounds[0]))
+            seeds.SetCenter(*((bounds[0] + bounds[1]) / 2))
+            seeds.SetNumberOfPoints(npoints)
+            return seeds
+
+        rng = np.random.default_rng(kw.get("seed", None))
+        if starts == "poisson":
+            points = _get_seeds_points_poisson(bounds, npoints, rng)
+        else:
+            points = _get_seeds_points_random(bounds, npoints, radius, rng)
 
-        seeds = vtk.vtkPointSource()
-        seeds.SetRadius(radius)
-        seeds.SetCenter(*center)
-        seeds.SetNumberOfPoints(npoints)
+    if to_numpy:
+        return points
+    return to_vtk(points)
 
-        if to_numpy:
-            seeds.Update()
-            source = seeds.GetOutput()
-            # Extract the points from the point cloud.
-            points = numpy_support.vtk_to_numpy(source.GetPoints().GetData())
-            return points
 
-        return seeds
+def _trilinear_interpolator(x, y, z, field):
+    """Return a function evaluating the trilinear interpolation of ``field``
+    (shape [len(x), len(y), len(z), k]) at many points at once. The
+    function also returns a mask of the points inside the domain.
+    """
+    np = import_module('numpy')
+
+    axes = [x, y, z]
+    n = np.array([len(t) for t in axes])
+    lo, hi = np.array([t[0] for t in axes]), np.array([t[-1] for t in axes])
+    indices = [np.arange(len(t), dtype=float) for t in axes]
+    strides = np.array([n[1] * n[2], n[2], 1])
+    k = field.shape[-1]
+    values = field.reshape(-1, k)
+    # flat offsets of the 8 corners of a cell, x-major
+    offsets = np.array([i * strides[0] + j * strides[1] + l
+        for i in (0, 1) for j in (0, 1) for l in (0, 1)])
+
+    uniform = all(np.allclose(np.diff(t), t[1] - t[0]) for t in axes)
+    scale = (n - 1) / (hi - lo)
+
+    def interpolate(p):
+        # fractional indices of the points
+        if uniform:
+            P = (p - lo) * scale
+        else:
+            P = np.stack([np.interp(p[:, d], axes[d], indices[d])
+                for d in range(3)], axis=1)
+        inside = ((p >= lo) & (p <= hi)).all(axis=1)
+        i = np.clip(P.astype(int), 0, n - 2)
+        t = (P - i)[:, :, None, None]
+        c = values[(i @ strides)[:, None] + offsets]
+        # successive linear interpolations along x, y and z
+        c = c.reshape(-1, 2, 4, k)
+        c = c[:, 0] + (c[:, 1] - c[:, 0]) * t[:, 0]
+        c = c.reshape(-1, 2, 2, k)
+        c = c[:, 0] + (c[:, 1] - c[:, 0]) * t[:, 1]
+        return c[:, 0] + (c[:, 1] - c[:, 0]) * t[:, 2, 0], inside
+
+    return interpolate
+
+
+def _integrate_streamlines(interpolate, seeds, signs, step, max_prop,
+    max_steps=2000, terminal_speed=1e-12):
+    """Integrate many streamlines together with a RK4 method, where each
+    step has a length of ``step`` (in space units). Return the points
+    (and their speed) of each streamline as an array of shape
+    [max_steps + 1, len(seeds), 4], and the number of points of each
+    streamline.
+    """
+    np = import_module('numpy')
+
+    N = len(seeds)
+    buffer = np.full((max_steps + 1, N, 4), np.nan)
+    npoints = np.zeros(N, dtype=int)
+    idx = np.arange(N)
+    p = np.asarray(seeds, dtype=float)
+    v, inside = interpolate(p)
+    speed = np.linalg.norm(v, axis=1)
+    length = np.zeros(N)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for n in range(max_steps + 1):
+            # store the current points, and stop the streamlines that left
+            # the domain or reached a stagnation point
+            ok = inside & (speed > terminal_speed)
+            buffer[n, idx[inside], :3] = p[inside]
+            buffer[n, idx[inside], 3] = speed[inside]
+            npoints[idx[inside]] += 1
+            ok &= length < max_prop
+            if n == max_steps:
+                break
+            idx, p, v, speed, length = [
+                t[ok] for t in [idx, p, v, speed, length]]
+            if len(idx) == 0:
+                break
+
+            # time step such that the streamline advances by ``step``
+            dt = (signs[idx] * step / speed)[:, None]
+            k1 = v
+            k2, ok2 = interpolate(p + 0.5 * dt * k1)
+            k3, ok3 = interpolate(p + 0.5 * dt * k2)
+            k4, ok4 = interpolate(p + dt * k3)
+            p = p + dt * (k1 + 2 * k2 + 2 * k3 + k4) / 6
+            v, inside = interpolate(p)
+            inside &= ok2 & ok3 & ok4
+            speed = np.linalg.norm(v, axis=1)
+            length = length + step
+
+    return buffer, npoints
 
 
 def compute_streamtubes(xx, yy, zz, uu, vv, ww, kwargs):
-    """ Leverage vtk to compute streamlines in a 3D vector field.
+    """ Compute streamlines in a 3D vector field.
 
     Parameters
     ==========
 
     xx, yy, zz, uu, vv, ww : np.ndarray [n x m x r]
-        Discretized volume and vector components
+        Discretized volume (``np.meshgrid(..., indexing="ij")``) and vector
+        components.
 
     kwargs : dict
         Keyword arguments passed to the backend.
@@ -498,10 +923,7 @@ def compute_streamtubes(xx, yy, zz, uu, vv, ww, kwargs):
 
     To compute streamlines in a 3D vector field there are multiple options:
 
-    * custom built integrator. Requires times to be implemented and properly
-      tested.
-    * vtk, which is an "heavy" dependency (around 60MB) and (within this
-      module) is only used to compute streamlines in 3D vector fields.
+    * vtk, which is an "heavy" dependency (around 60MB).
     * yt, which is also an "heavy" dependency (around 60MB).
     * one may erroneously think of Plotly as an alternative. Turns out that
       Plotly uses a
@@ -509,31 +931,19 @@ def compute_streamtubes(xx, yy, zz, uu, vv, ww, kwargs):
       it is very difficult or impossible to extract the necessary mesh data
       directly from Python.
 
-    Hence, vtk is used. The interface provided by this function deliberately
-    extend the one provided by Plotly's Streamtube class. Read ``plot_vector``
-    docstring for more information.
+    Hence, a custom integrator is used, which follows the approach of vtk's
+    ``vtkStreamTracer``: all the seeds are integrated together with a RK4
+    method and a trilinear interpolation of the vector field, with an
+    integration step equal to half the length of a cell. The interface
+    provided by this function deliberately extend the one provided by
+    Plotly's Streamtube class. Read ``plot_vector`` docstring for more
+    information.
     """
     np = import_module('numpy')
-    import vtk
-    from vtk.util import numpy_support
-    n2, n1, n3 = xx.shape
-
-    vector_field = np.array([uu.flatten(), vv.flatten(), ww.flatten()]).T
-    vtk_vector_field = numpy_support.numpy_to_vtk(
-        num_array=vector_field, deep=True, array_type=vtk.VTK_FLOAT)
-    vtk_vector_field.SetName("vector_field")
-
-    points = vtk.vtkPoints()
-    points.SetNumberOfPoints(n2 * n1 * n3)
-    for i, (x, y, z) in enumerate(
-        zip(xx.flatten(), yy.flatten(), zz.flatten())
-    ):
-        points.SetPoint(i, [x, y, z])
-
-    grid = vtk.vtkStructuredGrid()
-    grid.SetDimensions([n2, n1, n3])
-    grid.SetPoints(points)
-    grid.GetPointData().SetVectors(vtk_vector_field)
+
+    x, y, z = xx[:, 0, 0], yy[0, :, 0], zz[0, 0, :]
+    field = np.stack([uu, vv, ww], axis=-1).astype(float)
+    interpolate = _trilinear_interpolator(x, y, z, field)
 
     # copy the dictionary: if multiple vector fields are being plotted
     # simultaneously, we need the original again.
@@ -541,65 +951,44 @@ def compute_streamtubes(xx, yy, zz, uu, vv, ww, kwargs):
     starts = kwargs.get("starts", None)
     max_prop = kwargs.pop("max_prop", 5000)
 
-    streamer = vtk.vtkStreamTracer()
-    streamer.SetInputData(grid)
-    streamer.SetMaximumPropagation(max_prop)
-
     seeds = get_seeds_points(xx, yy, zz, uu, vv, ww,
-        to_numpy=False, **kwargs)
-
-    if starts is None:
-        streamer.SetSourceData(seeds)
-        streamer.SetIntegrationDirectionToForward()
-    elif isinstance(starts, dict):
-        streamer.SetSourceData(seeds)
-        streamer.SetIntegrationDirectionToBoth()
+        to_numpy=True, **kwargs)
+    seeds = np.asarray(seeds, dtype=float).reshape(-1, 3)
+    # seeds on the boundary are integrated forward, user-provided or random
+    # seeds are integrated in both directions
+    directions = [1] if starts is None else [-1, 1]
+    S = len(seeds)
+    signs = np.repeat(directions, S)
+
+    step = 0.5 * np.sqrt(sum(((t[-1] - t[0]) / max(len(t) - 1, 1)) ** 2
+        for t in [x, y, z]))
+    buffer, npoints = _integrate_streamlines(interpolate,
+        np.tile(seeds, (len(directions), 1)), signs, step, max_prop)
+    # shape [S, steps, 4]
+    buffer = buffer.transpose(1, 0, 2)
+    steps = np.arange(buffer.shape[1])
+
+    parts, masks = [], []
+    if starts is not None:
+        # backward streamlines are reversed, without their seed point
+        nb = npoints[:S]
+        parts.append(buffer[:S, ::-1])
+        masks.append((steps[::-1] < nb[:, None]) & (steps[::-1] > 0))
+        nf = npoints[S:]
+        total = nf + np.maximum(nb - 1, 0)
     else:
-        streamer.SetSourceConnection(seeds.GetOutputPort())
-        streamer.SetIntegrationDirectionToBoth()
-
-    streamer.SetComputeVorticity(0)
-    streamer.SetIntegrator(vtk.vtkRungeKutta4())
-    streamer.Update()
-
-    streamline = streamer.GetOutput()
-    streamlines_points = numpy_support.vtk_to_numpy(
-        streamline.GetPoints().GetData())
-    streamlines_velocity = numpy_support.vtk_to_numpy(
-        streamline.GetPointData().GetArray("vector_field"))
-    streamlines_speed = np.linalg.norm(streamlines_velocity, axis=1)
-
-    vtkLines = streamline.GetLines()
-    vtkLines.InitTraversal()
-    point_list = vtk.vtkIdList()
-
-    # extract vtk data to lists
-    lines = []
-    lines_attributes = []
-    while vtkLines.GetNextCell(point_list):
-        start_id = point_list.GetId(0)
-        end_id = point_list.GetId(point_list.GetNumberOfIds() - 1)
-        l = []
-        v = []
-
-        for i in range(start_id, end_id):
-            l.append(streamlines_points[i])
-            v.append(streamlines_speed[i])
-
-        lines.append(np.array(l))
-        lines_attributes.append(np.array(v))
-
-    # create a matrix of coordinates from all the lines previously extracted.
-    # NaN values will be used by the backends to separate the different
-    # streamtubes
-    count = sum([len(l) for l in lines])
-    vertices = np.nan * np.zeros((count + (len(lines) - 1), 3))
-    attributes = np.zeros(count + (len(lines) - 1))
-    c = 0
-    for k, (l, a) in enumerate(zip(lines, lines_attributes)):
-        vertices[c : c + len(l), :] = l
-        attributes[c : c + len(l)] = a
-        if k < len(lines) - 1:
-            c = c + len(l) + 1
-
-    return vertices, attributes
+        nf = total = npoints
+    parts.append(buffer[-S:])
+    masks.append(steps < nf[:, None])
+    # streamlines with less than two points are discarded
+    keep = total > 1
+    masks = [m & keep[:, None] for m in masks]
+    parts.append(np.full((S, 1, 4), np.nan))
+    masks.append(keep[:, None])
+
+    data = np.concatenate(parts, axis=1)[np.concatenate(masks, axis=1)]
+    if len(data) == 0:
+        return np.zeros((0, 3)), np.zeros(0)
+    # remove the last separator
+    data = data[:-1]
+    return data[:, :3], data[:, 3]
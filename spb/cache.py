@@ -0,0 +1,244 @@
+"""A process-wide cache of the functions generated by ``lambdify``.
+
+Code generation and ``exec`` make ``lambdify`` an expensive operation.
+When the same plots are rebuilt over and over (for example, when serving
+an interactive application), most of the time would be spent compiling
+the very same expressions. The functions of this module keep a bounded,
+least recently used cache of the compiled functions.
+
+The module also implements ``DataCache``, a least recently used cache of
+numerical data bounded by a memory budget, which is used by interactive
+plots to store the data associated to the visited parameters.
+
+Examples
+========
+
+Inspect the cache statistics and clear the cache:
+
+>>> from spb.cache import cache_info, clear
+>>> from spb import plot
+>>> from sympy.abc import x
+>>> clear()
+>>> p = plot(x**2, adaptive=False, show=False)
+>>> _ = p[0].get_data()
+>>> p = plot(x**2, adaptive=False, show=False)
+>>> _ = p[0].get_data()
+>>> cache_info()
+CacheInfo(hits=1, misses=1, maxsize=256, currsize=1)
+"""
+
+from collections import OrderedDict, namedtuple
+from threading import RLock
+import sys
+from sympy import lambdify as sympy_lambdify
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _freeze(obj):
+    """Recursively convert ``obj`` to a hashable object, so that it can be
+    used as part of a cache key. Raise ``TypeError`` if it is not possible.
+    """
+    if isinstance(obj, dict):
+        return (dict, tuple(sorted(
+            ((_freeze(k), _freeze(v)) for k, v in obj.items()), key=str)))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj), tuple(_freeze(t) for t in obj))
+    hash(obj)
+    return obj
+
+
+def _printer_key(printer):
+    """The generated code depends on the printer class and its settings."""
+    if printer is None:
+        return None
+    if isinstance(printer, type):
+        return printer
+    return (type(printer), _freeze(getattr(printer, "_settings", {})))
+
+
+class LambdifyCache:
+    """Bounded least recently used cache of lambdified functions.
+
+    The key is made of the structural hash of the expression, the ordered
+    symbols representing the signature of the function, the ``modules``
+    value, the printer and the ``dummify`` flag.
+
+    Parameters
+    ==========
+
+    maxsize : int
+        Maximum number of compiled functions to be stored. When the cache
+        is full, the least recently used function is discarded. If
+        ``maxsize=0``, the cache is disabled.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, args, expr, modules, printer, dummify):
+        try:
+            return (_freeze(args), expr, _freeze(modules),
+                _printer_key(printer), dummify)
+        except TypeError:
+            # unhashable expressions or modules
+            return None
+
+    def lambdify(self, args, expr, modules=None, printer=None,
+        dummify=False):
+        """Return the lambdified function, compiling it only if it is not
+        already in the cache. Look at ``sympy.lambdify`` for the meaning
+        of the parameters.
+        """
+        key = self._key(args, expr, modules, printer, dummify)
+        if (key is None) or (self.maxsize <= 0):
+            return sympy_lambdify(args, expr, modules=modules,
+                printer=printer, dummify=dummify)
+
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+
+        func = sympy_lambdify(args, expr, modules=modules, printer=printer,
+            dummify=dummify)
+
+        with self._lock:
+            self._cache[key] = func
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return func
+
+    def info(self):
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                len(self._cache))
+
+    def clear(self):
+        """Remove all the compiled functions and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _nbytes(obj):
+    """Approximate memory used by the arrays contained in ``obj``."""
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(t) for t in obj)
+    return sys.getsizeof(obj)
+
+
+class DataCache:
+    """Least recently used cache of numerical data, bounded by a memory
+    budget. When a new item doesn't fit in the budget, the least recently
+    used items are discarded.
+
+    Parameters
+    ==========
+
+    max_memory : int
+        Memory budget in bytes. Items larger than the budget are not
+        stored. If ``max_memory=0``, the cache is disabled.
+    """
+
+    def __init__(self, max_memory=0):
+        self.max_memory = int(max_memory or 0)
+        self._cache = OrderedDict()
+        self._lock = RLock()
+        self._memory = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the data associated to ``key``, or None."""
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key][0]
+            self.misses += 1
+            return None
+
+    def put(self, key, data):
+        """Store ``data``, discarding the least recently used items if the
+        memory budget is exceeded.
+        """
+        nbytes = _nbytes(data)
+        if nbytes > self.max_memory:
+            return
+        with self._lock:
+            if key in self._cache:
+                self._memory -= self._cache.pop(key)[1]
+            self._cache[key] = (data, nbytes)
+            self._memory += nbytes
+            while self._memory > self.max_memory:
+                self._memory -= self._cache.popitem(last=False)[1][1]
+
+    def info(self):
+        """Return the cache statistics. ``maxsize`` and ``currsize`` are
+        expressed in bytes.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.max_memory,
+                self._memory)
+
+    def clear(self):
+        """Remove all the data and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._memory = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class LazyLambdify:
+    """Defer the compilation of a lambdified function until it is called
+    for the first time. This is useful for fallback functions (for example,
+    the ones using ``modules="sympy"``), which are rarely needed.
+    """
+
+    def __init__(self, args, expr, **kwargs):
+        self._args = args
+        self._expr = expr
+        self._kwargs = kwargs
+        self._func = None
+
+    def __call__(self, *args):
+        if self._func is None:
+            self._func = lambdify(self._args, self._expr, **self._kwargs)
+        return self._func(*args)
+
+
+lambdify_cache = LambdifyCache()
+
+
+def lambdify(args, expr, modules=None, printer=None, dummify=False):
+    """Cached version of ``sympy.lambdify``. Look at its documentation
+    for the meaning of the parameters.
+    """
+    return lambdify_cache.lambdify(args, expr, modules=modules,
+        printer=printer, dummify=dummify)
+
+
+def cache_info():
+    """Return a named tuple with the statistics of the lambdify cache:
+    ``hits, misses, maxsize, currsize``.
+    """
+    return lambdify_cache.info()
+
+
+def clear():
+    """Clear the lambdify cache."""
+    lambdify_cache.clear()
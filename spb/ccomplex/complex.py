@@ -376,6 +376,12 @@ def plot_real_imag(*args, **kwargs):
         Default value to 0.1. Before changing this value, it is better to
         increase the number of discretization points.
 
+    poles_refinement : int, optional
+        Number of refinement passes of the `detect_poles` algorithm. At each
+        pass, the segments flagged as discontinuities are re-sampled with ten
+        times the resolution, so that poles are located more accurately
+        without increasing `n`. Default to 0.
+
     imag : boolean, optional
         If True, plot the imaginary part of the complex function.
         Default to True.
@@ -16,11 +16,19 @@ np = import_module('numpy')
 
 
 def to_rgb_255(func):
-    """Convert a Numpy array with values in the range [0, 1] to [0, 255]."""
+    """Convert a Numpy array with values in the range [0, 1] to [0, 255].
+    With ``rgba=True``, the colors are written into an RGBA array with a
+    fully opaque alpha channel.
+    """
 
-    def wrapper(*args, **kwargs):
+    def wrapper(*args, rgba=False, **kwargs):
         rgb = func(*args, **kwargs)
-        return (rgb * 255).astype(np.uint8)
+        if not rgba:
+            return (rgb * 255).astype(np.uint8)
+        img = np.empty((*rgb.shape[:-1], 4), dtype=np.uint8)
+        np.multiply(rgb, 255, out=img[..., :3], casting="unsafe")
+        img[..., 3] = 255
+        return img
 
     return wrapper
 
@@ -208,7 +216,7 @@ def create_colorscale(N=256):
     return colorscale
 
 
-def wegert(coloring, w, phaseres=20, N=256):
+def wegert(coloring, w, phaseres=20, N=256, rgba=False):
     """ Choose between different domain coloring options.
 
     Parameters
@@ -247,11 +255,16 @@ def wegert(coloring, w, phaseres=20, N=256):
     N : int
         Number of discretized color in the colorscale. Default to 256.
 
+    rgba : boolean
+        If True, return an image of RGBA colors with a fully opaque alpha
+        channel, which can be packed by ``spb.backends.utils.pack_rgba``
+        without copies. Default to False.
+
     Returns
     =======
 
-    img : np.ndarray [n x m x 3]
-        An array of RGB colors (0 <= R,G,B <= 255)
+    img : np.ndarray [n x m x 3] or [n x m x 4]
+        An array of RGB (or RGBA) colors (0 <= R,G,B <= 255)
 
     colorscale : np.ndarray [N x 3] or None
         RGB colors to be used in the colorscale. If the function computes
@@ -277,5 +290,5 @@ def wegert(coloring, w, phaseres=20, N=256):
         )
     func, create_cc = mapping[coloring]
     if create_cc:
-        return func(w, phaseres), create_colorscale(N)
-    return func(w, phaseres), None
+        return func(w, phaseres, rgba=rgba), create_colorscale(N)
+    return func(w, phaseres, rgba=rgba), None
@@ -99,6 +99,17 @@ def _hardcoded_defaults():
             # tick (value False) or only when the mouse click is released
             # (value True)
             "throttled": False,
+            # If True, the numerical evaluation is executed on a background
+            # thread and only the latest parameters are rendered. If False,
+            # each update blocks the widgets until the figure is updated
+            "asynchronous": False,
+            # If True, a low resolution preview is rendered while the
+            # parameters are changing. Can also be an integer, the
+            # decimation step of the preview.
+            "progressive": False,
+            # Memory budget (in bytes) of the cache storing the numerical
+            # data associated to the visited parameters. 0 disables it.
+            "cache_memory": 100 * 2**20,
             # If True, the interactive application will be served on a new
             # browser window, otherwise it will be shown on Jupyter Notebook
             "servable": False,
@@ -126,6 +137,23 @@ def _hardcoded_defaults():
             # set the default plot range
             "min": -10,
             "max": 10
+        },
+
+        # settings about the numerical evaluation of the data series
+        evaluation={
+            # How the backends evaluate multiple data series before
+            # rendering them. Possible values: "serial", "thread", "process"
+            "executor": "serial",
+            # Maximum number of workers used by the "thread" and "process"
+            # executors. If None, use the default of concurrent.futures.
+            "max_workers": None,
+            # Maximum number of points evaluated at once by 2D/3D uniform
+            # meshes. Larger domains are evaluated block by block.
+            # If None, the whole domain is evaluated with a single call.
+            "chunk_size": None,
+            # Approximate memory budget (in bytes) for the temporary arrays
+            # created by the evaluation of each block. None means no limit.
+            "max_memory": None
         }
     )
 
@@ -305,9 +305,11 @@ def plot(*args, **kwargs):
             plotting library (backend) manual for more informations.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn1]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the segments are recursively refined where
+        the line bends. Use `tolerance` and `max_points` to further customize
+        the output. If `loss_fn` or a callable `adaptive_goal` are provided,
+        the adaptive algorithm implemented in [#fn1]_ is used instead.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -350,6 +352,12 @@ def plot(*args, **kwargs):
         Default value to 0.1. Before changing this value, it is recommended to
         increase the number of discretization points.
 
+    poles_refinement : int, optional
+        Number of refinement passes of the `detect_poles` algorithm. At each
+        pass, the segments flagged as discontinuities are re-sampled with ten
+        times the resolution, so that poles are located more accurately
+        without increasing `n`. Default to 0.
+
     is_point : boolean, optional
         Default to False, which will render a line connecting all the points.
         If True, a scatter plot will be generated.
@@ -373,6 +381,17 @@ def plot(*args, **kwargs):
         * callable : Refer to [#fn1]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
+    max_points : int, optional
+        Maximum number of evaluation points of the adaptive algorithm.
+        Default to 10000.
+
+    tolerance : float, optional
+        Used by the adaptive algorithm: a segment is refined if its midpoint
+        deviates from a straight line by more than `tolerance`, relative to
+        the size of the plot. The lower the number, the more evaluation
+        points. If not provided, the numeric value of `adaptive_goal` is
+        used (default to 0.01).
+
     n : int, optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
@@ -708,9 +727,11 @@ def plot_parametric(*args, **kwargs):
             plotting library (backend) manual for more informations.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn2]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the segments are recursively refined where
+        the line bends. Use `tolerance` and `max_points` to further customize
+        the output. If `loss_fn` or a callable `adaptive_goal` are provided,
+        the adaptive algorithm implemented in [#fn2]_ is used instead.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -763,6 +784,17 @@ def plot_parametric(*args, **kwargs):
         * callable : Refer to [#fn2]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
+    max_points : int, optional
+        Maximum number of evaluation points of the adaptive algorithm.
+        Default to 10000.
+
+    tolerance : float, optional
+        Used by the adaptive algorithm: a segment is refined if its midpoint
+        deviates from a straight line by more than `tolerance`, relative to
+        the size of the plot. The lower the number, the more evaluation
+        points. If not provided, the numeric value of `adaptive_goal` is
+        used (default to 0.01).
+
     n : int, optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
@@ -1007,9 +1039,11 @@ def plot3d_parametric_line(*args, **kwargs):
             plotting library (backend) manual for more informations.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn3]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the segments are recursively refined where
+        the line bends. Use `tolerance` and `max_points` to further customize
+        the output. If `loss_fn` or a callable `adaptive_goal` are provided,
+        the adaptive algorithm implemented in [#fn3]_ is used instead.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -1053,6 +1087,17 @@ def plot3d_parametric_line(*args, **kwargs):
         * callable : Refer to [#fn3]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
+    max_points : int, optional
+        Maximum number of evaluation points of the adaptive algorithm.
+        Default to 10000.
+
+    tolerance : float, optional
+        Used by the adaptive algorithm: a segment is refined if its midpoint
+        deviates from a straight line by more than `tolerance`, relative to
+        the size of the plot. The lower the number, the more evaluation
+        points. If not provided, the numeric value of `adaptive_goal` is
+        used (default to 0.01).
+
     n : int, optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
@@ -1317,9 +1362,12 @@ def plot3d(*args, **kwargs):
         strategy with number of discretization points `n1` and `n2` along the
         x and y directions, respectively.
 
-        Set adaptive to `True` to use the adaptive algorithm implemented in
-        [#fn4]_ to create smooth plots. Use `adaptive_goal` and `loss_fn`
-        to further customize the output.
+        Set adaptive to `True` to use an adaptive algorithm to create smooth
+        plots: the domain is recursively split into smaller cells where the
+        surface bends. Use `tolerance`, `max_points` and `adaptive_mesh` to
+        further customize the output. If `loss_fn` or a callable
+        `adaptive_goal` are provided, the adaptive algorithm implemented in
+        [#fn4]_ is used instead.
 
     adaptive_goal : callable, int, float or None
         Controls the "smoothness" of the evaluation. Possible values:
@@ -1332,6 +1380,12 @@ def plot3d(*args, **kwargs):
         * callable: a function requiring one input element, the learner. It
           must return a float number. Refer to [#fn4]_ for more information.
 
+    adaptive_mesh : boolean, optional
+        Only used when ``adaptive=True``. If False (default), the adaptive
+        results are interpolated over a uniform grid. If True, the backend
+        directly renders the triangular mesh produced by the adaptive
+        algorithm, which is lighter and captures the fine details.
+
     backend : Plot, optional
         A subclass of `Plot`, which will perform the rendering.
         Default to `MatplotlibBackend`.
@@ -1360,6 +1414,10 @@ def plot3d(*args, **kwargs):
         * callable : Refer to [#fn4]_ for more information. Specifically,
           look at `adaptive.learner.learnerND` to find more loss functions.
 
+    max_points : int, optional
+        Maximum number of evaluation points of the adaptive algorithm.
+        Default to 10000.
+
     n1 : int, optional
         The x range is sampled uniformly at `n1` of points. Default value
         is 100.
@@ -1400,6 +1458,13 @@ def plot3d(*args, **kwargs):
         Title of the plot. It is set to the latex representation of
         the expression, if the plot has only one expression.
 
+    tolerance : float, optional
+        Used by the adaptive algorithm: a cell is split if the surface
+        deviates from the linear interpolation of its corners by more than
+        `tolerance`, relative to the range of the z-values. The lower the
+        number, the more evaluation points. If not provided, the numeric
+        value of `adaptive_goal` is used (default to 0.01).
+
     tx : callable, optional
         Apply a numerical function to the discretized domain in the
         x-direction.
@@ -2782,9 +2847,11 @@ def plot_piecewise(*args, **kwargs):
             plotting library (backend) manual for more informations.
 
     adaptive : bool, optional
-        The default value is set to `True`, which uses the adaptive algorithm
-        implemented in [#fn5]_ to create smooth plots. Use `adaptive_goal`
-        and `loss_fn` to further customize the output.
+        The default value is set to `True`, which uses an adaptive algorithm
+        to create smooth plots: the segments are recursively refined where
+        the line bends. Use `tolerance` and `max_points` to further customize
+        the output. If `loss_fn` or a callable `adaptive_goal` are provided,
+        the adaptive algorithm implemented in [#fn5]_ is used instead.
 
         Set adaptive to `False` and specify `n` if uniform sampling is
         required.
@@ -2823,6 +2890,12 @@ def plot_piecewise(*args, **kwargs):
         Default value to 0.1. Before changing this value, it is recommended to
         increase the number of discretization points.
 
+    poles_refinement : int, optional
+        Number of refinement passes of the `detect_poles` algorithm. At each
+        pass, the segments flagged as discontinuities are re-sampled with ten
+        times the resolution, so that poles are located more accurately
+        without increasing `n`. Default to 0.
+
     label : str or list/tuple, optional
         The label to be shown in the legend. If not provided, the string
         representation of `expr` will be used. If a list/tuple is provided, the
@@ -2837,6 +2910,17 @@ def plot_piecewise(*args, **kwargs):
         * callable : Refer to [#fn5]_ for more information. Specifically,
           look at `adaptive.learner.learner1D` to find more loss functions.
 
+    max_points : int, optional
+        Maximum number of evaluation points of the adaptive algorithm.
+        Default to 10000.
+
+    tolerance : float, optional
+        Used by the adaptive algorithm: a segment is refined if its midpoint
+        deviates from a straight line by more than `tolerance`, relative to
+        the size of the plot. The lower the number, the more evaluation
+        points. If not provided, the numeric value of `adaptive_goal` is
+        used (default to 0.01).
+
     n : int, optional
         Used when the `adaptive` is set to `False`. The function is uniformly
         sampled at `n` number of points. Default value to 1000.
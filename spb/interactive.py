@@ -1,4 +1,5 @@
 from spb.defaults import TWO_D_B, THREE_D_B, cfg
+from spb.cache import DataCache, _freeze
 from spb.ccomplex.complex import _build_series as _build_complex_series
 from spb.functions import _set_labels
 from spb.series import InteractiveSeries, _set_discretization_points
@@ -6,7 +7,10 @@ from spb.vectors import _preprocess, _build_series as _build_vector_series
 from spb.utils import _plot_sympify, _unpack_args_extended, _validate_kwargs
 from sympy import latex, Tuple
 from sympy.external import import_module
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import warnings
+import weakref
 
 param = import_module(
     'param',
@@ -226,8 +230,7 @@ class DynamicParam(param.Parameterized):
         # NOTE: in case _backend is not an attribute, it means that this
         # class has been instantiated by create_widgets
         if hasattr(self, "_backend"):
-            self._backend._update_interactive(params)
-            self._action_post_update()
+            self._update(params)
 
 
 def _new_class(cls, **kwargs):
@@ -676,6 +679,12 @@ class InteractivePlot(DynamicParam, PanelLayout):
         layout = kwargs.pop("layout", "tb")
         ncols = kwargs.pop("ncols", 2)
         throttled = kwargs.pop("throttled", cfg["interactive"]["throttled"])
+        asynchronous = kwargs.pop("asynchronous",
+            cfg["interactive"]["asynchronous"])
+        progressive = kwargs.pop("progressive",
+            cfg["interactive"]["progressive"])
+        cache_memory = kwargs.pop("cache_memory",
+            cfg["interactive"]["cache_memory"])
         servable = kwargs.pop("servable", cfg["interactive"]["servable"])
         use_latex = kwargs.pop("use_latex", cfg["interactive"]["use_latex"])
         pane_kw = kwargs.pop("pane_kw", dict())
@@ -684,6 +693,20 @@ class InteractivePlot(DynamicParam, PanelLayout):
         custom_css = kwargs.pop("custom_css", "")
 
         self._name = name
+        # NOTE: when `asynchronous=True`, the numerical evaluation runs on a
+        # single background thread. Each update gets a new generation number:
+        # the results of older generations are discarded.
+        self._asynchronous = asynchronous
+        self._progressive = progressive
+        # decimation of the interactive series while rendering a preview
+        self._preview_step = (4 if progressive is True else
+            max(int(progressive), 1))
+        self._generation = 0
+        # numerical data of the interactive series associated to the
+        # visited parameters
+        self._data_cache = DataCache(cache_memory)
+        self._executor = None
+        self._pending_update = None
         super().__init__(*args, name=self._name, params=params, use_latex=use_latex)
         PanelLayout.__init__(self, layout, ncols, throttled, servable, custom_css, pane_kw)
 
@@ -703,6 +726,179 @@ class InteractivePlot(DynamicParam, PanelLayout):
         self._backend = Backend(*series, **kwargs)
         _validate_kwargs(self._backend, **original_kwargs)
 
+    # NOTE: with `progressive`, the full resolution update is executed when
+    # the parameters didn't change for the following amount of seconds.
+    _preview_delay = 0.3
+
+    def _update(self, params):
+        """Update the figure with the new parameters. With ``progressive``,
+        a preview is rendered right away, while the full resolution update
+        is executed once the parameters stop changing.
+        """
+        self._generation += 1
+        if self._preview_step == 1:
+            self._render(params, 1)
+            return
+
+        self._render(params, self._preview_step)
+        generation = self._generation
+
+        def full_update():
+            if generation == self._generation:
+                self._generation += 1
+                self._render(params, 1)
+
+        self._schedule(self._event_loop(), full_update, self._preview_delay)
+
+    def _render(self, params, step):
+        if self._asynchronous:
+            self._submit_update(params, step)
+        else:
+            self._render_update(self._generation, params, step)
+
+    @staticmethod
+    def _event_loop():
+        """Return the object used to schedule the execution of callbacks on
+        the event loop: a Bokeh document when the application is served,
+        the running asyncio loop otherwise. Return None if no event loop is
+        running, for example in a standard Python interpreter.
+        """
+        doc = pn.state.curdoc
+        if (doc is not None) and (doc.session_context is not None):
+            return doc
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    @staticmethod
+    def _schedule(target, callback, delay=0):
+        """Execute ``callback`` on the event loop ``target`` (look at
+        ``_event_loop``) after ``delay`` seconds. If ``target`` is None,
+        ``callback`` is executed immediately. It can be called from any
+        thread.
+        """
+        if target is None:
+            callback()
+        elif isinstance(target, asyncio.AbstractEventLoop):
+            if delay > 0:
+                target.call_soon_threadsafe(target.call_later, delay, callback)
+            else:
+                target.call_soon_threadsafe(callback)
+        elif delay > 0:
+            target.add_timeout_callback(callback, int(delay * 1000))
+        else:
+            # NOTE: with a Bokeh server, the document must be locked in order
+            # to be modified, which is done by `add_next_tick_callback`.
+            target.add_next_tick_callback(callback)
+
+    def _submit_update(self, params, step=1):
+        """Evaluate the interactive series with the new parameters on a
+        background thread. The update that is waiting in the queue (if any)
+        is cancelled, while the one in progress is going to be discarded
+        as soon as possible. Hence, only the latest parameters are rendered.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="spb-iplot")
+            # NOTE: release the worker thread when the plot is discarded.
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+
+        self._pending_update = self._executor.submit(self._evaluate_update,
+            self._generation, params, step, self._event_loop())
+        self._pending_update.add_done_callback(self._warn_failed_update)
+
+    def _evaluate_update(self, generation, params, step, target):
+        """Generate the numerical data for the given parameters, then
+        schedule the rendering on the event loop.
+        Executed by the background thread.
+        """
+        if generation != self._generation:
+            return
+        backend = self._backend
+        self._restore_data(params, step)
+        backend._preview_step = step
+        try:
+            backend._update_series_params(params)
+        finally:
+            backend._preview_step = 1
+        for s in backend.series:
+            if generation != self._generation:
+                return
+            if s.is_interactive:
+                s.get_data()
+        self._store_data(params, step)
+
+        self._schedule(target,
+            lambda: self._render_update(generation, params, step))
+
+    def _render_update(self, generation, params, step=1):
+        """Update the figure with the new parameters, unless newer ones were
+        received in the meantime. When the update is asynchronous, the data
+        series already store the numerical data associated to `params`:
+        the backend is not going to evaluate them again.
+        """
+        if generation != self._generation:
+            return
+        self._restore_data(params, step)
+        if step > 1:
+            self._backend._update_interactive_preview(params, step)
+        else:
+            self._backend._update_interactive(params)
+        self._store_data(params, step)
+        self._action_post_update()
+
+    def _data_keys(self, params, step):
+        """Return a list of tuples ``(series, key)``, where ``key``
+        identifies the numerical data of an interactive series evaluated
+        with the given parameters and decimation step.
+        """
+        if self._data_cache.max_memory <= 0:
+            return []
+        try:
+            params_key = _freeze(params)
+        except TypeError:
+            return []
+        return [(s, (i, step if s._allow_preview else 1, params_key))
+            for i, s in enumerate(self._backend.series) if s.is_interactive]
+
+    def _restore_data(self, params, step):
+        """Set the previously computed numerical data to the interactive
+        series, so that the backend doesn't need to evaluate them again.
+        """
+        for s, key in self._data_keys(params, step):
+            data = self._data_cache.get(key)
+            if data is not None:
+                s._set_preview(step)
+                s.params = params
+                s._set_cached_data(data)
+
+    def _store_data(self, params, step):
+        for s, key in self._data_keys(params, step):
+            data = s._get_cached_data()
+            if data is not None:
+                self._data_cache.put(key, data)
+
+    @staticmethod
+    def _warn_failed_update(future):
+        if future.cancelled() or (future.exception() is None):
+            return
+        warnings.warn(
+            "The interactive update failed with the following "
+            "exception:\n%s: %s" % (
+                type(future.exception()).__name__, future.exception()))
+
+    def sweep(self, param, values, executor=None, max_workers=None):
+        """Evaluate the interactive series over a sequence of values of a
+        parameter, while the other parameters keep the values of the
+        widgets. Look at ``Plot.sweep`` for more information.
+        """
+        return self._backend.sweep(param, values,
+            params=self.read_parameters(), executor=executor,
+            max_workers=max_workers)
+
     @property
     def fig(self):
         """Return the plot object"""
@@ -764,6 +960,9 @@ class InteractivePlot(DynamicParam, PanelLayout):
             "layout": self._layout,
             "ncols": self._ncols,
             "throttled": self._throttled,
+            "asynchronous": self._asynchronous,
+            "progressive": self._progressive,
+            "cache_memory": self._data_cache.max_memory,
             "use_latex": self._use_latex,
             "params": self._original_params,
             "show": False
@@ -940,6 +1139,12 @@ def iplot(*args, show=True, **kwargs):
         Default value to 0.1. Before changing this value, it is recommended to
         increase the number of discretization points.
 
+    poles_refinement : int, optional
+        Number of refinement passes of the `detect_poles` algorithm. At each
+        pass, the segments flagged as discontinuities are re-sampled with ten
+        times the resolution, so that poles are located more accurately
+        without increasing `n`. Default to 0.
+
     n1, n2, n3 : int, optional
         Set the number of discretization points in the three directions,
         respectively.
@@ -956,6 +1161,31 @@ def iplot(*args, show=True, **kwargs):
         Default to False. If True the recompute will be done at mouse-up event
         on sliders. If False, every slider tick will force a recompute.
 
+    asynchronous : boolean, optional
+        Default to False. If True, the numerical evaluation is executed on a
+        background thread and the figure is updated on the event loop once
+        the data is ready, so that the widgets stay responsive while
+        computing expensive expressions. If the parameters change while an
+        evaluation is in progress, the outdated results are discarded: only
+        the latest parameters are going to be rendered.
+
+    progressive : boolean or int, optional
+        Default to False. If True, while the parameters are changing the
+        interactive series are evaluated over decimated domains, keeping
+        one point every 4 along each direction, and the resulting preview
+        is rendered right away. The full resolution update is executed once
+        the parameters stop changing. An integer sets the decimation step.
+        Lines, geometric entities and sliced vector fields are always
+        evaluated at full resolution.
+
+    cache_memory : int, optional
+        Memory budget (in bytes) of the cache storing the numerical data of
+        the interactive series associated to the visited parameters.
+        Returning to a state already visited only requires to update the
+        figure. When the budget is exceeded, the least recently used data
+        is discarded. Set it to 0 to disable the cache. Default to
+        ``cfg["interactive"]["cache_memory"]``, 100 megabytes.
+
     title : str, optional
         Title of the plot.
 
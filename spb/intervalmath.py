@@ -0,0 +1,576 @@
+"""Array-backed interval arithmetic for implicit plotting.
+
+This module mirrors ``sympy.plotting.intervalmath``, but each object holds
+NumPy arrays of lower and upper bounds instead of a single pair of floats.
+Hence, an expression lambdified with the namespace returned by
+``namespace()`` evaluates a whole set of rectangles with one call.
+
+Like its SymPy counterpart, this module doesn't handle rounding and it
+should only be used for plotting purposes.
+
+The three-valued logic values (True, False, None) are stored in ``int8``
+arrays, using the encoding given by the constants ``FALSE``, ``NONE`` and
+``TRUE``. With this ordering, fuzzy and/or are respectively the element-wise
+minimum/maximum, and fuzzy not is ``TRUE - value``.
+"""
+
+from functools import reduce
+from sympy.external import import_module
+from sympy.simplify.simplify import nsimplify
+
+
+FALSE, NONE, TRUE = 0, 1, 2
+
+
+def _fuzzy_xor(a, b):
+    np = import_module('numpy')
+    return np.where((a == NONE) | (b == NONE), NONE,
+        np.where(a != b, TRUE, FALSE)).astype(np.int8)
+
+
+class IntervalArray:
+    """Represents an array of intervals.
+
+    Parameters
+    ==========
+
+    start, end : array-like
+        The bounds of the intervals. They are swapped where ``start > end``.
+
+    valid : array-like or int, optional
+        Tracks whether each interval is in the domain of the function and
+        it is continuous: ``TRUE``, ``FALSE`` (not in the domain) or ``NONE``
+        (partially in the domain, or not continuous). Default to ``TRUE``.
+    """
+
+    def __init__(self, start, end=None, valid=TRUE):
+        np = import_module('numpy')
+        start = np.asarray(start, dtype=float)
+        end = start if end is None else np.asarray(end, dtype=float)
+        start, end, valid = np.broadcast_arrays(start, end,
+            np.asarray(valid, dtype=np.int8))
+        self.start = np.fmin(start, end)
+        self.end = np.fmax(start, end)
+        self.valid = valid
+
+    @property
+    def mid(self):
+        return (self.start + self.end) / 2
+
+    @property
+    def width(self):
+        return self.end - self.start
+
+    def __len__(self):
+        return len(self.start)
+
+    def __repr__(self):
+        return "IntervalArray(%s, %s)" % (self.start, self.end)
+
+    def _where(self, condition, start, end, valid):
+        """Return a new interval array, replacing the elements satisfying
+        ``condition`` with the provided values."""
+        np = import_module('numpy')
+        return IntervalArray(
+            np.where(condition, start, self.start),
+            np.where(condition, end, self.end),
+            np.where(condition, valid, self.valid))
+
+    # comparisons
+
+    def _lt(self, other, strict=True):
+        np = import_module('numpy')
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        valid = np.minimum(self.valid, other.valid)
+        is_true = (self.end < other.start) if strict else (
+            self.end <= other.start)
+        truth = np.where(is_true, TRUE,
+            np.where(self.start > other.end, FALSE, NONE))
+        return MembershipArray(truth, valid)
+
+    def __lt__(self, other):
+        return self._lt(other)
+
+    def __le__(self, other):
+        return self._lt(other, False)
+
+    def __gt__(self, other):
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        return other._lt(self)
+
+    def __ge__(self, other):
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        return other._lt(self, False)
+
+    def __eq__(self, other):
+        np = import_module('numpy')
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        lt = self._lt(other)
+        truth = np.where(
+            (self.start == other.start) & (self.end == other.end), TRUE,
+            np.where(lt.truth != NONE, FALSE, NONE))
+        return MembershipArray(truth, lt.valid)
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        if res is NotImplemented:
+            return res
+        return ~res
+
+    __hash__ = None
+
+    # arithmetic
+
+    def __add__(self, other):
+        np = import_module('numpy')
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        return IntervalArray(self.start + other.start, self.end + other.end,
+            np.minimum(self.valid, other.valid))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return IntervalArray(-self.end, -self.start, self.valid)
+
+    def __sub__(self, other):
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        np = import_module('numpy')
+        if _is_number(other):
+            return IntervalArray(self.start * other, self.end * other,
+                self.valid)
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        with np.errstate(invalid="ignore"):
+            p = np.stack([self.start * other.start, self.end * other.start,
+                self.start * other.end, self.end * other.end])
+        # NOTE: 0 * inf = 0 in interval arithmetic
+        p = np.nan_to_num(p, nan=0, posinf=np.inf, neginf=-np.inf)
+        valid = np.minimum(self.valid, other.valid)
+        return IntervalArray(
+            np.where(valid == TRUE, p.min(axis=0), -np.inf),
+            np.where(valid == TRUE, p.max(axis=0), np.inf),
+            valid)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        np = import_module('numpy')
+        if _is_number(other):
+            if other == 0:
+                return IntervalArray(
+                    np.full_like(self.start, -np.inf), np.inf, FALSE)
+            other = IntervalArray(other)
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        valid = np.minimum(self.valid, other.valid)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            q = np.stack([self.start / other.start, self.end / other.start,
+                self.start / other.end, self.end / other.end])
+        # the denominator contains zero: the result is the whole real line
+        zero = (other.start <= 0) & (other.end >= 0)
+        valid = np.where((valid == TRUE) & zero, NONE, valid)
+        # NOTE: invalid numerators produce invalid results
+        valid = np.where(self.valid != TRUE, self.valid, valid)
+        return IntervalArray(
+            np.where(valid == TRUE, np.fmin.reduce(q, axis=0), -np.inf),
+            np.where(valid == TRUE, np.fmax.reduce(q, axis=0), np.inf),
+            valid)
+
+    def __rtruediv__(self, other):
+        other = _as_interval(other)
+        if other is NotImplemented:
+            return other
+        return other / self
+
+    def __pow__(self, other):
+        np = import_module('numpy')
+        if isinstance(other, IntervalArray):
+            return exp(other * log(self))
+        if not _is_number(other):
+            return NotImplemented
+        if other < 0:
+            return 1 / self.__pow__(abs(other))
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            if int(other) == other:
+                if int(other) % 2:
+                    res = IntervalArray(self.start**other, self.end**other,
+                        self.valid)
+                else:
+                    res = self._even_power(other)
+            else:
+                num, den = nsimplify(other).as_numer_denom()
+                if num % 2 == 0:
+                    res = abs(self)._even_power(other)
+                elif den % 2 == 0:
+                    res = IntervalArray(
+                        np.where(self.start < 0, 0, self.start)**other,
+                        np.where(self.end < 0, 0, self.end)**other,
+                        self.valid)
+                    res = res._where(self.start < 0, 0, res.end, NONE)
+                    res = res._where(self.end < 0, -np.inf, np.inf, FALSE)
+                else:
+                    # odd root: the sign is preserved
+                    s, e = self.start, self.end
+                    res = IntervalArray(
+                        np.sign(s) * np.abs(s)**other,
+                        np.sign(e) * np.abs(e)**other, self.valid)
+        # NOTE: invalid intervals are left untouched
+        return res._where(self.valid != TRUE, self.start, self.end,
+            self.valid)
+
+    def _even_power(self, power):
+        np = import_module('numpy')
+        s, e = self.start**power, self.end**power
+        res = IntervalArray(s, e, self.valid)
+        return res._where((self.start < 0) & (self.end > 0), 0,
+            np.fmax(s, e), self.valid)
+
+    def __rpow__(self, other):
+        np = import_module('numpy')
+        if not _is_number(other):
+            return NotImplemented
+        if other < 0:
+            res = IntervalArray(np.full_like(self.start, -np.inf), np.inf,
+                FALSE)
+        else:
+            with np.errstate(over="ignore"):
+                res = IntervalArray(other**self.start, other**self.end,
+                    self.valid)
+        return res._where(self.valid != TRUE, self.start, self.end,
+            self.valid)
+
+    def __abs__(self):
+        np = import_module('numpy')
+        a, b = np.abs(self.start), np.abs(self.end)
+        res = IntervalArray(a, b, self.valid)
+        return res._where((self.start < 0) & (self.end > 0), 0,
+            np.fmax(a, b), self.valid)
+
+
+class MembershipArray:
+    """Represents the element-wise results of the comparison between
+    interval arrays, as two arrays of three-valued logic values: ``truth``
+    and ``valid``. Similarly to SymPy's ``intervalMembership``, indexing
+    with 0 returns ``truth``, indexing with 1 returns ``valid``.
+    """
+
+    def __init__(self, truth, valid):
+        np = import_module('numpy')
+        self.truth, self.valid = np.broadcast_arrays(
+            np.asarray(truth, dtype=np.int8), np.asarray(valid, dtype=np.int8))
+
+    def __getitem__(self, i):
+        return (self.truth, self.valid)[i]
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        return iter((self.truth, self.valid))
+
+    def __repr__(self):
+        return "MembershipArray(%s, %s)" % (self.truth, self.valid)
+
+    def __and__(self, other):
+        np = import_module('numpy')
+        if not isinstance(other, MembershipArray):
+            return NotImplemented
+        return MembershipArray(np.minimum(self.truth, other.truth),
+            np.minimum(self.valid, other.valid))
+
+    def __or__(self, other):
+        np = import_module('numpy')
+        if not isinstance(other, MembershipArray):
+            return NotImplemented
+        return MembershipArray(np.maximum(self.truth, other.truth),
+            np.minimum(self.valid, other.valid))
+
+    def __xor__(self, other):
+        np = import_module('numpy')
+        if not isinstance(other, MembershipArray):
+            return NotImplemented
+        return MembershipArray(_fuzzy_xor(self.truth, other.truth),
+            np.minimum(self.valid, other.valid))
+
+    def __invert__(self):
+        return MembershipArray(TRUE - self.truth, self.valid)
+
+
+def _is_number(obj):
+    np = import_module('numpy')
+    return isinstance(obj, (int, float, np.number)) and (
+        not isinstance(obj, bool))
+
+
+def _as_interval(obj):
+    if isinstance(obj, IntervalArray):
+        return obj
+    if _is_number(obj):
+        return IntervalArray(float(obj))
+    return NotImplemented
+
+
+def _monotonic(func, increasing=True):
+    """Create the interval extension of a monotonic function."""
+    def wrapper(x):
+        np = import_module('numpy')
+        x = _as_interval(x)
+        with np.errstate(all="ignore"):
+            s, e = func(x.start), func(x.end)
+        return IntervalArray(s, e, x.valid)
+    wrapper.__doc__ = "Evaluates %s over an interval array." % func.__name__
+    return wrapper
+
+
+def _restricted(func, lower, upper, closed=True):
+    """Create the interval extension of a monotonic function, defined over
+    the domain ``[lower, upper]`` (or ``(lower, upper)`` if
+    ``closed=False``).
+    """
+    def wrapper(x):
+        np = import_module('numpy')
+        x = _as_interval(x)
+        if closed:
+            outside = (x.start > upper) | (x.end < lower)
+            partial = (x.start < lower) | (x.end > upper)
+        else:
+            outside = (x.start >= upper) | (x.end <= lower)
+            partial = (x.start <= lower) | (x.end >= upper)
+        with np.errstate(all="ignore"):
+            res = IntervalArray(func(x.start), func(x.end), x.valid)
+        res = res._where(partial | (x.valid == NONE), -np.inf, np.inf,
+            np.minimum(res.valid, NONE))
+        return res._where(outside | (x.valid == FALSE), -np.inf, np.inf,
+            FALSE)
+    wrapper.__doc__ = "Evaluates %s over an interval array." % func.__name__
+    return wrapper
+
+
+def Abs(x):
+    """Evaluates the absolute value of an interval array."""
+    return abs(_as_interval(x))
+
+
+def exp(x):
+    """Evaluates the exponential of an interval array."""
+    np = import_module('numpy')
+    return _monotonic(np.exp)(x)
+
+
+def log(x):
+    """Evaluates the natural logarithm of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.log, 0, np.inf, False)(x)
+
+
+def log10(x):
+    """Evaluates the logarithm to the base 10 of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.log10, 0, np.inf, False)(x)
+
+
+def sqrt(x):
+    """Evaluates the square root of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.sqrt, 0, np.inf)(x)
+
+
+def atan(x):
+    """Evaluates the inverse tangent of an interval array."""
+    np = import_module('numpy')
+    return _monotonic(np.arctan)(x)
+
+
+def asin(x):
+    """Evaluates the inverse sine of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.arcsin, -1, 1)(x)
+
+
+def acos(x):
+    """Evaluates the inverse cosine of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.arccos, -1, 1)(x)
+
+
+def sinh(x):
+    """Evaluates the hyperbolic sine of an interval array."""
+    np = import_module('numpy')
+    return _monotonic(np.sinh)(x)
+
+
+def tanh(x):
+    """Evaluates the hyperbolic tangent of an interval array."""
+    np = import_module('numpy')
+    return _monotonic(np.tanh)(x)
+
+
+def asinh(x):
+    """Evaluates the inverse hyperbolic sine of an interval array."""
+    np = import_module('numpy')
+    return _monotonic(np.arcsinh)(x)
+
+
+def acosh(x):
+    """Evaluates the inverse hyperbolic cosine of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.arccosh, 1, np.inf)(x)
+
+
+def atanh(x):
+    """Evaluates the inverse hyperbolic tangent of an interval array."""
+    np = import_module('numpy')
+    return _restricted(np.arctanh, -1, 1, False)(x)
+
+
+def cosh(x):
+    """Evaluates the hyperbolic cosine of an interval array."""
+    np = import_module('numpy')
+    x = _as_interval(x)
+    with np.errstate(over="ignore"):
+        s, e = np.cosh(x.start), np.cosh(x.end)
+    res = IntervalArray(s, e, x.valid)
+    return res._where((x.start < 0) & (x.end > 0), 1, np.fmax(s, e),
+        x.valid)
+
+
+def _periodic(x, func, max_offset, min_offset):
+    """Evaluates sine or cosine over an interval array. The extrema are
+    located by counting the quarter periods spanned by each interval.
+    """
+    np = import_module('numpy')
+    x = _as_interval(x)
+    finite = np.isfinite(x.start) & np.isfinite(x.end)
+    s = np.where(finite, x.start, 0)
+    e = np.where(finite, x.end, 0)
+    na, nb = s // (np.pi / 2), e // (np.pi / 2)
+    fs, fe = func(s), func(e)
+    start, end = np.fmin(fs, fe), np.fmax(fs, fe)
+    end = np.where((na - max_offset) // 4 != (nb - max_offset) // 4, 1, end)
+    start = np.where(
+        (na - min_offset) // 4 != (nb - min_offset) // 4, -1, start)
+    full = (nb - na > 4) | np.invert(finite) | (x.valid != TRUE)
+    return IntervalArray(np.where(full, -1, start), np.where(full, 1, end),
+        x.valid)
+
+
+def sin(x):
+    """Evaluates the sine of an interval array."""
+    np = import_module('numpy')
+    return _periodic(x, np.sin, 1, 3)
+
+
+def cos(x):
+    """Evaluates the cosine of an interval array."""
+    np = import_module('numpy')
+    return _periodic(x, np.cos, 0, 2)
+
+
+def tan(x):
+    """Evaluates the tangent of an interval array."""
+    return sin(x) / cos(x)
+
+
+def _step(func):
+    def wrapper(x):
+        np = import_module('numpy')
+        x = _as_interval(x)
+        s, e = func(x.start), func(x.end)
+        # not continuous over the interval
+        valid = np.where(s == e, x.valid, np.minimum(x.valid, NONE))
+        res = IntervalArray(s, e, valid)
+        return res._where(x.valid == FALSE, -np.inf, np.inf, FALSE)
+    wrapper.__doc__ = "Evaluates %s over an interval array." % func.__name__
+    return wrapper
+
+
+def ceiling(x):
+    """Evaluates the ceiling of an interval array."""
+    np = import_module('numpy')
+    return _step(np.ceil)(x)
+
+
+def floor(x):
+    """Evaluates the floor of an interval array."""
+    np = import_module('numpy')
+    return _step(np.floor)(x)
+
+
+def _extremum(args, func):
+    np = import_module('numpy')
+    args = [_as_interval(a) for a in args]
+    n = len(args)
+    # stack the bounds and the validity of all the arguments
+    data = np.broadcast_arrays(*[a.start for a in args],
+        *[a.end for a in args], *[a.valid for a in args])
+    start, end = np.array(data[:n]), np.array(data[n:2*n])
+    valid = np.array(data[2*n:])
+    # only valid intervals are considered
+    fill = np.inf if func is np.amin else -np.inf
+    res = IntervalArray(
+        func(np.where(valid == TRUE, start, fill), axis=0),
+        func(np.where(valid == TRUE, end, fill), axis=0))
+    none_valid = np.all(valid != TRUE, axis=0)
+    return res._where(none_valid, -np.inf, np.inf,
+        np.where(np.all(valid == FALSE, axis=0), FALSE, NONE))
+
+
+def imin(*args):
+    """Evaluates the minimum of interval arrays. Only valid intervals
+    are considered."""
+    np = import_module('numpy')
+    return _extremum(args, np.amin)
+
+
+def imax(*args):
+    """Evaluates the maximum of interval arrays. Only valid intervals
+    are considered."""
+    np = import_module('numpy')
+    return _extremum(args, np.amax)
+
+
+def And(*args):
+    """Three-valued logic ``And`` of membership arrays."""
+    return reduce(lambda a, b: a & b, args)
+
+
+def Or(*args):
+    """Three-valued logic ``Or`` of membership arrays."""
+    return reduce(lambda a, b: a | b, args)
+
+
+def namespace():
+    """Return the namespace to be used by ``lambdify`` in order to evaluate
+    an expression printed by ``IntervalMathPrinter`` over interval arrays.
+    """
+    np = import_module('numpy')
+    d = {k: globals()[k] for k in [
+        "Abs", "exp", "log", "log10", "sqrt", "atan", "asin", "acos", "sinh",
+        "cosh", "tanh", "asinh", "acosh", "atanh", "sin", "cos", "tan",
+        "ceiling", "floor", "imin", "imax", "And", "Or"]}
+    d.update({
+        # names used by the printer
+        "abs": Abs, "ceil": ceiling, "min": imin, "max": imax,
+        "pi": np.pi, "e": np.e, "E": np.e
+    })
+    return d
@@ -1,7 +1,10 @@
+from functools import wraps
 from inspect import signature
+from itertools import product
 from spb.defaults import cfg
 from sympy import (
-    latex, Tuple, arity, symbols, sympify, solve, Expr, lambdify,
+    latex, Tuple, arity, symbols, sympify, solve, Expr, Add, Mul, Pow,
+    Function, Piecewise, Symbol, Dummy, cse, numbered_symbols,
     Equality, GreaterThan, LessThan, StrictLessThan, StrictGreaterThan,
     Plane, Polygon, Circle, Ellipse, Segment, Ray, Curve, Point2D, Point3D,
 )
@@ -9,11 +12,12 @@ from sympy.geometry.entity import GeometryEntity
 from sympy.geometry.line import LinearEntity2D, LinearEntity3D
 from sympy.core.relational import Relational
 from sympy.logic.boolalg import BooleanFunction
-from sympy.plotting.intervalmath import interval
 from sympy.external import import_module
 from sympy.printing.pycode import PythonCodePrinter
 from sympy.printing.precedence import precedence
 from sympy.core.sorting import default_sort_key
+from spb.cache import lambdify, LazyLambdify
+from spb import intervalmath
 import warnings
 
 class IntervalMathPrinter(PythonCodePrinter):
@@ -185,6 +189,281 @@ def _adaptive_eval(wrapper_func, free_symbols, expr, bounds, *args,
     return xs, ys, np.rot90(z)
 
 
+def _refine_1d(evaluate, start, end, tolerance=0.01, max_points=10000,
+    initial_points=33, get_coords=None):
+    """Adaptively sample a function of one parameter by recursive midpoint
+    refinement. Each refinement level is evaluated with a single call over
+    the midpoints of all the segments that still need refinement.
+
+    A segment is refined when its midpoint deviates from the chord
+    connecting its end points by more than ``tolerance``, measured in
+    coordinates normalized by the extent of the data (hence, 0.01
+    corresponds to 1% of the plot size). Segments crossing the boundary of
+    the domain of the function (where the evaluation produces NaN) are
+    refined as well.
+
+    Note: this is an experimental function, as such it is prone to changes.
+    Please, do not use it in your code.
+
+    Parameters
+    ==========
+
+    evaluate : callable
+        ``evaluate(t)`` receives a 1D array of parameters and returns a 2D
+        array with shape (m, len(t)).
+
+    start, end : float
+        The range of the parameter.
+
+    tolerance : float
+        The lower the number, the more evaluation points.
+
+    max_points : int
+        Maximum number of evaluation points.
+
+    initial_points : int
+        Number of uniformly spaced points of the initial sampling.
+
+    get_coords : callable or None
+        ``get_coords(data)`` returns the coordinates (rows) of the points
+        used to measure the deviation. If None, use all the rows returned
+        by ``evaluate``.
+
+    Returns
+    =======
+
+    t : np.ndarray (N)
+        The sorted parameters.
+
+    data : np.ndarray (m, N)
+        The results of the evaluation.
+    """
+    np = import_module('numpy')
+
+    if get_coords is None:
+        get_coords = lambda data: data
+    max_points = max(int(max_points), 2)
+    t = np.linspace(start, end, min(initial_points, max_points))
+    data = np.asarray(evaluate(t), dtype=float)
+    # the loss of each segment: all the segments of the initial sampling
+    # are going to be refined at least once
+    loss = np.full(len(t) - 1, np.inf)
+    min_width = abs(end - start) * 2.0**-30
+
+    while len(t) < max_points:
+        active = np.flatnonzero(loss > tolerance)
+        if len(active) == 0:
+            break
+        if len(t) + len(active) > max_points:
+            # refine the worst segments only
+            n = max_points - len(t)
+            active = np.sort(active[np.argsort(loss[active])[::-1][:n]])
+
+        tm = (t[active] + t[active + 1]) / 2
+        dm = np.asarray(evaluate(tm), dtype=float)
+
+        coords = get_coords(data)
+        coords_m = get_coords(dm)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            extent = (np.nanmax(np.hstack([coords, coords_m]), axis=1) -
+                np.nanmin(np.hstack([coords, coords_m]), axis=1))
+        extent[np.invert(np.isfinite(extent)) | (extent == 0)] = 1
+        left = coords[:, active] / extent[:, None]
+        right = coords[:, active + 1] / extent[:, None]
+        mid = coords_m / extent[:, None]
+        with np.errstate(all="ignore"):
+            dev = np.sqrt(np.sum((mid - (left + right) / 2)**2, axis=0))
+
+        # number of NaN points among left, mid and right
+        nans = sum(np.isnan(c).any(axis=0) for c in [left, mid, right])
+        dev[nans == 3] = 0
+        dev[(nans > 0) & (nans < 3)] = np.inf
+        dev[(tm - t[active]) < min_width] = 0
+
+        # split each refined segment in two halves with the same loss
+        loss[active] = dev
+        t = np.insert(t, active + 1, tm)
+        data = np.insert(data, active + 1, dm, axis=1)
+        loss = np.insert(loss, active + 1, dev)
+    return t, data
+
+
+def _eval_points(free_symbols, expr, *args, modules=None):
+    """Evaluate an expression (or a user-provided function) over the arrays
+    of coordinates ``args``. Return a complex array with their broadcast
+    shape.
+    """
+    np = import_module('numpy')
+
+    if callable(expr):
+        # NOTE: user-provided functions might not support arrays: in that
+        # case, they are evaluated element-wise.
+        res = _uniform_eval_helper(expr, expr, *args)
+    else:
+        res = _uniform_eval(free_symbols, expr, *args, modules=modules)
+    return np.broadcast_to(np.asarray(res),
+        np.broadcast_shapes(*[np.shape(a) for a in args]))
+
+
+def _refine_2d(evaluate, xmin, xmax, ymin, ymax, tolerance=0.01,
+    max_points=10000, initial_cells=8, max_depth=8):
+    """Adaptively sample a function of two variables with a quadtree. Each
+    level of the tree is evaluated with a single call over the new points of
+    all the cells that are being tested.
+
+    A cell is split into four children when the values at its center and
+    at the midpoints of its edges deviate from the linear interpolation of
+    its corners by more than ``tolerance``, relative to the extent of the
+    data. Cells crossing the boundary of the domain of the function (where
+    the evaluation produces NaN) are split as well.
+
+    Note: this is an experimental function, as such it is prone to changes.
+    Please, do not use it in your code.
+
+    Parameters
+    ==========
+
+    evaluate : callable
+        ``evaluate(x, y)`` receives two 1D arrays of coordinates and returns
+        a 1D array of real values.
+
+    xmin, xmax, ymin, ymax : float
+        The domain.
+
+    tolerance : float
+        The lower the number, the more evaluation points.
+
+    max_points : int
+        Maximum number of evaluation points.
+
+    initial_cells : int
+        Number of cells along each direction of the initial uniform grid.
+
+    max_depth : int
+        Maximum number of times a cell of the initial grid can be split.
+
+    Returns
+    =======
+
+    x, y, z : np.ndarray (N)
+        The coordinates of the vertices.
+
+    triangles : np.ndarray (M, 3)
+        Indices of the vertices of each triangle, in counterclockwise
+        order. Each leaf cell is triangulated as a fan around its center,
+        connecting all the vertices lying on its edges: hence, the mesh
+        has no hanging nodes.
+    """
+    np = import_module('numpy')
+
+    # NOTE: the vertices lie on an integer lattice, so that they can be
+    # identified by the key i * K + j. The smallest cell has size 2.
+    M = initial_cells * 2**(max_depth + 1)
+    K = M + 1
+    keys = np.empty(0, dtype=np.int64)
+    values = np.empty(0, dtype=float)
+
+    def add_vertices(i, j):
+        nonlocal keys, values
+        k = np.unique(i * K + j)
+        k = k[np.invert(np.isin(k, keys))]
+        if len(k) > 0:
+            x = xmin + (xmax - xmin) * (k // K) / M
+            y = ymin + (ymax - ymin) * (k % K) / M
+            keys = np.concatenate([keys, k])
+            values = np.concatenate([values,
+                np.asarray(evaluate(x, y), dtype=float)])
+            order = np.argsort(keys)
+            keys, values = keys[order], values[order]
+
+    def get_values(i, j):
+        return values[np.searchsorted(keys, i * K + j)]
+
+    s0 = 2**(max_depth + 1)
+    ci, cj = [t.flatten() * s0 for t in np.meshgrid(
+        np.arange(initial_cells), np.arange(initial_cells))]
+    cs = np.full(len(ci), s0)
+    add_vertices(*[t.flatten() * s0 for t in np.meshgrid(
+        np.arange(initial_cells + 1), np.arange(initial_cells + 1))])
+    leaves = []
+
+    while len(ci) > 0:
+        h = cs // 2
+        # corners (counterclockwise from the lower-left one), center and
+        # midpoints of the edges (bottom, right, top, left)
+        corners = [(ci, cj), (ci + cs, cj), (ci + cs, cj + cs), (ci, cj + cs)]
+        center = (ci + h, cj + h)
+        mids = [(ci + h, cj), (ci + cs, cj + h), (ci + h, cj + cs),
+            (ci, cj + h)]
+        add_vertices(np.concatenate([center[0]] + [m[0] for m in mids]),
+            np.concatenate([center[1]] + [m[1] for m in mids]))
+        zc = np.array([get_values(*c) for c in corners])
+        zm = np.array([get_values(*m) for m in mids])
+        z0 = get_values(*center)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            extent = np.nanmax(values) - np.nanmin(values)
+        if (not np.isfinite(extent)) or (extent == 0):
+            extent = 1
+        with np.errstate(all="ignore"):
+            err = np.maximum(
+                np.abs(z0 - zc.mean(axis=0)),
+                np.amax(np.abs(zm - (zc + np.roll(zc, -1, axis=0)) / 2),
+                    axis=0)) / extent
+        nans = (np.isnan(zc).sum(axis=0) + np.isnan(zm).sum(axis=0) +
+            np.isnan(z0))
+        err[nans == 9] = 0
+        err[(nans > 0) & (nans < 9)] = np.inf
+
+        split = (err > tolerance) & (cs > 2)
+        # NOTE: each split cell requires at most 20 new points at the
+        # next level. Split the worst cells only if the budget is exceeded.
+        allowed = max(0, (max_points - len(keys)) // 20)
+        if split.sum() > allowed:
+            idx = np.flatnonzero(split)
+            idx = idx[np.argsort(err[idx])[::-1][allowed:]]
+            split[idx] = False
+
+        leaves.append((ci[~split], cj[~split], cs[~split]))
+        ci, cj, h = ci[split], cj[split], h[split]
+        ci = np.concatenate([ci, ci + h, ci, ci + h])
+        cj = np.concatenate([cj, cj, cj + h, cj + h])
+        cs = np.concatenate([h] * 4)
+
+    li, lj, ls = [np.concatenate(t) for t in zip(*leaves)]
+    center = np.searchsorted(keys, (li + ls // 2) * K + (lj + ls // 2))
+    # vertical edges: i is fixed, use keys = i * K + j
+    # horizontal edges: j is fixed, use keys = j * K + i
+    i, j = keys // K, keys % K
+    perm_v = np.arange(len(keys))
+    keys_h = j * K + i
+    perm_h = np.argsort(keys_h)
+    keys_h = keys_h[perm_h]
+
+    def fan(sorted_keys, perm, start, reverse):
+        lo = np.searchsorted(sorted_keys, start, side="left")
+        hi = np.searchsorted(sorted_keys, start + ls, side="right")
+        counts = hi - lo - 1
+        offsets = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        pos = offsets + np.arange(counts.sum())
+        a, b = perm[pos], perm[pos + 1]
+        if reverse:
+            a, b = b, a
+        return np.stack([np.repeat(center, counts), a, b], axis=1)
+
+    triangles = np.concatenate([
+        fan(keys_h, perm_h, lj * K + li, False),            # bottom
+        fan(keys, perm_v, (li + ls) * K + lj, False),       # right
+        fan(keys_h, perm_h, (lj + ls) * K + li, True),      # top
+        fan(keys, perm_v, li * K + lj, True),               # left
+    ])
+    x = xmin + (xmax - xmin) * i / M
+    y = ymin + (ymax - ymin) * j / M
+    return x, y, values, triangles
+
+
 def _uniform_eval(free_symbols, expr, *args, modules=None):
     """Convert the expression to a lambda function using the specified
     module. Perform the evaluation and return the results.
@@ -222,12 +501,103 @@ def _uniform_eval(free_symbols, expr, *args, modules=None):
         return expr(*args)
 
     # generate two lambda functions: the default one, and the backup in case
-    # of failures with the default one.
+    # of failures with the default one. The backup is only compiled when
+    # it is actually needed.
     f1 = lambdify(free_symbols, expr, modules=modules)
-    f2 = lambdify(free_symbols, expr, modules="sympy")
+    f2 = LazyLambdify(free_symbols, expr, modules="sympy")
     return _uniform_eval_helper(f1, f2, *args, modules=modules)
 
 
+def _split_expressions(exprs, params):
+    """Split the expressions into blocks that can be evaluated separately,
+    so that only the blocks depending on the parameters that changed need
+    to be re-evaluated.
+
+    First, common subexpressions are eliminated. Then, the maximal subtrees
+    whose dependency on the parameters differs from the one of their parent
+    are extracted into their own blocks. For example, ``u * f(x, y)`` is
+    split into ``b = f(x, y)``, which doesn't depend on the parameters, and
+    ``u * b``.
+
+    Note: this is an experimental function, as such it is prone to changes.
+    Please, do not use it in your code.
+
+    Parameters
+    ==========
+
+    exprs : list
+        The symbolic expressions.
+
+    params : iterable
+        The symbols representing the parameters.
+
+    Returns
+    =======
+
+    blocks : list
+        A list of tuples ``(symbol, expr, deps)`` in evaluation order, where
+        ``deps`` is the set of parameters the block depends on (directly or
+        through other blocks).
+
+    outputs : list
+        The expressions rewritten in terms of the blocks.
+    """
+    params = set(params)
+    # NOTE: cse doesn't support symbols which are not instances of Symbol,
+    # for example the base scalars of sympy.vector.
+    fs = set().union(*[e.free_symbols for e in exprs])
+    subs = {t: Dummy() for t in fs if not isinstance(t, Symbol)}
+    exprs = [e.xreplace(subs) for e in exprs]
+    params = set(subs.get(t, t) for t in params)
+    replacements, reduced = cse(exprs,
+        symbols=numbered_symbols(cls=Dummy))
+    deps, blocks, extracted = {}, [], {}
+
+    def get_deps(e):
+        d = set()
+        for t in e.free_symbols:
+            d.update(deps.get(t, {t}.intersection(params)))
+        return frozenset(d)
+
+    def add_block(e):
+        if e not in extracted:
+            d = get_deps(e)
+            symbol = Dummy()
+            blocks.append((symbol, split(e, d), d))
+            deps[symbol] = d
+            extracted[e] = symbol
+        return extracted[e]
+
+    def split(e, d):
+        # NOTE: only descend into the nodes that can be safely rebuilt
+        # from their arguments.
+        if (not isinstance(e, (Add, Mul, Pow, Function)) or
+            isinstance(e, Piecewise) or
+            (not all(isinstance(a, Expr) for a in e.args))):
+            return e
+        args = [add_block(a) if (not a.is_Atom) and (get_deps(a) != d)
+            else split(a, d) for a in e.args]
+        return e.func(*args)
+
+    for symbol, e in replacements:
+        deps[symbol] = get_deps(e)
+        blocks.append((symbol, split(e, deps[symbol]), deps[symbol]))
+
+    outputs = []
+    for e in reduced:
+        d = get_deps(e)
+        if (len(d) == 0) and (not e.is_Atom):
+            outputs.append(add_block(e))
+        else:
+            outputs.append(split(e, d))
+
+    inv = {v: k for k, v in subs.items()}
+    blocks = [(t, e.xreplace(inv), frozenset(inv.get(p, p) for p in d))
+        for t, e, d in blocks]
+    outputs = [e.xreplace(inv) for e in outputs]
+    return blocks, outputs
+
+
 def _uniform_eval_helper(f1, f2, *args, modules=None):
     """
     Note: this is an experimental function, as such it is prone to changes.
@@ -240,10 +610,10 @@ def _uniform_eval_helper(f1, f2, *args, modules=None):
             return complex(func(*args))
         except (ZeroDivisionError, OverflowError):
             return complex(np.nan, np.nan)
-    wrapper_func = np.vectorize(wrapper_func)
+    wrapper_func = np.vectorize(wrapper_func, otypes=[complex])
 
     try:
-        return wrapper_func(f1, *args)
+        return _vectorized_eval(f1, wrapper_func, *args)
     except Exception as err:
         warnings.warn(
             "The evaluation with %s failed.\n" % (
@@ -255,6 +625,299 @@ def _uniform_eval_helper(f1, f2, *args, modules=None):
         return wrapper_func(f2, *args)
 
 
+def _vectorized_eval(func, wrapper_func, *args):
+    """Evaluate ``func`` with a single call over the entire discretized
+    domain and convert the result to a complex array having the broadcast
+    shape of ``args``.
+
+    Note: this is an experimental function, as such it is prone to changes.
+    Please, do not use it in your code.
+
+    Parameters
+    ==========
+
+    func : callable
+        The lambdified function.
+
+    wrapper_func : callable
+        The element-wise (vectorized) evaluator, with signature
+        ``wrapper_func(func, *args)``. It is used when ``func`` is unable to
+        process arrays (for example, with ``modules="mpmath"`` or when the
+        expression contains a ``Sum``), or to evaluate the points whose
+        result can't be converted to a complex number.
+
+    args :
+        The necessary arguments to perform the evaluation.
+
+    Returns
+    =======
+    data : np.ndarray
+        A complex array with the broadcast shape of ``args``. Points raising
+        ``ZeroDivisionError`` or ``OverflowError`` are set to NaN.
+    """
+    np = import_module('numpy')
+
+    shape = np.broadcast_shapes(*[np.shape(a) for a in args])
+    try:
+        with np.errstate(all="ignore"):
+            res = func(*args)
+    except Exception:
+        # the lambdified function doesn't support arrays
+        return wrapper_func(func, *args)
+
+    if not isinstance(res, (np.ndarray, np.generic, int, float, complex)):
+        # for example, sympy or mpmath objects
+        return wrapper_func(func, *args)
+    res = np.asarray(res)
+    try:
+        res = np.broadcast_to(res, shape)
+    except ValueError:
+        return wrapper_func(func, *args)
+
+    if res.dtype != object:
+        # NOTE: astype returns a copy, hence the output is writeable even
+        # if res is a broadcast view.
+        return res.astype(complex)
+
+    # object arrays are usually produced by Python's integers (for example,
+    # when plotting a Sum with only_integers=True). Convert each element,
+    # falling back to the element-wise evaluation only for the points whose
+    # result can't be converted.
+    out = np.empty(shape, dtype=complex)
+    failed = np.zeros(shape, dtype=bool)
+    for idx, v in np.ndenumerate(res):
+        try:
+            out[idx] = complex(v)
+        except (ZeroDivisionError, OverflowError):
+            out[idx] = complex(np.nan, np.nan)
+        except (TypeError, ValueError):
+            failed[idx] = True
+    if failed.any():
+        bargs = [np.broadcast_to(a, shape)[failed] for a in args]
+        out[failed] = wrapper_func(func, *bargs)
+    return out
+
+
+def _get_chunk_size(chunk_size=None, max_memory=None):
+    """Return the maximum number of points to be evaluated at once, or None
+    if the domain has to be evaluated with a single call.
+
+    Parameters
+    ==========
+
+    chunk_size : int or None
+        Maximum number of points of each block.
+
+    max_memory : int or None
+        Approximate memory budget (in bytes) for the temporary arrays
+        created while evaluating a block. If ``chunk_size`` is also
+        provided, the smallest block size is used.
+    """
+    sizes = []
+    if chunk_size is not None:
+        sizes.append(int(chunk_size))
+    if max_memory is not None:
+        # NOTE: a lambdified function creates a few temporary arrays while
+        # evaluating a block, in addition to the complex result: assume
+        # the equivalent of 8 complex arrays (128 bytes per point).
+        sizes.append(int(max_memory) // 128)
+    if len(sizes) == 0:
+        return None
+    return max(1, min(sizes))
+
+
+def _get_blocks(shape, chunk_size):
+    """Split an array of the given shape into blocks containing at most
+    ``chunk_size`` elements. The leading axes are split first.
+
+    Returns
+    =======
+
+    blocks : iterator
+        Each block is a tuple of slices, one for each axis.
+    """
+    np = import_module('numpy')
+
+    shape = tuple(shape)
+    if (chunk_size is None) or (np.prod(shape) <= chunk_size):
+        yield tuple(slice(0, n) for n in shape)
+        return
+
+    block = list(shape)
+    for k in range(len(shape)):
+        if np.prod(block) <= chunk_size:
+            break
+        block[k] = max(1, int(chunk_size // np.prod(block[k+1:])))
+
+    starts = [range(0, n, b) for n, b in zip(shape, block)]
+    for idx in product(*starts):
+        yield tuple(slice(i, min(i + b, n))
+            for i, b, n in zip(idx, block, shape))
+
+
+def _tiled_eval(free_symbols, expr, *args, modules=None, chunk_size=None,
+    real=False):
+    """Evaluate an expression block by block over the broadcast shape of
+    ``args``, writing the results into a preallocated array.
+
+    Note: this is an experimental function, as such it is prone to changes.
+    Please, do not use it in your code.
+
+    Parameters
+    ==========
+
+    free_symbols : tuple or list
+        The free symbols associated to ``expr``.
+
+    expr : Expr or callable
+        The symbolic expression (or user-provided function) to be evaluated.
+
+    args :
+        Broadcastable arrays, for example the 1D axes of the domain
+        reshaped with ``np.meshgrid(..., sparse=True)``. Only the subsets of
+        each block are broadcast, hence the dense coordinates of the whole
+        domain are never created.
+
+    modules : str or None
+        The evaluation module. Refer to ``lambdify``.
+
+    chunk_size : int or None
+        Maximum number of points evaluated at once. If None, the whole
+        domain is evaluated with a single call.
+
+    real : boolean
+        If True, return a float array where the points having a non-zero
+        imaginary part are set to NaN. Otherwise, return a complex array.
+
+    Returns
+    =======
+
+    data : np.ndarray
+        An array with the broadcast shape of ``args``.
+    """
+    np = import_module('numpy')
+
+    args = [np.asarray(a) for a in args]
+    shape = np.broadcast_shapes(*[a.shape for a in args])
+    # align the dimensions of the arguments to the output
+    args = [a.reshape((1,) * (len(shape) - a.ndim) + a.shape) for a in args]
+    out = np.empty(shape, dtype=float if real else complex)
+
+    for block in _get_blocks(shape, chunk_size):
+        block_shape = tuple(b.stop - b.start for b in block)
+        bargs = [a[tuple(slice(None) if n == 1 else b
+            for n, b in zip(a.shape, block))] for a in args]
+        if callable(expr):
+            # NOTE: user-provided functions might not support broadcasting
+            bargs = [np.broadcast_to(a, block_shape) for a in bargs]
+        v = np.asarray(_uniform_eval(free_symbols, expr, *bargs,
+            modules=modules))
+        if v.shape != block_shape:
+            if v.size == np.prod(block_shape):
+                v = v.reshape(block_shape)
+            else:
+                v = np.broadcast_to(v, block_shape)
+
+        if real:
+            re_v = out[block]
+            re_v[...] = np.real(v)
+            re_v[np.invert(np.isclose(np.imag(v), 0))] = np.nan
+        else:
+            out[block] = v
+    return out
+
+
+def _broadcast_meshes(*arrays):
+    """Broadcast sparse coordinates (for example, the ones returned by
+    ``np.meshgrid(..., sparse=True)``) to their common shape.
+
+    Note: this is an experimental function, as such it is prone to changes.
+    Please, do not use it in your code.
+
+    Returns
+    =======
+
+    meshes : list
+        Read-only views: no memory is allocated. ``get_data`` returns these
+        views as they are, so the dense arrays are never materialized
+        unless the caller explicitly copies them.
+    """
+    np = import_module('numpy')
+
+    shape = np.broadcast_shapes(*[np.shape(a) for a in arrays])
+    return [np.broadcast_to(a, shape) for a in arrays]
+
+
+def _decimate(a, step):
+    """Keep one element every ``step`` along each dimension of ``a`` having
+    more than one element. The last element is always kept, so that the
+    decimated array covers the same domain.
+    """
+    np = import_module('numpy')
+
+    a = np.asarray(a)
+    for axis, n in enumerate(a.shape):
+        if n > 1:
+            idx = np.arange(0, n, step)
+            if idx[-1] != n - 1:
+                idx = np.append(idx, n - 1)
+            a = a.take(idx, axis=axis)
+    return a
+
+
+def _real_part(_re, _im):
+    """The real part of the results, NaN where the imaginary part is
+    not zero."""
+    np = import_module('numpy')
+    return np.where(np.isclose(_im, 0), _re, np.nan)
+
+
+def _absolute_value(_re, _im):
+    """The absolute value of the results."""
+    np = import_module('numpy')
+    return np.sqrt(_re**2 + _im**2)
+
+
+def _surface_color_func(x, y, z):
+    """Default coloring of surfaces: use the z-coordinate."""
+    return z
+
+
+def _parametric_surface_color_func(x, y, z, u, v):
+    """Default coloring of parametric surfaces: use the z-coordinate."""
+    return z
+
+
+def _cached_get_data(get_data):
+    """Decorate the ``get_data`` method of a data series in order to store
+    the numerical data. The stored data is discarded as soon as an attribute
+    affecting the evaluation is set (look at ``BaseSeries.__setattr__``).
+    """
+    def _readonly(data):
+        np = import_module('numpy')
+
+        # NOTE: the backends (or the user) might modify the returned arrays
+        # in place: return read-only views in order to keep the cache
+        # consistent without copying the data. Broadcast views (sparse
+        # meshes) are returned as they are, without being materialized.
+        if isinstance(data, np.ndarray):
+            view = data.view()
+            view.flags.writeable = False
+            return view
+        if isinstance(data, (list, tuple)):
+            return type(data)(_readonly(t) for t in data)
+        return data
+
+    @wraps(get_data)
+    def wrapper(self):
+        data = self.__dict__.get("_cached_data", None)
+        if data is None:
+            data = get_data(self)
+            self.__dict__["_cached_data"] = data
+        return _readonly(data)
+    return wrapper
+
+
 class BaseSeries:
     """Base class for the data objects containing stuff to be plotted.
 
@@ -300,6 +963,10 @@ class BaseSeries:
     is_point = False
     # If True, the rendering will use points, not lines.
 
+    is_mesh = False
+    # If True, the data is a triangular mesh: 1D arrays of coordinates of
+    # the vertices followed by an (M, 3) array of triangles.
+
     is_geometry = False
     # If True, it represents an object of the sympy.geometry module
 
@@ -315,9 +982,79 @@ class BaseSeries:
     # contains a list of keyword arguments supported by the series. It will be
     # used to validate the user-provided keyword arguments.
 
+    _cache_neutral_attributes = ["label", "_label", "_latex_label",
+        "rendering_kw", "_rendering_kw", "use_cm", "use_quiver_solid_color",
+        "is_filled", "is_point"]
+    # The numerical data generated by ``get_data`` is stored until any
+    # attribute is set. This list contains the attributes that don't affect
+    # the numerical evaluation: setting them doesn't invalidate the data.
+
     def __init__(self, *args, **kwargs):
         super().__init__()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # NOTE: wrap every implementation of ``get_data``, so that
+        # all series (even the ones defined by the user) store their data.
+        if "get_data" in cls.__dict__:
+            cls.get_data = _cached_get_data(cls.__dict__["get_data"])
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name not in self._cache_neutral_attributes:
+            self.clear_cache()
+
+    def clear_cache(self):
+        """Discard the stored numerical data, so that the next call to
+        ``get_data`` will evaluate the series again.
+
+        Notes
+        =====
+
+        The data is automatically discarded when an attribute of the series
+        is set, for example ``s.n = 100`` or ``s.params = {a: 1}``. This
+        method must be called after modifying an attribute in place, for
+        example a dictionary of parameters or a discretized range.
+        """
+        self.__dict__["_cached_data"] = None
+
+    def _get_cached_data(self):
+        """Return the stored numerical data, or None."""
+        return self.__dict__.get("_cached_data", None)
+
+    def _set_cached_data(self, data):
+        """Store numerical data computed elsewhere (for example, by a
+        worker process) as if it was generated by ``get_data``.
+        """
+        self.__dict__["_cached_data"] = data
+
+    def __getstate__(self):
+        # NOTE: the stored data is not needed to recreate the series.
+        state = self.__dict__.copy()
+        state["_cached_data"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _use_adaptive_module(self):
+        """The adaptive algorithms are implemented by ``_refine_1d`` and
+        ``_refine_2d``. The ``adaptive`` module is only used when its
+        learner-specific options are provided: a loss function or a callable
+        goal.
+        """
+        return (self.loss_fn is not None) or callable(self.adaptive_goal)
+
+    def _get_tolerance(self):
+        """Return the tolerance used by ``_refine_1d`` and ``_refine_2d``.
+        If not provided, use the numeric value of ``adaptive_goal``.
+        """
+        if self.tolerance is not None:
+            return float(self.tolerance)
+        if isinstance(self.adaptive_goal, (int, float)):
+            return float(self.adaptive_goal)
+        return 0.01
+
     def _init_transforms(self, **kwargs):
         self._tx = kwargs.get("tx", None)
         self._ty = kwargs.get("ty", None)
@@ -612,6 +1349,8 @@ class Line2DBaseSeries(BaseSeries):
         self.adaptive = kwargs.get("adaptive", cfg["adaptive"]["used_by_default"])
         self.adaptive_goal = kwargs.get("adaptive_goal", cfg["adaptive"]["goal"])
         self.loss_fn = kwargs.get("loss_fn", None)
+        self.tolerance = kwargs.get("tolerance", None)
+        self.max_points = int(kwargs.get("max_points", 10000))
         self.rendering_kw = kwargs.get("rendering_kw", dict())
         self.use_cm = kwargs.get("use_cm", True)
         self.color_func = kwargs.get("color_func", None)
@@ -702,8 +1441,9 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
 
     _allowed_keys = ["absarg", "adaptive", "adaptive_goal", "color_func",
     "detect_poles", "eps","is_complex", "is_filled", "is_point", "line_color",
-    "loss_fn", "modules", "n", "only_integers", "rendering_kw", "steps",
-    "use_cm", "xscale", "tx", "ty", "tz", "is_polar"]
+    "loss_fn", "max_points", "modules", "n", "only_integers",
+    "poles_refinement", "rendering_kw", "steps", "tolerance", "use_cm",
+    "xscale", "tx", "ty", "tz", "is_polar"]
 
     def __new__(cls, *args, **kwargs):
         if kwargs.get("absarg", False):
@@ -733,6 +1473,7 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         self.is_polar = kwargs.get("is_polar", False)
         self.detect_poles = kwargs.get("detect_poles", False)
         self.eps = kwargs.get("eps", 0.01)
+        self.poles_refinement = int(kwargs.get("poles_refinement", 0))
 
         # if the expressions is a lambda function and no label has been
         # provided, then its better to do the following to avoid suprises on
@@ -751,6 +1492,17 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
     def _adaptive_sampling(self):
         np = import_module('numpy')
 
+        if not self._use_adaptive_module():
+            def evaluate(x):
+                xx = x + 1j * self.start.imag if self.is_complex else x
+                w = _eval_points([self.var], self.expr, xx, modules=self.modules)
+                return [x, np.real(w), np.imag(w)]
+
+            _, data = _refine_1d(evaluate, self.start.real, self.end.real,
+                self._get_tolerance(), self.max_points,
+                get_coords=self._adaptive_coords)
+            return data[0], data[1].copy(), data[2].copy()
+
         def func(f, imag, x):
             try:
                 w = complex(f(x + 1j * imag))
@@ -768,10 +1520,17 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         return data[:, 0], data[:, 1], data[:, 2]
 
     def _uniform_sampling(self):
-        np = import_module('numpy')
+        x = self._discretize(self.start.real, self.end.real, self.n, scale=self.scale, only_integers=self.only_integers)
+        _re, _im = self._evaluate_at(x)
+        return x, _re, _im
 
-        x = xx = self._discretize(self.start.real, self.end.real, self.n, scale=self.scale, only_integers=self.only_integers)
+    def _evaluate_at(self, x):
+        """Evaluate the expression at the real coordinates ``x``. Return the
+        real and imaginary parts of the results.
+        """
+        np = import_module('numpy')
 
+        xx = x
         if self.is_complex:
             xx = xx + 1j * self.start.imag
         elif self.only_integers:
@@ -792,7 +1551,13 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         # value will be returned, no matter the shape of x.
         _re = self._correct_shape(_re, x)
         _im = self._correct_shape(_im, x)
-        return x, _re, _im
+        return _re, _im
+
+    def _adaptive_coords(self, data):
+        """The coordinates used by the adaptive algorithm to measure the
+        quality of the sampling."""
+        np = import_module('numpy')
+        return np.array([data[0], _real_part(data[1], data[2])])
 
     def _get_real_imag(self):
         """ By evaluating the function over a complex range it should
@@ -803,6 +1568,19 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
             return self._adaptive_sampling()
         return self._uniform_sampling()
 
+    @staticmethod
+    def _find_steep_segments(x, y, eps=0.01):
+        """Compute the steepness of each segment. Return a boolean array
+        (one element less than ``x``) which is True where the steepness is
+        greater than a threshold.
+        """
+        np = import_module('numpy')
+
+        threshold = np.pi / 2 - eps
+        with np.errstate(all="ignore"):
+            angle = np.arctan(np.abs(np.diff(y)) / np.diff(x))
+        return angle >= threshold
+
     @staticmethod
     def _detect_poles(x, y, eps=0.01):
         """Compute the steepness of each segment. If it's greater than a
@@ -811,15 +1589,73 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         np = import_module('numpy')
 
         yy = y.copy()
-        threshold = np.pi / 2 - eps
-        for i in range(len(x) - 1):
-            dx = x[i + 1] - x[i]
-            dy = abs(y[i + 1] - y[i])
-            angle = np.arctan(dy / dx)
-            if angle >= threshold:
-                yy[i + 1] = np.nan
+        yy[1:][LineOver1DRangeSeries._find_steep_segments(x, y, eps)] = np.nan
         return x, yy
 
+    @staticmethod
+    def _refine_poles(x, _re, _im, evaluate, get_y, eps=0.01, passes=1,
+        subdivisions=10):
+        """Re-sample the segments flagged by the pole detection algorithm
+        at a higher resolution, so that the poles are located more
+        accurately without increasing the number of discretization points.
+
+        Parameters
+        ==========
+
+        x, _re, _im : np.ndarray
+            The discretized domain and the real and imaginary parts of the
+            results of the evaluation.
+
+        evaluate : callable
+            ``evaluate(x)`` must return the real and imaginary parts of the
+            results of the evaluation at the real coordinates ``x``.
+
+        get_y : callable
+            ``get_y(_re, _im)`` returns the y-coordinates used by the pole
+            detection algorithm.
+
+        eps : float
+            Look at ``_detect_poles``.
+
+        passes : int
+            Number of refinement passes. At each pass, the segments whose
+            steepness is still greater than the threshold are divided into
+            ``subdivisions`` segments.
+
+        Returns
+        =======
+
+        x, _re, _im : np.ndarray
+            The refined arrays.
+        """
+        np = import_module('numpy')
+
+        t = np.linspace(0, 1, subdivisions + 1)[1:-1]
+        for _ in range(passes):
+            idx = np.flatnonzero(LineOver1DRangeSeries._find_steep_segments(
+                x, get_y(_re, _im), eps))
+            if len(idx) == 0:
+                break
+            new_x = (x[idx, None] + (x[idx + 1] - x[idx])[:, None] * t).flatten()
+            new_re, new_im = evaluate(new_x)
+            # NOTE: np.insert preserves the order of repeated indices
+            positions = np.repeat(idx + 1, len(t))
+            x = np.insert(x, positions, new_x)
+            _re = np.insert(_re, positions, new_re)
+            _im = np.insert(_im, positions, new_im)
+        return x, _re, _im
+
+    def _get_real_imag_refined(self, get_y):
+        """Like ``_get_real_imag``, but the segments containing poles are
+        re-sampled if ``detect_poles=True`` and ``poles_refinement > 0``.
+        """
+        x, _re, _im = self._get_real_imag()
+        if (self.detect_poles and (self.poles_refinement > 0) and
+            (not self.only_integers)):
+            x, _re, _im = self._refine_poles(x, _re, _im, self._evaluate_at,
+                get_y, self.eps, self.poles_refinement)
+        return x, _re, _im
+
     def _get_points(self):
         """Returns coordinates that needs to be postprocessed.
         Depending on the `adaptive` option, this function will either use an
@@ -828,7 +1664,7 @@ class LineOver1DRangeSeries(Line2DBaseSeries):
         """
         np = import_module('numpy')
 
-        x, _re, _im = self._get_real_imag()
+        x, _re, _im = self._get_real_imag_refined(_real_part)
         # The evaluation could produce complex numbers. Set real elements
         # to NaN where there are non-zero imaginary elements
         _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
@@ -871,6 +1707,10 @@ class AbsArgLineSeries(LineOver1DRangeSeries):
             str((self.start, self.end)),
         )
 
+    def _adaptive_coords(self, data):
+        np = import_module('numpy')
+        return np.array([data[0], _absolute_value(data[1], data[2])])
+
     def _get_points(self):
         """Returns coordinates that needs to be postprocessed.
         Depending on the `adaptive` option, this function will either use an
@@ -879,7 +1719,7 @@ class AbsArgLineSeries(LineOver1DRangeSeries):
         """
         np = import_module('numpy')
 
-        x, _re, _im = self._get_real_imag()
+        x, _re, _im = self._get_real_imag_refined(_absolute_value)
         _abs = np.sqrt(_re**2 + _im**2)
         _angle = np.arctan2(_im, _re)
         if self.detect_poles:
@@ -890,8 +1730,9 @@ class AbsArgLineSeries(LineOver1DRangeSeries):
 class ParametricLineBaseSeries(Line2DBaseSeries):
     is_parametric = True
     _allowed_keys = ["adaptive", "adaptive_goal", "color_func", "is_filled",
-    "is_point", "line_color", "loss_fn", "modules", "n", "only_integers",
-    "rendering_kw", "use_cm", "xscale", "tx", "ty", "tz"]
+    "is_point", "line_color", "loss_fn", "max_points", "modules", "n",
+    "only_integers", "rendering_kw", "tolerance", "use_cm", "xscale",
+    "tx", "ty", "tz"]
 
     def _set_parametric_line_label(self, label):
         """Logic to set the correct label to be shown on the plot.
@@ -931,6 +1772,16 @@ class ParametricLineBaseSeries(Line2DBaseSeries):
     def _adaptive_sampling(self):
         np = import_module('numpy')
 
+        if not self._use_adaptive_module():
+            def evaluate(t):
+                return [_real_part(np.real(w), np.imag(w)) for w in
+                    [_eval_points([self.var], e, t, modules=self.modules)
+                        for e in self.get_expr()]]
+
+            t, data = _refine_1d(evaluate, self.start, self.end,
+                self._get_tolerance(), self.max_points)
+            return (*data, t)
+
         def func(f, is_2Dline, x):
             try:
                 w = [complex(t) for t in f(x)]
@@ -1069,9 +1920,11 @@ class SurfaceBaseSeries(BaseSeries):
     """A base class for 3D surfaces."""
 
     is_3Dsurface = True
-    _allowed_keys = ["adaptive", "adaptive_goal", "color_func", "is_polar",
-    "loss_fn", "modules", "n1", "n2", "only_integers", "rendering_kw",
-    "surface_color", "use_cm", "xscale", "yscale", "tx", "ty", "tz"]
+    _allowed_keys = ["adaptive", "adaptive_goal", "adaptive_mesh",
+    "chunk_size", "color_func", "is_polar", "loss_fn", "max_memory",
+    "max_points", "modules", "n1", "n2", "only_integers", "rendering_kw",
+    "surface_color", "tolerance", "use_cm", "xscale", "yscale", "tx", "ty",
+    "tz"]
 
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -1082,13 +1935,20 @@ class SurfaceBaseSeries(BaseSeries):
         self.yscale = kwargs.get("yscale", "linear")
         self.adaptive = kwargs.get("adaptive", False)
         self.adaptive_goal = kwargs.get("adaptive_goal", cfg["adaptive"]["goal"])
+        self.adaptive_mesh = kwargs.get("adaptive_mesh", False)
         self.loss_fn = kwargs.get("loss_fn", None)
+        self.tolerance = kwargs.get("tolerance", None)
+        self.max_points = int(kwargs.get("max_points", 10000))
         self.modules = kwargs.get("modules", None)
+        self.chunk_size = kwargs.get("chunk_size",
+            cfg["evaluation"]["chunk_size"])
+        self.max_memory = kwargs.get("max_memory",
+            cfg["evaluation"]["max_memory"])
         self.rendering_kw = kwargs.get("rendering_kw", dict())
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
         self.is_polar = kwargs.get("is_polar", False)
         self.surface_color = kwargs.get("surface_color", None)
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _surface_color_func)
         if callable(self.surface_color):
             self.color_func = self.surface_color
             self.surface_color = None
@@ -1106,14 +1966,17 @@ class SurfaceBaseSeries(BaseSeries):
         if is_lambda and (self._label == str(exprs)):
                 self.label = ""
 
-    def _discretize(self, s1, e1, s2, e2):
+    def _discretize(self, s1, e1, s2, e2, sparse=False):
         np = import_module('numpy')
 
         mesh_x = super()._discretize(s1, e1, self.n1,
             self.xscale, self.only_integers)
         mesh_y = super()._discretize(s2, e2, self.n2,
             self.yscale, self.only_integers)
-        return np.meshgrid(mesh_x, mesh_y)
+        return np.meshgrid(mesh_x, mesh_y, sparse=sparse)
+
+    def _get_chunk_size(self):
+        return _get_chunk_size(self.chunk_size, self.max_memory)
 
 
 class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
@@ -1131,6 +1994,13 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
         self.end_y = float(var_start_end_y[2])
         self._set_surface_label(label)
 
+    @property
+    def is_mesh(self):
+        """True if the adaptive algorithm returns a triangular mesh instead
+        of a uniform grid."""
+        return (self.adaptive and self.adaptive_mesh and self.is_3Dsurface
+            and (not self._use_adaptive_module()))
+
     def __str__(self):
         return ("cartesian surface: %s for" " %s over %s and %s over %s") % (
             str(self.expr),
@@ -1141,31 +2011,75 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
     def _adaptive_sampling(self):
         np = import_module('numpy')
 
-        def func(f, xy):
-            try:
-                return f(*xy)
-            except (ZeroDivisionError, OverflowError):
-                return np.nan
-
-        return _adaptive_eval(
-            func, [self.var_x, self.var_y], self.expr,
-            [(self.start_x, self.end_x), (self.start_y, self.end_y)],
-            modules=self.modules,
-            adaptive_goal=self.adaptive_goal,
-            loss_fn=self.loss_fn)
-
-    def _uniform_sampling(self):
+        if self._use_adaptive_module():
+            def func(f, xy):
+                try:
+                    return f(*xy)
+                except (ZeroDivisionError, OverflowError):
+                    return np.nan
+
+            return _adaptive_eval(
+                func, [self.var_x, self.var_y], self.expr,
+                [(self.start_x, self.end_x), (self.start_y, self.end_y)],
+                modules=self.modules,
+                adaptive_goal=self.adaptive_goal,
+                loss_fn=self.loss_fn)
+
+        def evaluate(x, y):
+            v = _eval_points([self.var_x, self.var_y], self.expr, x, y,
+                modules=self.modules)
+            return _real_part(np.real(v), np.imag(v))
+
+        x, y, z, triangles = _refine_2d(evaluate,
+            self.start_x, self.end_x, self.start_y, self.end_y,
+            tolerance=self._get_tolerance(), max_points=self.max_points)
+        if self.is_mesh:
+            # remove the triangles touching the points where the function
+            # is not defined
+            triangles = triangles[np.all(np.isfinite(z[triangles]), axis=1)]
+            # drop the vertices no longer referenced by the triangles (the
+            # NaN ones, at least) and reindex the triangles accordingly
+            used, triangles = np.unique(triangles, return_inverse=True)
+            triangles = triangles.reshape(-1, 3)
+            return x[used], y[used], z[used], triangles
+        return self._resample_mesh(x, y, z, triangles)
+
+    def _resample_mesh(self, x, y, z, triangles):
+        """Linearly interpolate the adaptive mesh over a uniform grid with
+        the resolution of its smallest cells.
+        """
         np = import_module('numpy')
+        matplotlib = import_module(
+            'matplotlib',
+            import_kwargs={'fromlist': ['tri']},
+            min_module_version='1.1.0',
+            catch=(RuntimeError,))
+        mtri = matplotlib.tri
+
+        def num_points(t):
+            # NOTE: limit the size of the grid, otherwise the smallest cells
+            # close to singularities would produce huge arrays.
+            return min(int(round(1 / np.diff(np.unique(t)).min())) + 1, 1025)
+
+        mask = np.invert(np.all(np.isfinite(z[triangles]), axis=1))
+        tri = mtri.Triangulation(x, y, triangles, mask=mask)
+        interp = mtri.LinearTriInterpolator(tri, np.nan_to_num(z))
+        # normalized coordinates of the lattice
+        xn = (x - self.start_x) / (self.end_x - self.start_x)
+        yn = (y - self.start_y) / (self.end_y - self.start_y)
+        xx, yy = np.meshgrid(
+            np.linspace(self.start_x, self.end_x, num_points(xn)),
+            np.linspace(self.start_y, self.end_y, num_points(yn)))
+        zz = interp(xx, yy)
+        return xx, yy, np.ma.filled(zz.astype(float), np.nan)
 
-        mesh_x, mesh_y = self._discretize(self.start_x, self.end_x,
-            self.start_y, self.end_y)
-
-        v = _uniform_eval([self.var_x, self.var_y], self.expr,
-            mesh_x, mesh_y, modules=self.modules)
-        re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_shape(re_v, mesh_x)
-        im_v = self._correct_shape(im_v, mesh_x)
-        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
+    def _uniform_sampling(self):
+        x, y = self._discretize(self.start_x, self.end_x,
+            self.start_y, self.end_y, sparse=True)
+        re_v = _tiled_eval([self.var_x, self.var_y], self.expr, x, y,
+            modules=self.modules, chunk_size=self._get_chunk_size(),
+            real=True)
+        mesh_x, mesh_y = _broadcast_meshes(x, y)
         return mesh_x, mesh_y, re_v
 
     def get_data(self):
@@ -1184,6 +2098,11 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
 
         z : np.ndarray [n2 x n1]
             Results of the evaluation.
+
+        triangles : np.ndarray [M x 3]
+            Only returned if ``is_mesh=True``: in this case, ``mesh_x,
+            mesh_y, z`` are 1D arrays containing the coordinates of the
+            vertices of the triangles.
         """
         np = import_module('numpy')
 
@@ -1192,13 +2111,11 @@ class SurfaceOver2DRangeSeries(SurfaceBaseSeries):
         else:
             res = self._uniform_sampling()
 
-        x, y, z = res
-        r = x.copy()
+        x, y, z = res[:3]
         if self.is_polar:
-            x = r * np.cos(y)
-            y = r * np.sin(y)
+            x, y = x * np.cos(y), x * np.sin(y)
 
-        return self._apply_transform(x, y, z)
+        return (*self._apply_transform(x, y, z), *res[3:])
 
 
 class ParametricSurfaceSeries(SurfaceBaseSeries):
@@ -1221,7 +2138,7 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
         self.start_v = float(var_start_end_v[1])
         self.end_v = float(var_start_end_v[2])
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
-        self.color_func = kwargs.get("color_func", lambda x, y, z, u, v: z)
+        self.color_func = kwargs.get("color_func", _parametric_surface_color_func)
         self._set_surface_label(label)
 
         if self.adaptive:
@@ -1251,15 +2168,9 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
         """ Evaluate the specified expression over a predefined
         param-discretization.
         """
-        np = import_module('numpy')
-
-        v = _uniform_eval([self.var_u, self.var_v], expr, *args,
-            modules=self.modules)
-        re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_shape(re_v, args[0])
-        im_v = self._correct_shape(im_v, args[0])
-        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
-        return re_v
+        return _tiled_eval([self.var_u, self.var_v], expr, *args,
+            modules=self.modules, chunk_size=self._get_chunk_size(),
+            real=True)
 
     def get_data(self):
         """Return arrays of coordinates for plotting. Depending on the
@@ -1280,11 +2191,12 @@ class ParametricSurfaceSeries(SurfaceBaseSeries):
         mesh_v : np.ndarray [n2 x n1]
             Discretized v range.
         """
-        mesh_u, mesh_v = self._discretize(self.start_u, self.end_u,
-            self.start_v, self.end_v)
-        x = self._eval_component(self.expr_x, mesh_u, mesh_v)
-        y = self._eval_component(self.expr_y, mesh_u, mesh_v)
-        z = self._eval_component(self.expr_z, mesh_u, mesh_v)
+        u, v = self._discretize(self.start_u, self.end_u,
+            self.start_v, self.end_v, sparse=True)
+        x = self._eval_component(self.expr_x, u, v)
+        y = self._eval_component(self.expr_y, u, v)
+        z = self._eval_component(self.expr_z, u, v)
+        mesh_u, mesh_v = _broadcast_meshes(u, v)
         return x, y, z, mesh_u, mesh_v
 
 
@@ -1404,18 +2316,14 @@ class ImplicitSeries(BaseSeries):
 
     def get_data(self):
         if self.adaptive:
-            import sympy.plotting.intervalmath.lib_interval as li
-
             user_functions = {}
             printer = IntervalMathPrinter({
                 'fully_qualified_modules': False, 'inline': True,
                 'allow_unknown_functions': True,
                 'user_functions': user_functions})
 
-            keys = [t for t in dir(li) if ("__" not in t) and (t not in ["import_module", "interval"])]
-            vals = [getattr(li, k) for k in keys]
-            d = {k: v for k, v in zip(keys, vals)}
-            func = lambdify((self.var_x, self.var_y), self.expr, modules=[d], printer=printer)
+            func = lambdify((self.var_x, self.var_y), self.expr,
+                modules=[intervalmath.namespace()], printer=printer)
 
             try:
                 data = self._get_raster_interval(func)
@@ -1443,11 +2351,26 @@ class ImplicitSeries(BaseSeries):
         return self._get_meshes_grid()
 
     def _get_raster_interval(self, func):
-        """Uses interval math to adaptively mesh and obtain the plot"""
+        """Uses interval math to adaptively mesh and obtain the plot.
+
+        Each level of subdivision is evaluated with a single call over
+        arrays of intervals.
+
+        Returns
+        =======
+
+        rectangles : np.ndarray [n x 4]
+            Each row contains ``x_start, x_end, y_start, y_end`` of a
+            rectangle satisfying the expression.
+
+        plot_type : str
+            ``"fill"``.
+        """
         np = import_module('numpy')
+        IntervalArray = intervalmath.IntervalArray
+        TRUE, FALSE = intervalmath.TRUE, intervalmath.FALSE
 
         k = self.depth
-        interval_list = []
         # Create initial 32 divisions
         xsample = np.linspace(self.start_x, self.end_x, 33)
         ysample = np.linspace(self.start_y, self.end_y, 33)
@@ -1468,60 +2391,47 @@ class ImplicitSeries(BaseSeries):
         xsample += jitterx
         ysample += jittery
 
-        xinter = [interval(x1, x2) for x1, x2 in zip(xsample[:-1], xsample[1:])]
-        yinter = [interval(y1, y2) for y1, y2 in zip(ysample[:-1], ysample[1:])]
-        interval_list = [[x, y] for x in xinter for y in yinter]
+        # each row of cells contains: x_start, x_end, y_start, y_end
+        n = len(xsample) - 1
+        cells = np.stack([
+            np.repeat(xsample[:-1], n), np.repeat(xsample[1:], n),
+            np.tile(ysample[:-1], n), np.tile(ysample[1:], n)], axis=1)
         plot_list = []
 
-        # recursive call refinepixels which subdivides the intervals which are
-        # neither True nor False according to the expression.
-        def refine_pixels(interval_list):
-            """Evaluates the intervals and subdivides the interval if the
-            expression is partially satisfied."""
-            temp_interval_list = []
-            plot_list = []
-            for intervals in interval_list:
-
-                # Convert the array indices to x and y values
-                intervalx = intervals[0]
-                intervaly = intervals[1]
-                func_eval = func(intervalx, intervaly)
-                # The expression is valid in the interval. Change the contour
-                # array values to 1.
-                if func_eval[1] is False or func_eval[0] is False:
-                    pass
-                elif func_eval == (True, True):
-                    plot_list.append([intervalx, intervaly])
-                elif func_eval[1] is None or func_eval[0] is None:
-                    # Subdivide
-                    avgx = intervalx.mid
-                    avgy = intervaly.mid
-                    a = interval(intervalx.start, avgx)
-                    b = interval(avgx, intervalx.end)
-                    c = interval(intervaly.start, avgy)
-                    d = interval(avgy, intervaly.end)
-                    temp_interval_list.append([a, c])
-                    temp_interval_list.append([a, d])
-                    temp_interval_list.append([b, c])
-                    temp_interval_list.append([b, d])
-            return temp_interval_list, plot_list
-
-        while k >= 0 and len(interval_list):
-            interval_list, plot_list_temp = refine_pixels(interval_list)
-            plot_list.extend(plot_list_temp)
+        def evaluate(cells):
+            res = func(IntervalArray(cells[:, 0], cells[:, 1]),
+                IntervalArray(cells[:, 2], cells[:, 3]))
+            if not isinstance(res, intervalmath.MembershipArray):
+                raise TypeError(
+                    "The expression doesn't evaluate to a comparison.")
+            return res.truth, res.valid
+
+        # subdivides the cells in which the expression is partially
+        # satisfied: all the cells of a level are evaluated at once.
+        while k >= 0 and len(cells):
+            truth, valid = evaluate(cells)
+            # The expression is valid in the cell.
+            plot_list.append(cells[(truth == TRUE) & (valid == TRUE)])
+            undecided = (truth != FALSE) & (valid != FALSE) & np.invert(
+                (truth == TRUE) & (valid == TRUE))
+            cells = cells[undecided]
+            xm = (cells[:, 0] + cells[:, 1]) / 2
+            ym = (cells[:, 2] + cells[:, 3]) / 2
+            x0, x1, y0, y1 = cells.T
+            cells = np.concatenate([
+                np.stack([x0, xm, y0, ym], axis=1),
+                np.stack([x0, xm, ym, y1], axis=1),
+                np.stack([xm, x1, y0, ym], axis=1),
+                np.stack([xm, x1, ym, y1], axis=1)])
             k = k - 1
         # Check whether the expression represents an equality
         # If it represents an equality, then none of the intervals
         # would have satisfied the expression due to floating point
         # differences. Add all the undecided values to the plot.
-        if self.has_equality:
-            for intervals in interval_list:
-                intervalx = intervals[0]
-                intervaly = intervals[1]
-                func_eval = func(intervalx, intervaly)
-                if func_eval[1] and func_eval[0] is not False:
-                    plot_list.append([intervalx, intervaly])
-        return plot_list, "fill"
+        if self.has_equality and len(cells):
+            truth, valid = evaluate(cells)
+            plot_list.append(cells[(valid == TRUE) & (truth != FALSE)])
+        return np.concatenate(plot_list), "fill"
 
     def _get_meshes_grid(self):
         """Generates the mesh for generating a contour.
@@ -1610,7 +2520,7 @@ class Implicit3DSeries(SurfaceBaseSeries):
                 str(self.var_z), str((self.start_z, self.end_z))
             )
 
-    def _discretize(self, s1, e1, s2, e2, s3, e3):
+    def _discretize(self, s1, e1, s2, e2, s3, e3, sparse=False):
         np = import_module('numpy')
 
         mesh_x = BaseSeries._discretize(s1, e1, self.n1,
@@ -1619,7 +2529,8 @@ class Implicit3DSeries(SurfaceBaseSeries):
             self.yscale, self.only_integers)
         mesh_z = BaseSeries._discretize(s3, e3, self.n3,
             self.zscale, self.only_integers)
-        return np.meshgrid(mesh_x, mesh_y, mesh_z, indexing='ij')
+        return np.meshgrid(mesh_x, mesh_y, mesh_z, indexing='ij',
+            sparse=sparse)
 
     def get_data(self):
         """Evaluate the expression over the provided domain. The backend will
@@ -1633,18 +2544,14 @@ class Implicit3DSeries(SurfaceBaseSeries):
         mesh_z : np.ndarray [n1 x n2 x n3]
         f : np.ndarray [n1 x n2 x n3]
         """
-        np = import_module('numpy')
-
-        mesh_x, mesh_y, mesh_z = self._discretize(
+        x, y, z = self._discretize(
             self.start_x, self.end_x,
             self.start_y, self.end_y,
-            self.start_z, self.end_z)
-        v = _uniform_eval([self.var_x, self.var_y, self.var_z], self.expr,
-                mesh_x, mesh_y, mesh_z, modules=self.modules)
-        re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_shape(re_v, mesh_x)
-        im_v = self._correct_shape(im_v, mesh_x)
-        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
+            self.start_z, self.end_z, sparse=True)
+        re_v = _tiled_eval([self.var_x, self.var_y, self.var_z], self.expr,
+            x, y, z, modules=self.modules,
+            chunk_size=self._get_chunk_size(), real=True)
+        mesh_x, mesh_y, mesh_z = _broadcast_meshes(x, y, z)
         return mesh_x, mesh_y, mesh_z, re_v
 
 
@@ -1666,6 +2573,10 @@ class InteractiveSeries(BaseSeries):
     """
     is_interactive = True
 
+    _allow_preview = True
+    # If True, the series can be evaluated over a decimated domain in order
+    # to quickly show a preview of the results (look at ``_set_preview``).
+
     def __new__(cls, exprs, ranges, *args, **kwargs):
         nexpr, npar = len(exprs), len(ranges)
 
@@ -1748,15 +2659,7 @@ class InteractiveSeries(BaseSeries):
         self._latex_label = latex(self.expr) if label is None else label
         self.signature = sorted(self.expr.free_symbols, key=lambda t: t.name)
 
-        # Generate a list of lambda functions, two for each expression:
-        # 1. the default one.
-        # 2. the backup one, in case of failures with the default one.
-        self.functions = []
-        for e in exprs:
-            self.functions.append([
-                lambdify(self.signature, e, modules=self.modules),
-                lambdify(self.signature, e, modules="sympy", dummify=True),
-            ])
+        self._create_functions(exprs)
 
         # Discretize the ranges. In the dictionary self.ranges:
         #    key: symbol associate to this particular range
@@ -1792,6 +2695,62 @@ class InteractiveSeries(BaseSeries):
 
         self._set_discretization_ranges(discr_symbols, discretizations)
 
+    def _create_functions(self, exprs):
+        """Generate a list of lambda functions, two for each expression:
+
+        1. the default one.
+        2. the backup one, in case of failures with the default one. It is
+           compiled the first time it is needed.
+        """
+        self._functions_exprs = exprs
+        self.functions = []
+        for e in exprs:
+            self.functions.append([
+                lambdify(self.signature, e, modules=self.modules),
+                LazyLambdify(self.signature, e, modules="sympy", dummify=True),
+            ])
+        self._create_blocks(exprs)
+
+    def _create_blocks(self, exprs):
+        """Split the expressions into blocks (look at
+        ``_split_expressions``) and generate their lambda functions. The
+        blocks not depending on the parameters are evaluated only once,
+        the other ones only when the parameters they depend on change.
+        """
+        # NOTE: the incremental evaluation is only implemented for the
+        # vectorized evaluation with NumPy/SciPy.
+        self._blocks = None
+        if (self.modules is not None) or (not all(
+            isinstance(e, Expr) for e in exprs)):
+            return
+
+        def compile_block(e):
+            block_signature = sorted(e.free_symbols, key=default_sort_key)
+            return (block_signature, [
+                lambdify(block_signature, e, modules=self.modules),
+                LazyLambdify(block_signature, e, modules="sympy",
+                    dummify=True)])
+
+        blocks, outputs = _split_expressions(exprs, self._params.keys())
+        self._blocks = [(s, *compile_block(e)) for s, e, _ in blocks]
+        self._block_outputs = [o if o.is_Symbol else compile_block(o)
+            for o in outputs]
+        # key: block symbol, value: (arguments, result) of the last evaluation
+        self._block_values = {}
+
+    def __getstate__(self):
+        # NOTE: lambdified functions can't be pickled. They are going to be
+        # recreated (or retrieved from the cache) when unpickling.
+        state = super().__getstate__()
+        for k in ["functions", "_blocks", "_block_outputs", "_block_values"]:
+            state.pop(k, None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        if "_functions_exprs" in state:
+            self._create_functions(self._functions_exprs)
+
     def _init_num_discretization_points(self, **kwargs):
         """Subclasses should override this method to provide dirrent values."""
         self.n1 = int(kwargs.get("n1", 250))
@@ -1808,8 +2767,10 @@ class InteractiveSeries(BaseSeries):
         """
         np = import_module('numpy')
 
+        # NOTE: sparse meshes are broadcast by the evaluation. Use
+        # _broadcast_meshes to get (read-only views of) the full coordinates.
         meshes = np.meshgrid(*discretizations,
-            indexing="xy" if not self.is_3Dvector else "ij")
+            indexing="xy" if not self.is_3Dvector else "ij", sparse=True)
         self.ranges = {k: v for k, v in zip(discr_symbols, meshes)}
 
 
@@ -1831,6 +2792,34 @@ class InteractiveSeries(BaseSeries):
     def params(self, p):
         self._params = p
 
+    def _set_preview(self, step):
+        """Evaluate the series over a decimated domain, keeping one point
+        every ``step`` along each direction (the end points are always
+        kept). With ``step=1``, the full resolution is restored.
+
+        The discretized ranges and the results of the blocks not depending
+        on the parameters are stored separately for the two resolutions,
+        so that switching between them doesn't require to evaluate those
+        blocks again.
+        """
+        step = max(int(step), 1)
+        current = self.__dict__.get("_preview_step", 1)
+        if (not self._allow_preview) or (step == current):
+            return
+
+        if current == 1:
+            self._full_resolution = (self.ranges,
+                getattr(self, "_block_values", {}))
+        ranges, values = self._full_resolution
+        if step > 1:
+            ranges = {k: _decimate(v, step) for k, v in ranges.items()}
+            values = {}
+        else:
+            del self._full_resolution
+        self.ranges = ranges
+        self._block_values = values
+        self._preview_step = step
+
     def _str(self, series_type):
         np = import_module('numpy')
 
@@ -1868,31 +2857,93 @@ class InteractiveSeries(BaseSeries):
         """
         np = import_module('numpy')
 
-        # discretized ranges all have the same shape. Take the first!
-        discr = list(self.ranges.values())[0]
+        # NOTE: the discretized ranges might be sparse meshes, and the
+        # expressions might not use all of them: broadcast the results to
+        # the shape of the whole domain.
+        shape = np.broadcast_shapes(
+            *[np.shape(v) for v in self.ranges.values()])
 
-        args = []
-        for s in self.signature:
-            if s in self._params.keys():
-                args.append(self._params[s])
-            else:
-                args.append(self.ranges[s])
+        if self._use_blocks():
+            results = self._evaluate_blocks()
+        else:
+            args = []
+            for s in self.signature:
+                if s in self._params.keys():
+                    args.append(self._params[s])
+                else:
+                    args.append(self.ranges[s])
+            results = [_uniform_eval_helper(*f, *args)
+                for f in self.functions]
 
-        results = []
-        for f in self.functions:
-            r = _uniform_eval_helper(*f, *args)
+        for i, r in enumerate(results):
+            r = np.array(r)
             # the evaluation might produce an int/float. Need this correction.
-            r = self._correct_shape(np.array(r), discr)
-            results.append(r)
+            if r.shape != shape:
+                r = (r.reshape(shape) if r.size == np.prod(shape)
+                    else np.broadcast_to(r, shape).copy())
+            results[i] = r
 
         return results
 
+    def _use_blocks(self):
+        np = import_module('numpy')
+        # NOTE: object arrays are used by only_integers=True, which requires
+        # Python's integers in order to evaluate Sums.
+        return ((getattr(self, "_blocks", None) is not None) and
+            all(np.asarray(v).dtype != object for v in self.ranges.values()))
+
+    def _evaluate_blocks(self):
+        """Evaluate the expressions block by block, reusing the results of
+        the blocks whose arguments didn't change since the last evaluation.
+        """
+        np = import_module('numpy')
+
+        def same(a, b):
+            if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+                return a is b
+            try:
+                return bool(a == b)
+            except (TypeError, ValueError):
+                return False
+
+        def evaluate(block_signature, functions):
+            args = [values[t] for t in block_signature]
+            r = _uniform_eval_helper(*functions, *args)
+            # NOTE: the following blocks must receive the same arguments
+            # they would receive in the evaluation of the whole expression:
+            # real arguments produce real results, unless the evaluation
+            # is done with SymPy or the expression contains complex numbers.
+            if (not any(np.iscomplexobj(a) for a in args) and
+                (not np.any(np.imag(r)))):
+                r = np.real(r)
+            return r
+
+        values = dict(self.ranges)
+        values.update(self._params)
+        for s, block_signature, functions in self._blocks:
+            # NOTE: the values of other blocks are new objects only if they
+            # have been re-evaluated.
+            args = [values[t] for t in block_signature]
+            cached = self._block_values.get(s, None)
+            if (cached is not None) and (len(cached[0]) == len(args)) and all(
+                same(a, b) for a, b in zip(cached[0], args)):
+                values[s] = cached[1]
+            else:
+                values[s] = evaluate(block_signature, functions)
+                self._block_values[s] = (args, values[s])
+
+        return [values[o] if not isinstance(o, tuple) else evaluate(*o)
+            for o in self._block_outputs]
+
 
 class LineInteractiveBaseSeries(InteractiveSeries):
     _allowed_keys = ["absarg", "color_func", "detect_poles", "eps",
     "is_complex", "is_filled", "is_point", "line_color", "modules", "n",
-    "only_integers", "rendering_kw", "steps", "use_cm", "xscale",
-    "tx", "ty", "tz"]
+    "only_integers", "poles_refinement", "rendering_kw", "steps", "use_cm",
+    "xscale", "tx", "ty", "tz"]
+    # NOTE: lines are cheap to evaluate, and a decimated line might miss
+    # important features (for example, poles).
+    _allow_preview = False
 
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
@@ -1923,18 +2974,48 @@ class LineInteractiveSeries(LineInteractiveBaseSeries, Line2DBaseSeries):
         self.steps = kwargs.get("steps", False)
         self.detect_poles = kwargs.get("detect_poles", False)
         self.eps = kwargs.get("eps", 0.01)
+        self.poles_refinement = int(kwargs.get("poles_refinement", 0))
         self.rendering_kw = kwargs.get("rendering_kw", dict())
         self.color_func = kwargs.get("color_func", None)
         self.line_color = kwargs.get("line_color", None)
 
-    def _get_points(self):
-        """Returns coordinates that needs to be postprocessed."""
+    def _evaluate_at(self, x):
+        """Evaluate the expression at the real coordinates ``x`` with the
+        current parameters. Return the real and imaginary parts of the
+        results.
+        """
+        np = import_module('numpy')
+
+        xx = x + 1j * self.start.imag if self.is_complex else x
+        args = [self._params[s] if s in self._params.keys() else xx
+            for s in self.signature]
+        r = np.array(_uniform_eval_helper(*self.functions[0], *args))
+        r = np.broadcast_to(r, np.shape(x))
+        return np.real(r).copy(), np.imag(r).copy()
+
+    def _get_real_imag_refined(self, get_y):
+        """Evaluate the expression with the current parameters. The segments
+        containing poles are re-sampled if ``detect_poles=True`` and
+        ``poles_refinement > 0``.
+        """
         np = import_module('numpy')
 
         results = self._evaluate()[0]
         _re, _im = np.real(results), np.imag(results)
-        _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
         discr = np.real(list(self.ranges.values())[0])
+        if (self.detect_poles and (self.poles_refinement > 0) and
+            (not self.only_integers)):
+            discr, _re, _im = LineOver1DRangeSeries._refine_poles(discr, _re,
+                _im, self._evaluate_at, get_y, self.eps,
+                self.poles_refinement)
+        return discr, _re, _im
+
+    def _get_points(self):
+        """Returns coordinates that needs to be postprocessed."""
+        np = import_module('numpy')
+
+        discr, _re, _im = self._get_real_imag_refined(_real_part)
+        _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
 
         if self.detect_poles:
             return LineOver1DRangeSeries._detect_poles(discr, _re, self.eps)
@@ -1976,11 +3057,9 @@ class AbsArgLineInteractiveSeries(LineInteractiveSeries):
         """Returns coordinates that needs to be postprocessed."""
         np = import_module('numpy')
 
-        results = self._evaluate()[0]
-        _re, _im = np.real(results), np.imag(results)
+        discr, _re, _im = self._get_real_imag_refined(_absolute_value)
         _abs = np.sqrt(_re**2 + _im**2)
         _angle = np.arctan2(_im, _re)
-        discr = np.real(list(self.ranges.values())[0])
         if self.detect_poles:
             _, _abs = LineOver1DRangeSeries._detect_poles(discr, _abs, self.eps)
         return discr, _abs, _angle
@@ -2048,7 +3127,7 @@ class SurfaceInteractiveSeries(InteractiveSeries):
         super().__init__(*args, **kwargs)
         self.rendering_kw = kwargs.get("rendering_kw", dict())
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _surface_color_func)
         self.surface_color = kwargs.get("surface_color", None)
 
     def get_data(self):
@@ -2071,12 +3150,10 @@ class SurfaceInteractiveSeries(InteractiveSeries):
         results = self._evaluate()[0]
         _re, _im = np.real(results), np.imag(results)
         _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
-        x, y = [np.real(t) for t in self.ranges.values()]
+        x, y = _broadcast_meshes(*[np.real(t) for t in self.ranges.values()])
 
-        r = x.copy()
         if self.is_polar:
-            x = r * np.cos(y)
-            y = r * np.sin(y)
+            x, y = x * np.cos(y), x * np.sin(y)
         return self._apply_transform(x, y, _re)
 
     def __str__(self):
@@ -2106,7 +3183,7 @@ class ParametricSurfaceInteractiveSeries(SurfaceInteractiveSeries):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.color_func = kwargs.get("color_func", lambda x, y, z, u, v: z)
+        self.color_func = kwargs.get("color_func", _parametric_surface_color_func)
 
     def get_data(self):
         """Return arrays of coordinates for plotting.
@@ -2131,7 +3208,7 @@ class ParametricSurfaceInteractiveSeries(SurfaceInteractiveSeries):
             _re[np.invert(np.isclose(_im, np.zeros_like(_im)))] = np.nan
             results[i] = _re
 
-        discr = [np.real(t) for t in self.ranges.values()]
+        discr = _broadcast_meshes(*[np.real(t) for t in self.ranges.values()])
         return [*results, *discr]
 
     def __str__(self):
@@ -2210,9 +3287,10 @@ class ComplexPointInteractiveSeries(LineInteractiveBaseSeries, ComplexPointSerie
 class ComplexSurfaceBaseSeries(BaseSeries):
     """Represent a complex function."""
     is_complex = True
-    _allowed_keys = ["absarg", "coloring", "color_func", "modules", "phaseres",
-    "is_polar", "n1", "n2", "only_integers", "rendering_kw", "steps",
-    "surface_color","use_cm", "xscale", "yscale", "tx", "ty", "tz", "threed"]
+    _allowed_keys = ["absarg", "chunk_size", "coloring", "color_func",
+    "max_memory", "modules", "phaseres", "is_polar", "n1", "n2",
+    "only_integers", "rendering_kw", "steps", "surface_color","use_cm",
+    "xscale", "yscale", "tx", "ty", "tz", "threed"]
 
     def __new__(cls, *args, **kwargs):
         domain_coloring = kwargs.get("absarg", False)
@@ -2248,6 +3326,10 @@ class ComplexSurfaceBaseSeries(BaseSeries):
         self.xscale = kwargs.get("xscale", "linear")
         self.yscale = kwargs.get("yscale", "linear")
         self.modules = kwargs.get("modules", None)
+        self.chunk_size = kwargs.get("chunk_size",
+            cfg["evaluation"]["chunk_size"])
+        self.max_memory = kwargs.get("max_memory",
+            cfg["evaluation"]["max_memory"])
         self.only_integers = kwargs.get("only_integers", False)
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
         self.is_polar = kwargs.get("is_polar", False)
@@ -2282,8 +3364,6 @@ class ComplexSurfaceBaseSeries(BaseSeries):
             )
 
     def _common_eval(self):
-        np = import_module('numpy')
-
         start_x = self.start.real
         end_x = self.end.real
         start_y = self.start.imag
@@ -2292,11 +3372,10 @@ class ComplexSurfaceBaseSeries(BaseSeries):
             self.xscale, self.only_integers)
         y = self._discretize(start_y, end_y, self.n2,
             self.yscale, self.only_integers)
-        xx, yy = np.meshgrid(x, y)
-        domain = xx + 1j * yy
-        zz = _uniform_eval(self.var, self.expr, domain,
-            modules=self.modules)
-        zz = self._correct_shape(np.array(zz), domain)
+        domain = x[None, :] + 1j * y[:, None]
+        zz = _tiled_eval([self.var], self.expr, domain,
+            modules=self.modules,
+            chunk_size=_get_chunk_size(self.chunk_size, self.max_memory))
         return domain, zz
 
 
@@ -2320,7 +3399,7 @@ class ComplexSurfaceSeries(ComplexSurfaceBaseSeries):
         self._init_rendering_kw(**kwargs)
 
     def _init_rendering_kw(self, **kwargs):
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _surface_color_func)
         self.rendering_kw = kwargs.get("rendering_kw", dict())
 
     def _correct_output(self, domain, z):
@@ -2423,20 +3502,12 @@ class ComplexInteractiveBaseSeries(InteractiveSeries, ComplexSurfaceBaseSeries):
         return ComplexSurfaceInteractiveSeries(*args, **kwargs)
 
     def __init__(self, expr, r, label="", **kwargs):
-        np = import_module('numpy')
-
         self._params = kwargs.get("params", dict())
         self._init_attributes(expr, r, label, **kwargs)
         self._check_fs([expr], [r], label, self._params)
 
         self.signature = sorted(self.expr.free_symbols, key=lambda t: t.name)
-        # Two lambda functions:
-        # 1. the default one.
-        # 2. the backup one, in case of failures with the default one.
-        self.functions = [[
-            lambdify(self.signature, self.expr, modules=self.modules),
-            lambdify(self.signature, self.expr, modules="sympy")
-        ]]
+        self._create_functions([self.expr])
 
         x = self._discretize(
             self.start.real, self.end.real, self.n1,
@@ -2444,9 +3515,7 @@ class ComplexInteractiveBaseSeries(InteractiveSeries, ComplexSurfaceBaseSeries):
         y = self._discretize(
             self.start.imag, self.end.imag, self.n2,
             scale=self.yscale, only_integers=self.only_integers)
-        xx, yy = np.meshgrid(x, y)
-        zz = xx + 1j * yy
-        self.ranges = {self.var: zz}
+        self.ranges = {self.var: x[None, :] + 1j * y[:, None]}
 
     def __str__(self):
         if self.is_domain_coloring:
@@ -2652,7 +3721,7 @@ class VectorBase(BaseSeries):
     def get_expr(self):
         return self.exprs
 
-    def _discretize(self):
+    def _discretize(self, sparse=False):
         np = import_module('numpy')
 
         one_d = []
@@ -2665,27 +3734,11 @@ class VectorBase(BaseSeries):
         # discretization volume. This indexing solves the problem.
         # Also note that matplotlib 2D streamlines requires indexing='xy'.
         return np.meshgrid(*one_d,
-            indexing="xy" if not self.is_3Dvector else "ij")
+            indexing="xy" if not self.is_3Dvector else "ij", sparse=sparse)
 
     def _eval_component(self, meshes, fs, expr):
-        np = import_module('numpy')
-
-        v = _uniform_eval(fs, expr, *meshes, modules=self.modules)
-        re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_shape(re_v, meshes[0])
-        im_v = self._correct_shape(im_v, meshes[0])
-        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
-        return re_v
-
-    def _eval_component2(self, meshes, f):
-        np = import_module('numpy')
-
-        v = f(*meshes)
-        re_v, im_v = np.real(v), np.imag(v)
-        re_v = self._correct_shape(re_v, meshes[0])
-        im_v = self._correct_shape(im_v, meshes[0])
-        re_v[np.invert(np.isclose(im_v, np.zeros_like(im_v)))] = np.nan
-        return re_v
+        return _tiled_eval(fs, expr, *meshes, modules=self.modules,
+            real=True)
 
     def get_expr(self):
         return self.exprs
@@ -2724,16 +3777,12 @@ class VectorBase(BaseSeries):
         w : np.ndarray [n2 x n1] (optional)
             Third component of the vector field in the case of Vector3DSeries.
         """
-        meshes = self._discretize()
+        meshes = self._discretize(sparse=True)
         free_symbols = [r[0] for r in self.ranges]
         results = []
-        if any(callable(e) for e in self.exprs):
-            for e in self.exprs:
-                results.append(self._eval_component2(meshes, e))
-        else:
-            for e in self.exprs:
-                results.append(self._eval_component(meshes, free_symbols, e))
-        return self._apply_transform(*meshes, *results)
+        for e in self.exprs:
+            results.append(self._eval_component(meshes, free_symbols, e))
+        return self._apply_transform(*_broadcast_meshes(*meshes), *results)
 
 
 class Vector2DSeries(VectorBase):
@@ -2809,7 +3858,7 @@ class VectorInteractiveBaseSeries(InteractiveSeries):
     def get_data(self):
         np = import_module('numpy')
 
-        discr = [np.real(t) for t in self.ranges.values()]
+        discr = _broadcast_meshes(*[np.real(t) for t in self.ranges.values()])
         results = self._evaluate()
 
         for i, r in enumerate(results):
@@ -2874,7 +3923,7 @@ class SliceVector3DSeries(Vector3DSeries):
         self.slice_surf_series = _build_slice_series(slice_surf, [range_x, range_y, range_z], **kwargs)
         super().__init__(u, v, w, range_x, range_y, range_z, label, **kwargs)
 
-    def _discretize(self):
+    def _discretize(self, sparse=False):
         data = self.slice_surf_series.get_data()
         if (isinstance(self.slice_surf_series, PlaneSeries) or
         self.slice_surf_series.is_parametric):
@@ -2908,6 +3957,10 @@ class SliceVector3DInteractiveSeries(VectorInteractiveBaseSeries, SliceVector3DS
     """Represents an interactive 3D vector field plotted over a slice.
     The slice can be a Plane or a surface.
     """
+    # NOTE: the discretized ranges are computed by the slice surface when
+    # the parameters are set.
+    _allow_preview = False
+
     def __init__(self, *args, **kwargs):
         slice_surf = kwargs.get("slice", None)
         ranges = args[1]
@@ -2980,7 +4033,7 @@ class PlaneSeries(SurfaceBaseSeries):
         self.use_cm = kwargs.get("use_cm", cfg["plot3d"]["use_cm"])
         self._set_surface_label(label)
         self.surface_color = kwargs.get("surface_color", None)
-        self.color_func = kwargs.get("color_func", lambda x, y, z: z)
+        self.color_func = kwargs.get("color_func", _surface_color_func)
 
     def __str__(self):
         return "plane series: %s over %s, %s, %s" % (
@@ -3065,6 +4118,7 @@ class PlaneSeries(SurfaceBaseSeries):
 
 class PlaneInteractiveSeries(PlaneSeries, InteractiveSeries):
     """Represents an interactive Plane in a 3D domain."""
+    _allow_preview = False
 
     # NOTE: In the MRO, PlaneSeries has the precedence over InteractiveSeries.
     # This is because Numpy and Scipy don't have correspondence with Plane.
@@ -3216,6 +4270,7 @@ class GeometrySeries(BaseSeries):
 
 class GeometryInteractiveSeries(GeometrySeries, InteractiveSeries):
     """Represents an interactive entity from the sympy.geometry module."""
+    _allow_preview = False
 
     # NOTE: In the MRO, GeometrySeries has the precedence over
     # InteractiveSeries. This is because Numpy and Scipy don't have
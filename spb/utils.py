@@ -7,6 +7,7 @@ from sympy.vector.operators import _get_coord_systems
 from sympy.core.relational import Relational
 from sympy.logic.boolalg import BooleanFunction
 from sympy.external import import_module
+from functools import lru_cache
 import warnings
 
 def _create_ranges(exprs, ranges, npar, label="", params=None):
@@ -304,32 +305,46 @@ def ij2k(cols, i, j):
     return cols * i + j
 
 
+@lru_cache(maxsize=32)
+def _grid_connectivity(rows, cols):
+    """Compute the triangular faces of a structured grid with ``rows`` x
+    ``cols`` vertices. The topology only depends on the shape of the grid,
+    hence the results are cached: the returned array is read-only.
+    """
+    np = import_module('numpy')
+
+    k = np.arange(rows * cols, dtype=np.uint32).reshape(rows, cols)
+    # NOTE: two triangles for each quadrilateral of the grid, with the same
+    # ordering produced by ij2k.
+    a, b = k[1:, 1:], k[:-1, 1:]
+    c, d = k[1:, :-1], k[:-1, :-1]
+    indices = np.stack([
+        np.stack([a, b, c], axis=-1),
+        np.stack([d, c, b], axis=-1)], axis=2).reshape(-1, 3)
+    indices.flags.writeable = False
+    return indices
+
+
 def get_vertices_indices(x, y, z):
-    """Compute the vertices matrix (Nx3) and the connectivity list for
-    triangular faces.
+    """Compute the vertices matrix (Nx3) and the connectivity array (Mx3,
+    ``uint32``) of the triangular faces of a structured grid.
 
     Parameters
     ==========
         x, y, z : np.array
             2D arrays
+
+    Notes
+    =====
+
+    The connectivity array is cached by the shape of the grid, and it is
+    shared between calls: it must not be modified.
     """
     np = import_module('numpy')
 
     rows, cols = x.shape
-    x = x.flatten()
-    y = y.flatten()
-    z = z.flatten()
-    vertices = np.vstack([x, y, z]).T
-    indices = []
-    for i in range(1, rows):
-        for j in range(1, cols):
-            indices.append(
-                [ij2k(cols, i, j), ij2k(cols, i - 1, j), ij2k(cols, i, j - 1)]
-            )
-            indices.append(
-                [ij2k(cols, i - 1, j - 1), ij2k(cols, i, j - 1), ij2k(cols, i - 1, j)]
-            )
-    return vertices, indices
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    return vertices, _grid_connectivity(rows, cols)
 
 
 def _split_vector(expr, ranges, fill_ranges=True):
@@ -457,8 +472,8 @@ def _validate_kwargs(backend_obj, **kwargs):
     # params is a keyword argument that is also checked before instantion of
     # Series and Backend.
     allowed_keys = allowed_keys.union(["params", "layout", "ncols",
-        "use_latex", "throttled", "servable", "custom_css", "pane_kw",
-        "is_iplot"])
+        "use_latex", "throttled", "asynchronous", "progressive",
+        "cache_memory", "servable", "custom_css", "pane_kw", "is_iplot"])
     user_provided_keys = set(kwargs.keys())
     unused_keys = user_provided_keys.difference(allowed_keys)
     if len(unused_keys) > 0:
@@ -414,9 +414,16 @@ def plot_vector(*args, **kwargs):
         - `starts=None`: the default aforementioned behaviour.
         - `starts=dict(x=x_list, y=y_list, z=z_list)`: specify the starting
           points of the streamlines.
-        - `starts=True`: randomly create starting points inside the domain.
-          In this setup we can set the number of starting point with `npoints`
-          (default value to 200).
+        - `starts=True` or `starts="random"`: randomly create starting
+          points inside the domain. In this setup we can set the number of
+          starting point with `npoints` (default value to 200).
+        - `starts="poisson"`: randomly create starting points inside the
+          domain, keeping a minimum distance between them (Poisson-disk
+          sampling). The number of starting points is controlled by
+          `npoints`.
+
+        Random starting points are reproducible by setting the seed of the
+        random number generator with `seed`.
 
         If 3D streamlines appears to be cut short inside the specified domain,
         try to increase `max_prop` (default value to 5000).
@@ -0,0 +1,64 @@
+from pytest import raises
+from spb import MB, PB
+from spb.animation import Sweep
+from spb.interactive import create_series, iplot
+from spb.series import LineOver1DRangeSeries
+from sympy import symbols, cos, exp
+from sympy.external import import_module
+from concurrent.futures import ThreadPoolExecutor
+
+np = import_module('numpy', catch=(RuntimeError,))
+
+
+def test_sweep():
+    # verify that the frames are evaluated with the correct parameters by
+    # all executors, and that the constant arrays are not duplicated
+
+    u, v, x, y = symbols("u, v, x, y")
+    f = lambda uu, vv, xx, yy: np.cos(uu * xx**2 + yy) * np.exp(-vv * xx**2)
+    s = create_series((cos(u * x**2 + y) * exp(-v * x**2), (x, -2, 2),
+        (y, -3, 3)), params={u: 1, v: 2}, n1=20, n2=10, threed=True)
+    p = MB(LineOver1DRangeSeries(x, (x, -2, 2)), *s, show=False)
+    values = np.linspace(0, 3, 7)
+
+    for executor in ["serial", "thread", "process",
+        ThreadPoolExecutor(2)]:
+        sweep = p.sweep(u, values, executor=executor)
+        assert isinstance(sweep, Sweep)
+        assert len(sweep) == 7
+        assert list(sweep.data.keys()) == [1]
+        xx, yy, zz = sweep.data[1]
+        assert zz.shape == (7, 10, 20)
+        # the discretized ranges are stored once
+        assert xx.strides[0] == 0
+        for k, val in enumerate(values):
+            xk, yk, zk = sweep.frame(k)[1]
+            assert np.allclose(zk, f(val, 2, xk, yk))
+            assert sweep.params[k] == {u: val, v: 2}
+    # the original series are not modified
+    assert p[1].params == {u: 1, v: 2}
+
+    raises(ValueError, lambda: p.sweep(x, values))
+    raises(ValueError, lambda: p.sweep(u, values, executor="test"))
+    p2 = MB(LineOver1DRangeSeries(x, (x, -2, 2)), show=False)
+    raises(ValueError, lambda: p2.sweep(u, values))
+
+
+def test_sweep_animate():
+    u, x = symbols("u, x")
+
+    t = iplot((cos(u * x), (x, -2, 2)), params={u: (1, 0, 5)}, n=10,
+        backend=PB, show=False)
+    sweep = t.sweep(u, [1, 2, 3], executor="serial")
+    fig = sweep.animate()
+    assert len(fig.frames) == 3
+    x0 = np.asarray(fig.frames[2].data[0]["x"])
+    assert np.allclose(fig.frames[2].data[0]["y"], np.cos(3 * x0))
+    assert len(fig.layout.sliders[0].steps) == 3
+
+    t = iplot((cos(u * x), (x, -2, 2)), params={u: (1, 0, 5)}, n=10,
+        backend=MB, show=False)
+    anim = t.sweep(u, [1, 2, 3], executor="serial").animate()
+    anim._func(2)
+    line = t.backend.ax.lines[0]
+    assert np.allclose(line.get_ydata(), np.cos(3 * line.get_xdata()))
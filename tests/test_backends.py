@@ -10,10 +10,11 @@ from spb import (
     plot3d_parametric_surface, plot_complex_list, plot_complex_vector
 )
 from spb.backends.base_backend import Plot
+from spb.defaults import cfg
 from spb.backends.matplotlib import unset_show
 from spb.series import (
     BaseSeries, InteractiveSeries, LineOver1DRangeSeries,
-    SurfaceOver2DRangeSeries
+    SurfaceOver2DRangeSeries, ContourInteractiveSeries
 )
 from sympy import (
     latex, gamma, exp, symbols, Eq, Matrix, pi, I, sin, cos,
@@ -546,7 +547,7 @@ def test_plot_parametric():
     assert len(p.series) == 1
     f = p.fig
     assert len(f.renderers) == 1
-    assert isinstance(f.renderers[0].glyph, bokeh.models.glyphs.MultiLine)
+    assert isinstance(f.renderers[0].glyph, bokeh.models.glyphs.Segment)
     assert f.renderers[0].glyph.line_color == "red"
     # 1 colorbar
     assert len(f.right) == 1
@@ -1374,7 +1375,7 @@ def test_plot_complex_1d():
     assert len(p.series) == 1
     f = p.fig
     assert len(f.renderers) == 1
-    assert isinstance(f.renderers[0].glyph, bokeh.models.glyphs.MultiLine)
+    assert isinstance(f.renderers[0].glyph, bokeh.models.glyphs.Segment)
     assert f.renderers[0].glyph.line_color == "red"
     # 1 colorbar
     assert len(f.right) == 1
@@ -1728,12 +1729,12 @@ def test_plot_geometry_2():
 
     p = _plot_geometry(BB, False)
     assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Line)]) == 4
-    assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.MultiLine)]) == 1
+    assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Segment)]) == 1
     assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Circle)]) == 1
     p = _plot_geometry(BB, True)
     assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Line)]) == 1
     assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Patch)]) == 3
-    assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.MultiLine)]) == 1
+    assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Segment)]) == 1
     assert len([t.glyph for t in p.fig.renderers if isinstance(t.glyph, bokeh.models.glyphs.Circle)]) == 1
 
 
@@ -1866,6 +1867,40 @@ def test_vectors_update_interactive():
     func(MB)
 
 
+def test_vectors_2d_streamlines_update_interactive():
+    # verify that Plotly and Bokeh update 2D streamlines
+
+    x, y, u = symbols("x, y, u")
+
+    def func(B, params):
+        s = InteractiveSeries(
+            [-u * y, x],
+            [(x, -3, 3), (y, -2, 2)],
+            "test",
+            params = params,
+            streamlines = True,
+            n1 = 20, n2 = 20
+        )
+        p = B(s, show=False)
+        p.process_series()
+        return p
+
+    p1, p2 = func(PB, {u: 1}), func(PB, {u: 2})
+    p1._update_interactive({u: 2})
+    assert len(p1.fig.data) == 1
+    assert np.allclose(p1.fig.data[0]["x"], p2.fig.data[0]["x"],
+        equal_nan=True)
+    assert np.allclose(p1.fig.data[0]["y"], p2.fig.data[0]["y"],
+        equal_nan=True)
+
+    p1, p2 = func(BB, {u: 1}), func(BB, {u: 2})
+    p1._update_interactive({u: 2})
+    d1 = p1.fig.renderers[0].data_source.data
+    d2 = p2.fig.renderers[0].data_source.data
+    assert np.allclose(d1["xs"][0], d2["xs"][0], equal_nan=True)
+    assert np.allclose(d1["ys"][0], d2["ys"][0], equal_nan=True)
+
+
 def test_aspect_ratio_2d_issue_11764():
     # verify that the backends apply the provided aspect ratio.
     # NOTE: read the backend docs to understand which options are available.
@@ -2740,6 +2775,80 @@ def test_plot3d_update_interactive():
     assert c1 == c2
 
 
+def test_mb_update_interactive_in_place():
+    # verify that MB._update_interactive updates the existing surfaces and
+    # 3D quivers, producing the same data of newly created artists, and
+    # that contours reuse their levels
+
+    x, y, z, u = symbols("x, y, z, u")
+
+    def _surface(params, use_cm=True):
+        s = InteractiveSeries(
+            [u * cos(x * y)],
+            [(x, -2, 2), (y, -2, 2)],
+            "test",
+            threed = True,
+            use_cm = use_cm,
+            params = params,
+            n1=6, n2=4
+        )
+        p = MB(s, show=False)
+        p.process_series()
+        return p
+
+    # surfaces with a colormap and with a solid color (the default)
+    for use_cm in [True, False]:
+        p1, p2 = _surface({u: 1}, use_cm), _surface({u: 2}, use_cm)
+        h = p1._handles[0][0]
+        p1._update_interactive({u: 2})
+        assert p1._handles[0][0] is h
+        assert np.allclose(h._vec, p2._handles[0][0]._vec)
+        assert np.allclose(h._facecolor3d, p2._handles[0][0]._facecolor3d)
+
+    def _contour(params):
+        s = ContourInteractiveSeries(
+            [u * cos(x * y)],
+            [(x, -2, 2), (y, -2, 2)],
+            "test",
+            params = params,
+            n1=10, n2=10
+        )
+        p = MB(s, show=False)
+        p.process_series()
+        return p
+
+    # the levels of the previous contour are reused if they still fit the
+    # new data, otherwise they are computed again
+    p1 = _contour({u: 1})
+    levels = np.array([-1.5, -0.9, 0, 0.9, 1.5])
+    p1._handles[0][0].levels = levels
+    p1._update_interactive({u: 1.1})
+    assert np.allclose(p1._handles[0][0].levels, levels)
+    p1._update_interactive({u: 2})
+    assert np.allclose(p1._handles[0][0].levels,
+        _contour({u: 2})._handles[0][0].levels)
+
+    def _vector(params):
+        s = InteractiveSeries(
+            [u * z, y, x],
+            [(x, -5, 5), (y, -5, 5), (z, -5, 5)],
+            "test",
+            use_cm = True,
+            params = params,
+            n1=3, n2=3, n3=3
+        )
+        p = MB(s, show=False)
+        p.process_series()
+        return p
+
+    p1, p2 = _vector({u: 1}), _vector({u: 2})
+    h = p1._handles[0][0]
+    p1._update_interactive({u: 2})
+    assert p1._handles[0][0] is h
+    assert np.allclose(h._segments3d, p2._handles[0][0]._segments3d)
+    assert np.allclose(h.get_array(), p2._handles[0][0].get_array())
+
+
 def test_k3d_vector_pivot():
     # verify that K3DBackend accepts quiver_kw={"pivot": "something"} and
     # produces different results
@@ -2764,6 +2873,38 @@ def test_k3d_vector_pivot():
     assert not np.allclose(p2.fig.objects[0].origins, p3.fig.objects[0].origins, equal_nan=True)
 
 
+def test_k3d_update_interactive_surface_in_place():
+    # verify that K3DBackend uses the structured connectivity of surfaces,
+    # and that interactive updates write the existing vertex buffer
+
+    x, y, u = symbols("x, y, u")
+
+    def _surface(params):
+        s = InteractiveSeries(
+            [u * cos(x * y)],
+            [(x, -2, 2), (y, -2, 3)],
+            "test",
+            threed = True,
+            use_cm = True,
+            params = params,
+            n1 = 8, n2 = 6
+        )
+        p = KBchild1(s, show=False)
+        p.process_series()
+        return p
+
+    p1, p2 = _surface({u: 1}), _surface({u: 2})
+    obj = p1.fig.objects[0]
+    vertices = obj.vertices
+    assert vertices.dtype == np.float32
+    assert obj.indices.shape == (2 * 7 * 5, 3)
+    p1._update_interactive({u: 2})
+    assert obj.vertices is vertices
+    assert np.allclose(obj.vertices, p2.fig.objects[0].vertices)
+    assert np.array_equal(obj.indices, p2.fig.objects[0].indices)
+    assert np.allclose(obj.attribute, p2.fig.objects[0].attribute)
+
+
 def test_plot_polar():
     # verify that 2D polar plot uses polar projection
     x = symbols("x")
@@ -2941,7 +3082,7 @@ def test_line_color_func():
     p1 = pl(BB, None)
     p2 = pl(BB, lambda x, y: np.cos(x))
     assert isinstance(p1.fig.renderers[0].glyph, bokeh.models.glyphs.Line)
-    assert isinstance(p2.fig.renderers[0].glyph, bokeh.models.glyphs.MultiLine)
+    assert isinstance(p2.fig.renderers[0].glyph, bokeh.models.glyphs.Segment)
 
 
 def test_line_interactive_color_func():
@@ -2971,7 +3112,13 @@ def test_line_interactive_color_func():
     p = BB(s1, s2)
     p._update_interactive({t: 2})
     assert isinstance(p.fig.renderers[0].glyph, bokeh.models.glyphs.Line)
-    assert isinstance(p.fig.renderers[1].glyph, bokeh.models.glyphs.MultiLine)
+    assert isinstance(p.fig.renderers[1].glyph, bokeh.models.glyphs.Segment)
+    # the segments of gradient lines are stored into contiguous columns
+    data = p.fig.renderers[1].data_source.data
+    xx = np.linspace(-3, 3, 5)
+    assert np.allclose(data["x0"], xx[:-1]) and np.allclose(data["x1"], xx[1:])
+    assert np.allclose(data["y0"], 2 * np.cos(2 * xx[:-1]))
+    assert np.allclose(data["us"], np.cos(xx[:-1]))
 
 
 def test_line_color_plot():
@@ -3086,3 +3233,90 @@ def test_label_after_plot_instantiation():
     f = p.fig
     assert f.axes[0].lines[0].get_label() == "a"
     assert f.axes[0].lines[1].get_label() == "$b^{2}$"
+
+
+def test_evaluation_executor():
+    # verify that the data series can be evaluated concurrently, producing
+    # the same numerical data of the serial evaluation
+    x, y, u = symbols("x, y, u")
+
+    def _plot(executor):
+        cfg["evaluation"]["executor"] = executor
+        try:
+            p = plot3d(cos(x**2 + y**2), sin(x * y), (x, -2, 2), (y, -2, 2),
+                n=20, backend=MB, show=False)
+            p.process_series()
+        finally:
+            cfg["evaluation"]["executor"] = "serial"
+        return p
+
+    data = [s.get_data() for s in _plot("serial").series]
+    for executor in ["thread", "process"]:
+        p = _plot(executor)
+        for s, d in zip(p.series, data):
+            assert s._get_cached_data() is not None
+            assert all(np.allclose(a, b) for a, b in zip(s.get_data(), d))
+
+    cfg["evaluation"]["executor"] = "fork"
+    try:
+        p = plot(sin(x), cos(x), backend=MB, show=False)
+        raises(ValueError, lambda: p.process_series())
+    finally:
+        cfg["evaluation"]["executor"] = "serial"
+
+    # interactive series are evaluated with the new parameters
+    cfg["evaluation"]["executor"] = "thread"
+    try:
+        s1 = InteractiveSeries([sin(u * x)], [(x, -5, 5)], params={u: 1},
+            n1=10)
+        s2 = InteractiveSeries([cos(u * x)], [(x, -5, 5)], params={u: 1},
+            n1=10)
+        p = MB(s1, s2, show=False)
+        p.process_series()
+        p._update_interactive({u: 2})
+    finally:
+        cfg["evaluation"]["executor"] = "serial"
+    _, y1 = p[0].get_data()
+    assert np.allclose(y1, np.sin(2 * np.linspace(-5, 5, 10)))
+
+
+def test_plot3d_adaptive_mesh():
+    # verify that the backends render the triangular mesh produced by the
+    # adaptive algorithm when adaptive_mesh=True
+
+    x, y = symbols("x, y")
+
+    _plot3d = lambda B, use_cm=True: plot3d(
+        cos(x ** 2 + y ** 2), (x, -3, 3), (y, -3, 3),
+        adaptive=True, adaptive_mesh=True, max_points=1000,
+        use_cm=use_cm, backend=B, show=False)
+
+    p = _plot3d(MB)
+    assert p[0].is_mesh
+    _, _, _, tri = p[0].get_data()
+    f = p.fig
+    assert len(f.axes[0].collections) == 1
+    assert len(f.axes[0].collections[0].get_array()) == len(tri)
+    p.close()
+    p = _plot3d(MB, False)
+    f = p.fig
+    p.close()
+
+    p = _plot3d(PB)
+    f = p.fig
+    assert isinstance(f.data[0], go.Mesh3d)
+    assert len(f.data[0].i) == len(tri)
+
+    p = _plot3d(KBchild1)
+    f = p.fig
+    assert f.objects[0].indices.shape == tri.shape
+    assert f.objects[0].indices.dtype == np.uint32
+
+    # the function is not defined over the whole domain: the color range of
+    # the mesh must not be NaN
+    p = plot3d(sqrt(1 - x**2 - y**2), (x, -1.2, 1.2), (y, -1.2, 1.2),
+        adaptive=True, adaptive_mesh=True, max_points=1000,
+        backend=PB, show=False)
+    f = p.fig
+    assert np.isfinite(f.data[0].cmin) and np.isfinite(f.data[0].cmax)
+    assert np.all(np.isfinite(f.data[0].z))
@@ -0,0 +1,66 @@
+from spb.cache import LambdifyCache, LazyLambdify, cache_info, clear
+from spb.series import LineOver1DRangeSeries
+from sympy import symbols, sin, cos, exp
+from sympy.external import import_module
+
+np = import_module('numpy', catch=(RuntimeError,))
+
+
+def test_lambdify_cache():
+    # verify that compiled functions are reused and that the cache is
+    # bounded
+
+    x, y = symbols("x, y")
+    c = LambdifyCache(maxsize=2)
+    f1 = c.lambdify([x], sin(x))
+    f2 = c.lambdify([x], sin(x))
+    assert f1 is f2
+    assert c.info() == (1, 1, 2, 1)
+
+    # different signature, modules or expressions are different entries
+    f3 = c.lambdify([x, y], sin(x))
+    f4 = c.lambdify([x], sin(x), modules="mpmath")
+    assert f3 is not f1
+    assert f4 is not f1
+    assert c.info().currsize == 2
+    assert c.info().misses == 3
+
+    # the least recently used entry has been discarded
+    assert c.lambdify([x], sin(x)) is not f1
+    assert np.isclose(c.lambdify([x], sin(x))(1), np.sin(1))
+
+    c.clear()
+    assert c.info() == (0, 0, 2, 0)
+
+    # maxsize=0 disables the cache
+    c = LambdifyCache(maxsize=0)
+    assert c.lambdify([x], cos(x)) is not c.lambdify([x], cos(x))
+    assert c.info() == (0, 0, 0, 0)
+
+    # modules can also be lists of dictionaries
+    c = LambdifyCache()
+    f = c.lambdify([x], exp(x), modules=[{"exp": lambda t: 2}])
+    assert f(1) == 2
+
+
+def test_lazy_lambdify():
+    x = symbols("x")
+    clear()
+    f = LazyLambdify([x], cos(x), modules="sympy")
+    assert cache_info().misses == 0
+    assert f(0) == 1
+    assert cache_info().misses == 1
+
+
+def test_series_use_cache():
+    # rebuilding the same series doesn't compile the expression again
+
+    x = symbols("x")
+    clear()
+    for i in range(3):
+        s = LineOver1DRangeSeries(cos(x) * sin(x), (x, -5, 5),
+            adaptive=False, n=10)
+        s.get_data()
+    info = cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
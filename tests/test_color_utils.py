@@ -1,4 +1,8 @@
-from spb.backends.utils import convert_colormap
+from spb.backends.utils import (
+    convert_colormap, get_plotly_colors, pack_rgba, pack_rgb,
+    compute_streamlines, compute_streamlines_arrows
+)
+from spb.ccomplex.wegert import wegert
 from sympy.external import import_module
 
 # NOTE:
@@ -133,3 +137,106 @@ def test_convert_to_matplotlib():
     do_test(plotly_colorscales)
     do_test(matplotlib_cm, True)
     do_test(k3d_cms)
+
+
+def test_pack_rgba():
+    # verify that RGB and RGBA images are packed into uint32 colors, and
+    # that wegert is able to produce RGBA images which are packed without
+    # copies
+
+    w = np.exp(1j * np.linspace(0, 6, 20))[:, None] * np.linspace(0.1, 3, 15)
+    rgb, _ = wegert("b", w)
+    rgba, _ = wegert("b", w, rgba=True)
+    assert rgba.shape == (20, 15, 4)
+    assert np.all(rgba[..., :3] == rgb)
+    assert np.all(rgba[..., 3] == 255)
+
+    p1 = pack_rgba(rgb)
+    p2 = pack_rgba(rgba)
+    assert p1.shape == (20, 15) and p1.dtype == np.uint32
+    assert np.all(p1 == p2)
+    assert np.shares_memory(p2, rgba)
+    pixels = p1.view(np.uint8).reshape(20, 15, 4)
+    assert np.all(pixels[..., :3] == rgb)
+    assert np.all(pixels[..., 3] == 255)
+
+    out = np.zeros((20, 15), dtype=np.uint32)
+    assert pack_rgba(rgb, out) is out
+    assert np.all(out == p1)
+
+
+def test_pack_rgb():
+    # verify that RGB colors are packed into the uint32 integers used by K3D
+
+    w = np.exp(1j * np.linspace(0, 6, 20))[:, None] * np.linspace(0.1, 3, 15)
+    rgb, _ = wegert("b", w)
+    p = pack_rgb(rgb)
+    assert p.shape == (20, 15) and p.dtype == np.uint32
+    rgb = rgb.astype(int)
+    assert np.all(p == rgb[..., 0] * 256**2 + rgb[..., 1] * 256 + rgb[..., 2])
+    assert np.all(pack_rgb(rgb) == p)
+    assert pack_rgb([255, 128, 1]) == 0xFF8001
+
+    out = np.zeros(20 * 15, dtype=np.uint32)
+    assert pack_rgb(rgb.reshape(-1, 3), out) is out
+    assert np.all(out == p.flatten())
+
+
+def test_convert_colormap_cache():
+    # verify that conversions are cached by the identity of the colormap
+
+    r1 = convert_colormap(cm.viridis, "bokeh")
+    r2 = convert_colormap(cm.viridis, "bokeh")
+    assert r1 is r2
+    assert convert_colormap(cm.viridis, "bokeh", 16) is not r1
+    assert len(convert_colormap(cm.viridis, "bokeh", 16)) == 16
+
+    # lists with the same content, but different identity
+    c1 = ["#ff0000", "#0000ff"]
+    c2 = list(c1)
+    r1 = convert_colormap(c1, "k3d")
+    assert convert_colormap(c2, "k3d") is not r1
+    assert convert_colormap(c2, "k3d") == r1 == [0, 1, 0, 0, 1, 0, 0, 1]
+
+
+def test_get_plotly_colors():
+    # vectorized interpolation of plotly color scales
+
+    loc = np.linspace(0, 1, 11)
+    colors = get_plotly_colors("viridis", loc)
+    assert len(colors) == 11
+    for l, c in zip(loc, colors):
+        assert np.allclose(get_plotly_colors("viridis", l), c)
+    # end points and locations outside the range [0, 1]
+    assert np.allclose(get_plotly_colors("Greys", [-1, 0, 1, 2]),
+        [[1, 1, 1], [1, 1, 1], [0, 0, 0], [0, 0, 0]])
+    assert np.allclose(get_plotly_colors("Greys", 0.5), [150 / 255] * 3)
+    assert np.allclose(get_plotly_colors("Greys", 0.0625), [247.5 / 255] * 3)
+
+
+def test_compute_streamlines():
+    # the streamlines are returned as a single NaN-separated array, inside
+    # the domain, for any batch size
+
+    x = np.linspace(-3, 3, 40)
+    y = np.linspace(-2, 2, 30)
+    xx, yy = np.meshgrid(x, y)
+    xs, ys = compute_streamlines(x, y, -yy, xx, density=1)
+    assert xs.shape == ys.shape
+    assert np.array_equal(np.isnan(xs), np.isnan(ys))
+    assert np.isnan(xs).sum() > 10
+    assert not np.isnan(xs[0]) and not np.isnan(xs[-1])
+    assert (np.nanmin(xs) >= -3) and (np.nanmax(xs) <= 3)
+    assert (np.nanmin(ys) >= -2) and (np.nanmax(ys) <= 2)
+    xs1, ys1 = compute_streamlines(x, y, -yy, xx, density=1, batch_size=1)
+    assert np.isnan(xs1).sum() > 10
+
+    # one arrow head for each streamline
+    ax, ay = compute_streamlines_arrows(xs, ys)
+    assert len(ax) == 4 * (np.isnan(xs).sum() + 1) - 1
+    assert np.array_equal(np.isnan(ax), np.isnan(ay))
+    # arrow heads point in the direction of the streamlines
+    xs, ys = compute_streamlines(x, y, np.ones_like(xx), np.zeros_like(xx))
+    ax, ay = compute_streamlines_arrows(xs, ys, arrow_scale=0.1)
+    assert np.allclose(ax[0::4] - ax[1::4], -0.1 * np.cos(np.pi / 9))
+
@@ -12,11 +12,18 @@ def test_cfg_keys():
     assert isinstance(cfg, dict)
     must_have_keys = ["backend_2D", "backend_3D", "matplotlib", "plotly",
         "k3d", "bokeh", "complex", "interactive", "plot3d", "adaptive",
-        "plot_range", "mayavi"]
+        "plot_range", "mayavi", "evaluation"]
     for k in must_have_keys:
         assert k in cfg.keys()
 
 
+def test_evaluation_keys():
+    must_have_keys = ["executor", "max_workers", "chunk_size", "max_memory"]
+    for k in must_have_keys:
+        assert k in cfg["evaluation"].keys()
+    assert cfg["evaluation"]["executor"] == "serial"
+
+
 def test_plot_range_keys():
     assert ("min" in cfg["plot_range"].keys()) and ("max" in cfg["plot_range"].keys())
 
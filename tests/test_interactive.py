@@ -499,7 +499,8 @@ def test_interactiveseries():
         assert s.expr == expr
         assert s.label == label
         assert len(s.ranges) == len(ranges)
-        assert s.ranges[symbol].shape == shape
+        assert np.broadcast_shapes(
+            *[r.shape for r in s.ranges.values()]) == shape
         if len(ranges) == 2:
             assert s.is_2Dvector
             assert not s.is_3Dvector
@@ -760,3 +761,195 @@ def test_label_rendering_kw():
     assert [s.label for s in t.backend.series] == ["a", "b"]
     assert t.backend.series[0].rendering_kw == {"color": "r"}
     assert t.backend.series[1].rendering_kw == {"linestyle": ":"}
+
+
+def test_incremental_evaluation():
+    # verify that the sub-expressions not depending on the parameters are
+    # evaluated only once, and that the blocks depending on a parameter are
+    # re-evaluated only when that parameter changes
+
+    u, v, x, y = symbols("u, v, x, y")
+    expr = u * sin(x**2 + y**2) * cos(x * y) + v * cos(y) + sqrt(v)
+    s = InteractiveSeries([expr], [(x, -2, 2), (y, -3, 3)],
+        params={u: 1, v: 2}, n1=20, n2=15, threed=True)
+    f = lambda u, v, x, y: (u * np.sin(x**2 + y**2) * np.cos(x * y) +
+        v * np.cos(y) + np.sqrt(v))
+
+    def check(uu, vv):
+        s.params = {u: uu, v: vv}
+        xx, yy, zz = s.get_data()
+        assert np.allclose(zz, f(uu, vv, xx, yy))
+        return {k: v[1] for k, v in s._block_values.items()}
+
+    v1 = check(1, 2)
+    v2 = check(3, 2)
+    v3 = check(3, 4)
+    assert len(v1) > 0
+    for k in v1.keys():
+        # the blocks evaluated once are independent of the parameters
+        if (v1[k] is v2[k]) and (v2[k] is v3[k]):
+            assert np.ndim(v1[k]) > 0
+    # the blocks depending only on v are reused when u changes
+    assert any((v1[k] is v2[k]) and (v2[k] is not v3[k]) for k in v1.keys())
+
+    # complex domains preserve the sign of the zeros
+    s1 = InteractiveSeries([u * cos(x)], [(x, -5, 5)], params={u: 1}, n1=50,
+        absarg=True)
+    x1, y1, a1 = s1.get_data()
+    s1._blocks = None
+    x2, y2, a2 = s1.get_data()
+    assert np.allclose(a1, a2)
+
+
+def test_asynchronous_update():
+    # verify that the parameters received while an evaluation is in progress
+    # supersede the older ones, and that only the latest ones are rendered
+
+    from threading import Event
+
+    u, x = symbols("u, x")
+    t = iplot((cos(u * x), (x, -5, 5)), params={u: (1, 0, 5)},
+        backend=PB, n=20, asynchronous=True, show=False)
+    t._init_pane()
+
+    backend = t.backend
+    release = Event()
+    evaluated, rendered = [], []
+    original_update_params = backend._update_series_params
+    original_update_interactive = backend._update_interactive
+
+    def update_params(params):
+        evaluated.append(params[u])
+        if len(evaluated) == 1:
+            # the first evaluation is "slow"
+            release.wait(5)
+        original_update_params(params)
+
+    def update_interactive(params):
+        rendered.append(params[u])
+        original_update_interactive(params)
+
+    backend._update_series_params = update_params
+    backend._update_interactive = update_interactive
+
+    t._update({u: 2})
+    t._update({u: 3})
+    t._update({u: 4})
+    release.set()
+    t._pending_update.result(timeout=5)
+
+    # the second update was cancelled while waiting in the queue, the first
+    # one was discarded after its evaluation
+    assert evaluated == [2, 4, 4]
+    assert rendered == [4]
+    xx, yy = backend.series[0].get_data()
+    assert np.allclose(yy, np.cos(4 * xx))
+    assert np.allclose(backend.fig.data[0]["y"], np.cos(4 * xx))
+
+    # the slider triggers the asynchronous update
+    t.dyn_param_0 = 2
+    t._pending_update.result(timeout=5)
+    assert rendered == [4, 2]
+
+    # the worker thread is released when the plot is discarded
+    import gc
+    executor = t._executor
+    del t, backend
+    gc.collect()
+    raises(RuntimeError, lambda: executor.submit(print))
+
+
+def test_progressive_update():
+    # verify that a preview is computed over decimated domains, and that
+    # the full resolution is restored afterwards
+
+    u, x, y = symbols("u, x, y")
+    f = lambda uu, xx, yy: np.cos(uu * xx**2 + yy)
+
+    s = InteractiveSeries([cos(u * x**2 + y)], [(x, -2, 2), (y, -3, 3)],
+        params={u: 1}, n1=21, n2=11, threed=True)
+    xx, yy, zz = s.get_data()
+    assert zz.shape == (11, 21)
+    s._set_preview(4)
+    xp, yp, zp = s.get_data()
+    assert zp.shape == (4, 6)
+    assert np.allclose([xp.min(), xp.max(), yp.min(), yp.max()],
+        [-2, 2, -3, 3])
+    assert np.allclose(zp, f(1, xp, yp))
+    s.params = {u: 2}
+    xp, yp, zp = s.get_data()
+    assert np.allclose(zp, f(2, xp, yp))
+    s._set_preview(1)
+    xx, yy, zz = s.get_data()
+    assert zz.shape == (11, 21)
+    assert np.allclose(zz, f(2, xx, yy))
+
+    # lines are always evaluated at full resolution
+    s = InteractiveSeries([cos(u * x)], [(x, -2, 2)], params={u: 1}, n1=21)
+    s._set_preview(4)
+    assert len(s.get_data()[0]) == 21
+
+    t = iplot((cos(u * x**2 + y), (x, -2, 2), (y, -3, 3)),
+        params={u: (1, 0, 5)}, backend=PB, n1=21, n2=11, threed=True,
+        progressive=True, show=False)
+    t._init_pane()
+    shapes = []
+    original_update = t.backend._update_series_params
+
+    def update_params(params):
+        original_update(params)
+        shapes.append((params[u], t.backend.series[0].get_data()[2].shape))
+
+    t.backend._update_series_params = update_params
+    # without a running event loop, the full resolution update is executed
+    # right after the preview
+    t.dyn_param_0 = 2
+    assert shapes == [(2, (4, 6)), (2, (11, 21))]
+    assert np.asarray(t.fig.data[0]["z"]).shape == (11, 21)
+
+
+def test_parameters_cache():
+    # verify that returning to visited parameters doesn't evaluate the
+    # series again, and that the cache is bounded by its memory budget
+
+    from spb.cache import DataCache
+
+    u, x, y = symbols("u, x, y")
+    t = iplot((cos(u * x**2 + y), (x, -2, 2), (y, -3, 3)),
+        params={u: (1, 0, 5)}, backend=PB, n1=20, n2=10, threed=True,
+        show=False)
+    t._init_pane()
+    s = t.backend.series[0]
+    evaluate = s._evaluate
+    calls = []
+
+    def counter():
+        calls.append(s.params[u])
+        return evaluate()
+
+    s._evaluate = counter
+    for v in [2, 3, 2, 3, 4]:
+        t._update({u: v})
+        xx, yy, zz = s.get_data()
+        assert np.allclose(zz, np.cos(v * xx**2 + yy))
+        assert np.allclose(t.fig.data[0]["z"], zz)
+    assert calls == [2, 3, 4]
+    assert t._data_cache.info().hits == 2
+
+    # disabled cache
+    t = iplot((cos(u * x), (x, -2, 2)), params={u: (1, 0, 5)}, backend=PB,
+        n=10, cache_memory=0, show=False)
+    t._init_pane()
+    t._update({u: 2})
+    assert t._data_cache.info().currsize == 0
+
+    c = DataCache(300)
+    c.put("a", np.zeros(10))
+    c.put("b", np.zeros(20))
+    assert c.get("a") is not None
+    c.put("c", np.zeros(20))
+    # "b" was the least recently used
+    assert (c.get("b") is None) and (c.get("a") is not None)
+    assert c.info().currsize == 240
+    c.put("d", np.zeros(100))
+    assert c.get("d") is None
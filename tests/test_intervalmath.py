@@ -0,0 +1,83 @@
+from spb.intervalmath import (
+    IntervalArray, MembershipArray, FALSE, NONE, TRUE,
+    sin, cos, sqrt, log, imax, namespace
+)
+from sympy.external import import_module
+from sympy.plotting.intervalmath import interval
+import sympy.plotting.intervalmath.lib_interval as li
+
+np = import_module('numpy', catch=(RuntimeError,))
+
+
+def _membership(res):
+    # convert the results of SymPy's interval arithmetic to the encoding
+    # used by the array-backed one
+    d = {False: FALSE, None: NONE, True: TRUE}
+    return d[res[0]], d[res[1]]
+
+
+def test_interval_array_arithmetic():
+    # verify that the operations produce the same bounds computed by SymPy's
+    # interval arithmetic, element-wise
+
+    bounds = [(-3, -1), (-2, 1), (-1e-03, 2), (0.5, 4), (1, 1)]
+    a = IntervalArray([b[0] for b in bounds], [b[1] for b in bounds])
+    intervals = [interval(*b) for b in bounds]
+
+    def check(func_arr, func_sym, second=None):
+        res = func_arr(a)
+        for i, t in enumerate(intervals):
+            r = func_sym(t)
+            if r.is_valid:
+                assert res.valid[i] == TRUE
+                assert np.isclose(res.start[i], r.start)
+                assert np.isclose(res.end[i], r.end)
+            else:
+                assert res.valid[i] != TRUE
+
+    check(lambda t: t + 2, lambda t: t + 2)
+    check(lambda t: 1 - t, lambda t: 1 - t)
+    check(lambda t: t * t, lambda t: t * t)
+    check(lambda t: -2 * t, lambda t: -2 * t)
+    check(lambda t: 1 / t, lambda t: 1 / t)
+    check(lambda t: t**2, lambda t: t**2)
+    check(lambda t: t**3, lambda t: t**3)
+    check(lambda t: t**0.5, lambda t: t**0.5)
+    check(lambda t: abs(t), li.Abs)
+    check(sin, li.sin)
+    check(cos, li.cos)
+    check(sqrt, li.sqrt)
+    check(log, li.log)
+    check(lambda t: imax(t, 0), lambda t: li.imax(t, 0))
+
+    # comparisons
+    b = IntervalArray(np.full(len(bounds), 0.75), 1)
+    for op in ["__lt__", "__gt__", "__le__", "__ge__", "__eq__"]:
+        res = getattr(a, op)(b)
+        assert isinstance(res, MembershipArray)
+        for i, t in enumerate(intervals):
+            expected = _membership(getattr(t, op)(interval(0.75, 1)))
+            assert (res.truth[i], res.valid[i]) == expected
+
+
+def test_membership_array():
+    # verify the three-valued logic
+
+    v = [FALSE, NONE, TRUE]
+    t1 = MembershipArray(np.repeat(v, 3), TRUE)
+    t2 = MembershipArray(np.tile(v, 3), TRUE)
+    assert np.all((t1 & t2).truth == np.minimum(t1.truth, t2.truth))
+    assert np.all((t1 | t2).truth == np.maximum(t1.truth, t2.truth))
+    assert np.all((~t1).truth == np.repeat([TRUE, NONE, FALSE], 3))
+    assert np.all((t1 ^ t2).truth ==
+        [FALSE, NONE, TRUE, NONE, NONE, NONE, TRUE, NONE, FALSE])
+    assert t1[0] is t1.truth and t1[1] is t1.valid
+
+
+def test_namespace():
+    # verify that the names emitted by the printer are available
+
+    d = namespace()
+    for k in ["sin", "cos", "tan", "exp", "log", "sqrt", "abs", "min",
+        "max", "floor", "ceiling", "And", "Or", "pi"]:
+        assert k in d
@@ -1,4 +1,4 @@
-from pytest import raises
+from pytest import raises, warns
 from spb.series import (
     LineOver1DRangeSeries, Parametric2DLineSeries, Parametric3DLineSeries,
     SurfaceOver2DRangeSeries, ContourSeries, ParametricSurfaceSeries,
@@ -21,7 +21,7 @@ from spb.series import (
 )
 from sympy import (
     latex, exp, symbols, Tuple, I, pi, sin, cos, tan, log, sqrt,
-    re, im, arg, frac, Plane, Circle, Point, Sum, S
+    re, im, arg, frac, Plane, Circle, Point, Sum, S, lambdify, Eq
 )
 from sympy.external import import_module
 from sympy.vector import CoordSys3D, gradient
@@ -47,7 +47,8 @@ np = import_module('numpy', catch=(RuntimeError,))
 def test_adaptive():
     # verify that adaptive-related keywords produces the expected results
 
-    from adaptive.learner.learner1D import curvature_loss_function
+    from adaptive.learner.learner1D import (
+        curvature_loss_function, default_loss)
     x, y = symbols("x, y")
 
     # use default adaptive options: adaptive_goal=0.01, loss_fn=None
@@ -65,11 +66,14 @@ def test_adaptive():
     s4 = LineOver1DRangeSeries(sin(x), (x, -10, 10), "", adaptive=True,
         adaptive_goal=0.01, loss_fn=curvature_loss_function())
     x4, _ = s4.get_data()
+    s5 = LineOver1DRangeSeries(sin(x), (x, -10, 10), "", adaptive=True,
+        adaptive_goal=0.01, loss_fn=default_loss)
+    x5, _ = s5.get_data()
     assert len(x1) < len(x2)
     assert len(x3) >= 100
     # using the same adaptive_goal value, curvature_loss_function produces
     # less points than default_loss
-    assert len(x1) > len(x4)
+    assert len(x5) > len(x4)
 
     s1 = Parametric2DLineSeries(cos(x), sin(x), (x, 0, 2*pi),
         adaptive=True)
@@ -80,8 +84,11 @@ def test_adaptive():
     s3 = Parametric2DLineSeries(cos(x), sin(x), (x, 0, 2*pi),
         adaptive=True, adaptive_goal=0.01, loss_fn=curvature_loss_function())
     x3, _, _ = s3.get_data()
+    s4 = Parametric2DLineSeries(cos(x), sin(x), (x, 0, 2*pi),
+        adaptive=True, adaptive_goal=0.01, loss_fn=default_loss)
+    x4, _, _ = s4.get_data()
     assert len(x1) < len(x2)
-    assert len(x1) > len(x3)
+    assert len(x4) > len(x3)
 
     s1 = Parametric3DLineSeries(cos(x), sin(x), x, (x, 0, 2*pi),
         adaptive=True)
@@ -92,8 +99,11 @@ def test_adaptive():
     s3 = Parametric3DLineSeries(cos(x), sin(x), x, (x, 0, 2*pi),
         adaptive=True, adaptive_goal=0.01, loss_fn=curvature_loss_function())
     x3, _, _, _ = s3.get_data()
+    s4 = Parametric3DLineSeries(cos(x), sin(x), x, (x, 0, 2*pi),
+        adaptive=True, adaptive_goal=0.01, loss_fn=default_loss)
+    x4, _, _, _ = s4.get_data()
     assert len(x1) < len(x2)
-    assert len(x1) > len(x3)
+    assert len(x4) > len(x3)
 
     # the more refined the goal, the greater the number of points
     s1 = SurfaceOver2DRangeSeries(cos(x**2 + y**2), (x, -3, 3), (y, -3, 3),
@@ -2723,3 +2733,402 @@ def test_plane_series():
     xx, yy, zz = s.get_data()
     assert all(not np.allclose(t, 0) for t in [xx, yy, zz])
     assert all(np.allclose(zz[i, :], zz[i, 0]) for i in range(zz.shape[0]))
+
+
+def test_uniform_eval_vectorized():
+    # verify that the vectorized evaluation produces the same results of
+    # the element-wise evaluation
+
+    from spb.series import _uniform_eval
+    x, y = symbols("x, y")
+
+    xx = np.linspace(-5, 5, 11)
+    yy = np.linspace(-2, 2, 7)
+    mx, my = np.meshgrid(xx, yy)
+
+    def elementwise(expr, *args, modules=None):
+        f = lambdify([x, y][:len(args)], expr, modules=modules)
+        return np.vectorize(lambda *a: complex(f(*a)), otypes=[complex])(*args)
+
+    for expr in [sin(x) * cos(y), sqrt(x * y), log(x**2 + y), exp(x + I * y)]:
+        with np.errstate(all="ignore"):
+            d1 = elementwise(expr, mx, my)
+        d2 = _uniform_eval([x, y], expr, mx, my)
+        assert d2.dtype == complex
+        assert d2.shape == mx.shape
+        assert np.allclose(d1, d2, equal_nan=True)
+
+    # constant expressions are broadcasted to the shape of the domain and
+    # the result is writeable
+    d = _uniform_eval([x, y], S(2), mx, my)
+    assert d.shape == mx.shape
+    assert np.allclose(d, 2)
+    d[0, 0] = 0
+
+    # modules not supporting arrays fall back to element-wise evaluation
+    d1 = elementwise(sqrt(-x), xx, modules="mpmath")
+    d2 = _uniform_eval([x], sqrt(-x), xx, modules="mpmath")
+    assert np.allclose(d1, d2)
+
+    # Python's integers raising ZeroDivisionError are converted to NaN
+    ii = np.arange(-3, 4).astype(object)
+    d = _uniform_eval([x], 1 / x, ii)
+    assert np.isnan(d[3])
+    assert np.allclose(np.delete(d, 3), [1 / t for t in [-3, -2, -1, 1, 2, 3]])
+
+
+def test_cached_data():
+    # verify that the numerical data is stored until an attribute affecting
+    # the evaluation is set
+
+    x, y, u = symbols("x, y, u")
+    calls = []
+
+    def f(t):
+        calls.append(1)
+        return np.cos(t)
+
+    s = LineOver1DRangeSeries(f, ("t", -5, 5), adaptive=False, n=10)
+    x1, y1 = s.get_data()
+    x2, y2 = s.get_data()
+    assert len(calls) == 1
+    assert np.allclose(x1, x2) and np.allclose(y1, y2)
+
+    # returned arrays are read-only views of the stored data: they can't
+    # alter the cache, and no copies are made
+    assert not y2.flags.writeable
+    assert np.shares_memory(y1, y2)
+    raises(ValueError, lambda: y2.__setitem__(slice(None), 0))
+    _, y3 = s.get_data()
+    assert np.allclose(y1, y3)
+
+    # attributes not affecting the evaluation don't invalidate the cache
+    s.rendering_kw = {"color": "red"}
+    s.get_data()
+    assert len(calls) == 1
+
+    # setting an attribute affecting the evaluation invalidates the cache
+    s.n = 20
+    x4, _ = s.get_data()
+    assert len(calls) == 2
+    assert len(x4) == 20
+    s.end = 10
+    x5, _ = s.get_data()
+    assert len(calls) == 3
+    assert np.isclose(x5[-1], 10)
+
+    # explicit invalidation
+    s.clear_cache()
+    s.get_data()
+    assert len(calls) == 4
+
+    # interactive series: setting new parameters invalidates the cache
+    s = InteractiveSeries([u * cos(x)], [(x, -5, 5)], params={u: 1}, n1=10)
+    _, y1 = s.get_data()
+    s.params = {u: 2}
+    _, y2 = s.get_data()
+    assert np.allclose(2 * y1, y2)
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        n1=5, n2=5)
+    assert s.get_data()[0].shape == (5, 5)
+    s.n1 = 10
+    assert s.get_data()[0].shape == (5, 10)
+
+
+def test_pickle_series():
+    # verify that data series can be pickled, which is required to evaluate
+    # them with a process pool
+    import pickle
+    x, y, u = symbols("x, y, u")
+
+    s = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        n1=5, n2=5)
+    d1 = s.get_data()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert s2._get_cached_data() is None
+    assert all(np.allclose(a, b) for a, b in zip(s2.get_data(), d1))
+
+    s = InteractiveSeries([cos(u * x)], [(x, -5, 5)], "", params={u: 2},
+        n1=10)
+    d1 = s.get_data()
+    s2 = pickle.loads(pickle.dumps(s))
+    assert all(np.allclose(a, b) for a, b in zip(s2.get_data(), d1))
+    s2.params = {u: 3}
+    assert not np.allclose(s2.get_data()[1], d1[1])
+
+
+def test_chunked_evaluation():
+    # verify that the evaluation block by block produces the same results
+    # of the evaluation over the whole domain
+    x, y, z = symbols("x:z")
+
+    e = sqrt(x) * cos(x**2 + y**2)
+    s1 = SurfaceOver2DRangeSeries(e, (x, -2, 2), (y, -3, 3), n1=15, n2=20)
+    s2 = SurfaceOver2DRangeSeries(e, (x, -2, 2), (y, -3, 3), n1=15, n2=20,
+        chunk_size=7)
+    s3 = SurfaceOver2DRangeSeries(e, (x, -2, 2), (y, -3, 3), n1=15, n2=20,
+        max_memory=128 * 40)
+    d1 = s1.get_data()
+    assert d1[0].shape == (20, 15)
+    for s in [s2, s3]:
+        assert all(np.allclose(a, b, equal_nan=True)
+            for a, b in zip(d1, s.get_data()))
+
+    f = lambda x, y: np.cos(x) * y
+    s1 = SurfaceOver2DRangeSeries(f, (x, -2, 2), (y, -3, 3), n1=15, n2=20)
+    s2 = SurfaceOver2DRangeSeries(f, (x, -2, 2), (y, -3, 3), n1=15, n2=20,
+        chunk_size=50)
+    assert all(np.allclose(a, b) for a, b in zip(s1.get_data(), s2.get_data()))
+
+    e = x**2 + y**2 - z**2 - 1
+    s1 = Implicit3DSeries(e, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=8, n2=9, n3=10)
+    s2 = Implicit3DSeries(e, (x, -2, 2), (y, -2, 2), (z, -2, 2),
+        n1=8, n2=9, n3=10, chunk_size=25)
+    d1, d2 = s1.get_data(), s2.get_data()
+    assert d1[3].shape == (8, 9, 10)
+    assert all(np.allclose(a, b) for a, b in zip(d1, d2))
+
+    s1 = ComplexSurfaceSeries(sqrt(x), (x, -2-2j, 2+2j), n1=10, n2=12)
+    s2 = ComplexSurfaceSeries(sqrt(x), (x, -2-2j, 2+2j), n1=10, n2=12,
+        chunk_size=13)
+    assert all(np.allclose(a, b) for a, b in zip(s1.get_data(), s2.get_data()))
+
+
+def test_chunked_evaluation_peak_memory():
+    # verify that the evaluation block by block doesn't allocate (much)
+    # more memory than the output: the coordinates are broadcast views and
+    # get_data doesn't copy the stored data
+    import tracemalloc
+    x, y, z = symbols("x:z")
+
+    s1 = Implicit3DSeries(x**2 + y**2 - z**2 - 1, (x, -2, 2), (y, -2, 2),
+        (z, -2, 2), n1=50, n2=50, n3=50, chunk_size=10000)
+    s2 = SurfaceOver2DRangeSeries(cos(x * y), (x, -2, 2), (y, -2, 2),
+        n1=300, n2=300, chunk_size=10000)
+    for s in [s1, s2]:
+        # lambdify the expression before measuring the memory
+        s.get_data()
+        s.clear_cache()
+        tracemalloc.start()
+        try:
+            data = s.get_data()
+            s.get_data()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 2 * data[-1].nbytes
+        assert all(0 in d.strides for d in data[:-1])
+
+
+def test_sparse_discretization():
+    # verify that the discretized ranges are stored as sparse meshes, and
+    # that get_data returns them as read-only broadcast views
+    x, y, z, u = symbols("x, y, z, u")
+
+    s = InteractiveSeries([u * cos(x)], [(x, -2, 2), (y, -3, 3)],
+        params={u: 1}, n1=10, n2=15, threed=True)
+    assert s.ranges[x].shape == (1, 10)
+    assert s.ranges[y].shape == (15, 1)
+    xx, yy, zz = s.get_data()
+    assert xx.shape == yy.shape == zz.shape == (15, 10)
+    assert np.allclose(zz, np.cos(xx))
+    # no dense coordinates are allocated
+    assert (xx.strides[0] == 0) and (yy.strides[1] == 0)
+    assert np.shares_memory(xx, s.ranges[x])
+    raises(ValueError, lambda: xx.__setitem__(slice(None), 0))
+
+    s = InteractiveSeries([y, -x * u, z], [(x, -2, 2), (y, -3, 3),
+        (z, -4, 4)], params={u: 2}, n1=4, n2=5, n3=6)
+    assert s.ranges[z].shape == (1, 1, 6)
+    data = s.get_data()
+    assert all(d.shape == (4, 5, 6) for d in data)
+    assert np.allclose(data[4], -2 * data[0])
+
+    s = Vector3DSeries(y, -x, 1, (x, -2, 2), (y, -3, 3), (z, -4, 4),
+        n1=4, n2=5, n3=6)
+    data = s.get_data()
+    assert all(d.shape == (4, 5, 6) for d in data)
+    assert np.allclose(data[5], 1)
+
+
+def test_detect_poles_refinement():
+    # verify that the vectorized pole detection produces the same results
+    # of a segment-by-segment detection, and that the refinement locates the
+    # poles more accurately.
+    x, u = symbols("x, u")
+
+    xx = np.sort(np.random.uniform(-5, 5, 200))
+    yy = np.tan(xx)
+    expected = yy.copy()
+    for i in range(len(xx) - 1):
+        angle = np.arctan(abs(yy[i + 1] - yy[i]) / (xx[i + 1] - xx[i]))
+        if angle >= np.pi / 2 - 0.01:
+            expected[i + 1] = np.nan
+    _, yy2 = LineOver1DRangeSeries._detect_poles(xx, yy, 0.01)
+    assert np.allclose(yy2, expected, equal_nan=True)
+
+    def pole_error(xx, yy):
+        return np.amin(np.abs(xx[np.isnan(yy)] - np.pi / 2))
+
+    s1 = LineOver1DRangeSeries(tan(x), (x, -pi, pi), adaptive=False, n=50,
+        detect_poles=True)
+    s2 = LineOver1DRangeSeries(tan(x), (x, -pi, pi), adaptive=False, n=50,
+        detect_poles=True, poles_refinement=2)
+    xx1, yy1 = s1.get_data()
+    xx2, yy2 = s2.get_data()
+    assert len(xx1) == 50
+    assert len(xx2) > len(xx1)
+    assert np.all(np.diff(xx2) > 0)
+    assert pole_error(xx2, yy2) < pole_error(xx1, yy1) / 10
+
+    s1 = LineInteractiveSeries([tan(u * x)], [(x, -pi, pi)], n=50,
+        params={u: 1}, detect_poles=True)
+    s2 = LineInteractiveSeries([tan(u * x)], [(x, -pi, pi)], n=50,
+        params={u: 1}, detect_poles=True, poles_refinement=2)
+    xx1, yy1 = s1.get_data()
+    xx2, yy2 = s2.get_data()
+    assert len(xx2) > len(xx1)
+    assert pole_error(xx2, yy2) < pole_error(xx1, yy1) / 10
+
+    s = AbsArgLineSeries(1 / (x - 0.5), (x, -2, 2), n=50,
+        detect_poles=True, poles_refinement=1)
+    xx, _abs, _arg = s.get_data()
+    assert len(xx) == len(_abs) == len(_arg) > 50
+    assert np.all(np.diff(xx) > 0)
+
+
+def test_adaptive_native():
+    # verify the built-in adaptive algorithm, used when no learner-specific
+    # options (loss_fn or a callable adaptive_goal) are provided
+    import math
+    x = symbols("x")
+
+    s1 = LineOver1DRangeSeries(exp(-x**2) * cos(8 * x), (x, -3, 3),
+        adaptive=True)
+    s2 = LineOver1DRangeSeries(exp(-x**2) * cos(8 * x), (x, -3, 3),
+        adaptive=True, tolerance=0.001)
+    s3 = LineOver1DRangeSeries(exp(-x**2) * cos(8 * x), (x, -3, 3),
+        adaptive=True, tolerance=0.001, max_points=150)
+    x1, y1 = s1.get_data()
+    x2, y2 = s2.get_data()
+    x3, y3 = s3.get_data()
+    assert len(x1) < len(x2)
+    assert len(x3) == 150
+    for xx, yy in [(x1, y1), (x2, y2), (x3, y3)]:
+        assert np.all(np.diff(xx) > 0)
+        assert np.allclose(yy, np.exp(-xx**2) * np.cos(8 * xx))
+    xx = np.linspace(-3, 3, 10000)
+    err = np.amax(np.abs(np.interp(xx, x2, y2) -
+        np.exp(-xx**2) * np.cos(8 * xx)))
+    assert err < 0.01
+
+    # the boundary of the domain is refined
+    x1, y1 = LineOver1DRangeSeries(sqrt(x), (x, -2, 2),
+        adaptive=True).get_data()
+    assert np.amin(x1[np.isfinite(y1)]) < 1e-03
+
+    # functions not supporting arrays are evaluated element-wise
+    s = LineOver1DRangeSeries(lambda t: math.cos(t), ("t", -5, 5),
+        adaptive=True)
+    x1, y1 = s.get_data()
+    assert np.allclose(y1, np.cos(x1))
+
+    s = LineOver1DRangeSeries(cos(x), (x, -5, 5), adaptive=True,
+        color_func=lambda x, y: x * y)
+    x1, y1, c1 = s.get_data()
+    assert np.allclose(c1, x1 * y1)
+
+    s = Parametric2DLineSeries(cos(x), sin(x), (x, 0, 2*pi),
+        adaptive=True, tolerance=0.001)
+    x1, y1, p1 = s.get_data()
+    assert np.allclose(x1, np.cos(p1)) and np.allclose(y1, np.sin(p1))
+    s = Parametric3DLineSeries(cos(x), sin(x), x, (x, 0, 2*pi),
+        adaptive=True)
+    x1, y1, z1, p1 = s.get_data()
+    assert np.allclose(z1, p1)
+
+
+def test_adaptive_surface_native():
+    # verify the built-in quadtree adaptive algorithm for surfaces
+    x, y = symbols("x, y")
+    expr = cos(x**2 + y**2)
+    f = lambda x, y: np.cos(x**2 + y**2)
+
+    s = SurfaceOver2DRangeSeries(expr, (x, -3, 3), (y, -3, 3),
+        adaptive=True)
+    assert not s.is_mesh
+    xx, yy, zz = s.get_data()
+    assert xx.shape == yy.shape == zz.shape
+    assert np.allclose(zz, f(xx, yy), atol=0.1)
+
+    s1 = SurfaceOver2DRangeSeries(expr, (x, -3, 3), (y, -3, 3),
+        adaptive=True, adaptive_mesh=True)
+    s2 = SurfaceOver2DRangeSeries(expr, (x, -3, 3), (y, -3, 3),
+        adaptive=True, adaptive_mesh=True, tolerance=0.001, max_points=2000)
+    assert s1.is_mesh and s2.is_mesh
+    x1, y1, z1, t1 = s1.get_data()
+    x2, y2, z2, t2 = s2.get_data()
+    assert len(x2) <= 2000
+    for xx, yy, zz, tri in [(x1, y1, z1, t1), (x2, y2, z2, t2)]:
+        assert xx.ndim == 1 and tri.shape[1] == 3
+        assert np.allclose(zz, f(xx, yy))
+        # counterclockwise triangles covering the whole domain
+        area = ((xx[tri[:, 1]] - xx[tri[:, 0]]) * (yy[tri[:, 2]] - yy[tri[:, 0]]) -
+            (xx[tri[:, 2]] - xx[tri[:, 0]]) * (yy[tri[:, 1]] - yy[tri[:, 0]]))
+        assert np.all(area > 0)
+        assert np.isclose(area.sum() / 2, 36)
+
+    # the triangles touching points outside of the domain of the function
+    # are removed
+    s = SurfaceOver2DRangeSeries(sqrt(x * y), (x, -3, 3), (y, -3, 3),
+        adaptive=True, adaptive_mesh=True)
+    xx, yy, zz, tri = s.get_data()
+    assert np.all(np.isfinite(zz[tri]))
+    # together with the vertices no longer referenced by the triangles
+    assert np.all(np.isfinite(zz))
+    assert np.array_equal(np.unique(tri), np.arange(len(xx)))
+
+    # contours and learner-specific options don't produce meshes
+    s = ContourSeries(expr, (x, -3, 3), (y, -3, 3), adaptive=True,
+        adaptive_mesh=True)
+    assert not s.is_mesh
+    s = SurfaceOver2DRangeSeries(expr, (x, -3, 3), (y, -3, 3),
+        adaptive=True, adaptive_mesh=True, adaptive_goal=lambda l: True)
+    assert not s.is_mesh
+
+
+def test_implicit_adaptive_rectangles():
+    # verify that ImplicitSeries with adaptive=True returns an array of
+    # rectangles, evaluated with array-backed interval arithmetic
+
+    x, y = symbols("x, y")
+    s = ImplicitSeries((x - 1)**2 + y**2 < 2, (x, -5, 5), (y, -5, 5),
+        adaptive=True)
+    rects, plot_type = s.get_data()
+    assert plot_type == "fill"
+    assert isinstance(rects, np.ndarray) and rects.shape[1] == 4
+    assert np.all(rects[:, 0] < rects[:, 1])
+    assert np.all(rects[:, 2] < rects[:, 3])
+    # all the rectangles satisfy the inequality
+    xc = np.where(np.abs(rects[:, 0] - 1) > np.abs(rects[:, 1] - 1),
+        rects[:, 0], rects[:, 1])
+    yc = np.fmax(np.abs(rects[:, 2]), np.abs(rects[:, 3]))
+    assert np.all((xc - 1)**2 + yc**2 < 2)
+    area = np.sum((rects[:, 1] - rects[:, 0]) * (rects[:, 3] - rects[:, 2]))
+    assert 2 * np.pi - 0.2 < area < 2 * np.pi
+
+    # equalities produce a thin set of rectangles around the curve
+    s = ImplicitSeries(Eq(y, cos(x)), (x, -5, 5), (y, -5, 5), adaptive=True)
+    rects, _ = s.get_data()
+    xm = (rects[:, 0] + rects[:, 1]) / 2
+    ym = (rects[:, 2] + rects[:, 3]) / 2
+    assert np.all(np.abs(ym - np.cos(xm)) < 0.05)
+
+    # unsupported functions fall back to the uniform meshing
+    s = ImplicitSeries(Eq(y, re(cos(x) + I * sin(x))), (x, -5, 5),
+        (y, -5, 5), adaptive=True)
+    with warns(UserWarning, match="Adaptive meshing could not be applied"):
+        data = s.get_data()
+    assert data[-1] == "contour"
@@ -9,9 +9,13 @@ from spb.series import (
     GeometryInteractiveSeries
 )
 from spb.utils import (
-    _check_arguments, _create_ranges, _plot_sympify, _validate_kwargs
+    _check_arguments, _create_ranges, _plot_sympify, _validate_kwargs,
+    get_vertices_indices
 )
 from sympy import symbols, Expr, Tuple, Integer, sin, cos, Matrix, I, Polygon
+from sympy.external import import_module
+
+np = import_module('numpy', catch=(RuntimeError,))
 
 
 def test_plot_sympify():
@@ -529,3 +533,21 @@ def test_raise_warning_keyword_validation():
     p = MB(s, show=False, **kw)
     do_test(p, kw, ["is_fille", "is_filled"])
     
+
+
+def test_get_vertices_indices():
+    # verify the vertices and the connectivity of a structured grid, and
+    # that the connectivity is shared between grids with the same shape
+
+    x, y = np.meshgrid(np.arange(3.0), np.arange(2.0))
+    z = x + y
+    vertices, indices = get_vertices_indices(x, y, z)
+    assert np.allclose(vertices, np.stack([
+        x.flatten(), y.flatten(), z.flatten()]).T)
+    assert indices.dtype == np.uint32
+    assert np.all(indices == [
+        [4, 1, 3], [0, 3, 1], [5, 2, 4], [1, 4, 2]])
+
+    _, indices2 = get_vertices_indices(2 * x, y, z)
+    assert indices2 is indices
+    assert not indices.flags.writeable
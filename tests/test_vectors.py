@@ -1,5 +1,5 @@
 from pytest import raises
-from spb.backends.utils import get_seeds_points
+from spb.backends.utils import get_seeds_points, compute_streamtubes
 from spb.series import (
     Vector2DSeries,
     Vector3DSeries,
@@ -393,3 +393,64 @@ def test_get_seeds_points():
     d = get_seeds_points(xx, yy, zz, uu, vv, ww, False,
         **dict(starts=True, npoints=10))
     assert isinstance(d, vtk.vtkPointSource)
+
+
+def test_compute_streamtubes():
+    # verify that spb.backends.utils.compute_streamtubes integrates the
+    # streamlines and returns them as NaN-separated arrays
+
+    x, y, z = symbols("x:z")
+    s = Vector3DSeries(-y, x, 0, (x, -5, 5), (y, -4, 4), (z, -2, 2),
+        n1=11, n2=9, n3=5)
+    xx, yy, zz, uu, vv, ww = s.get_data()
+
+    # a streamline of a rotation around the z-axis is a circle
+    vertices, magn = compute_streamtubes(xx, yy, zz, uu, vv, ww,
+        dict(starts=dict(x=[3], y=[0], z=[1])))
+    assert vertices.shape == (len(magn), 3)
+    assert not np.isnan(vertices).any()
+    assert np.allclose(vertices[:, 2], 1)
+    r = np.sqrt(vertices[:, 0]**2 + vertices[:, 1]**2)
+    assert np.allclose(r, 3, atol=0.05)
+    assert np.allclose(magn, r)
+
+    # seeds on the boundary: at most one streamline for each seed, as the
+    # ones immediately leaving the domain are discarded
+    vertices, magn = compute_streamtubes(xx, yy, zz, uu, vv, ww, dict())
+    seeds = get_seeds_points(xx, yy, zz, uu, vv, ww, True)
+    assert 0 < np.isnan(vertices[:, 0]).sum() < len(seeds)
+    assert np.array_equal(np.isnan(vertices[:, 0]), np.isnan(magn))
+    assert np.all(np.nanmin(vertices, axis=0) >= [-5, -4, -2])
+    assert np.all(np.nanmax(vertices, axis=0) <= [5, 4, 2])
+
+
+def test_get_seeds_points_strategies():
+    # verify the seeding strategies of spb.backends.utils.get_seeds_points
+
+    x, y, z = symbols("x:z")
+    s = Vector3DSeries(1, 1, 1, (x, -5, 5), (y, -3, 3), (z, -2, 2),
+        n1=4, n2=3, n3=5)
+    xx, yy, zz, uu, vv, ww = s.get_data()
+
+    # the vectors enter the domain from the three min-faces: points along
+    # the shared edges are returned once
+    d = get_seeds_points(xx, yy, zz, uu, vv, ww)
+    assert len(d) == 4 * 3 * 5 - 3 * 2 * 4
+    assert len(np.unique(d, axis=0)) == len(d)
+    assert np.all(np.any(d == [-5, -3, -2], axis=1))
+
+    for starts in [True, "random", "poisson"]:
+        kw = dict(starts=starts, npoints=20, seed=1)
+        d1 = get_seeds_points(xx, yy, zz, uu, vv, ww, **kw)
+        d2 = get_seeds_points(xx, yy, zz, uu, vv, ww, **kw)
+        assert d1.shape == (20, 3)
+        assert np.array_equal(d1, d2)
+        assert np.all(d1 >= [-5, -3, -2]) and np.all(d1 <= [5, 3, 2])
+
+    # random points inside a sphere
+    d = get_seeds_points(xx, yy, zz, uu, vv, ww, starts="random",
+        radius=1, npoints=50, seed=2)
+    assert np.all(np.sqrt(np.sum(d**2, axis=1)) <= 1)
+
+    raises(ValueError, lambda: get_seeds_points(xx, yy, zz, uu, vv, ww,
+        starts="test"))